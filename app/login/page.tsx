@@ -38,7 +38,14 @@ export default function LoginPage() {
       case 'missing_ticket':
         return t('errors.missingTicket');
       case 'account_suspended':
-        return t('errors.accountSuspended');
+        return t.rich('errors.accountSuspended', {
+          red: chunks => (
+            <span className="font-semibold text-red-600 dark:text-red-300">
+              {chunks}
+            </span>
+          ),
+          br: () => <br />,
+        });
       case 'account_pending':
         return t('errors.accountPending');
       case 'invalid_account':
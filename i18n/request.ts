@@ -34,6 +34,28 @@ function deepMerge(
   return result;
 }
 
+// Load the pre-merged bundle written by `pnpm i18n:build-bundles` (fallback already applied).
+// Only used in production builds so that edits to messages/*.json show up immediately in dev;
+// `pnpm build` regenerates the bundles first (or removes them when python3 is missing).
+async function loadPrebuiltMessages(
+  locale: string
+): Promise<Record<string, unknown> | null> {
+  if (process.env.NODE_ENV !== 'production') {
+    return null;
+  }
+
+  try {
+    return (
+      await import(
+        /* webpackInclude: /\/\.build\/[a-z]{2,3}(-[A-Za-z0-9]{2,8})*\.json$/ */
+        `../messages/.build/${locale}.json`
+      )
+    ).default;
+  } catch {
+    return null;
+  }
+}
+
 export default getRequestConfig(async () => {
   // Dynamic language configuration: prioritize Cookie, otherwise use default language
   const cookieStore = await cookies();
@@ -41,25 +63,48 @@ export default getRequestConfig(async () => {
 
   const finalLocale = isValidLocale(locale) ? locale : DEFAULT_LOCALE;
 
+  const prebuiltMessages = await loadPrebuiltMessages(finalLocale);
+  if (prebuiltMessages) {
+    return {
+      locale: finalLocale,
+      messages: prebuiltMessages,
+      now: new Date(),
+    };
+  }
+
   // Load messages with fallback support
   let messages;
   let fallbackMessages;
 
   try {
-    messages = (await import(`../messages/${finalLocale}.json`)).default;
+    messages = (
+      await import(
+        /* webpackInclude: /\/messages\/[a-z]{2,3}(-[A-Za-z0-9]{2,8})*\.json$/ */
+        `../messages/${finalLocale}.json`
+      )
+    ).default;
   } catch (error) {
     console.error(
       `Failed to load messages for locale ${finalLocale}, falling back to ${DEFAULT_LOCALE}:`,
       error
     );
-    messages = (await import(`../messages/${DEFAULT_LOCALE}.json`)).default;
+    messages = (
+      await import(
+        /* webpackInclude: /\/messages\/[a-z]{2,3}(-[A-Za-z0-9]{2,8})*\.json$/ */
+        `../messages/${DEFAULT_LOCALE}.json`
+      )
+    ).default;
   }
 
   // Load English fallback messages for non-English locales
   if (finalLocale !== DEFAULT_LOCALE) {
     try {
-      fallbackMessages = (await import(`../messages/${DEFAULT_LOCALE}.json`))
-        .default;
+      fallbackMessages = (
+        await import(
+          /* webpackInclude: /\/messages\/[a-z]{2,3}(-[A-Za-z0-9]{2,8})*\.json$/ */
+          `../messages/${DEFAULT_LOCALE}.json`
+        )
+      ).default;
       // Merge fallback messages with current locale messages
       messages = deepMerge(messages, fallbackMessages);
     } catch (error) {
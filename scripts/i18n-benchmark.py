@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+i18n tooling benchmark
+Generates synthetic messages/ trees and language configs, runs the i18n commands
+against them and records wall time and peak memory per command, optionally
+gating on regressions against a stored baseline.
+"""
+
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple
+
+from i18n_catalog import PROJECT_ROOT, canonical_json, get_option, write_atomic
+
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+BENCH_DIR = Path(".cache/i18n/bench")
+# Tracked, so CI and fresh clones gate against the same numbers
+BENCH_BASELINE_PATH = SCRIPTS_DIR / "benchmarks" / "baseline.json"
+
+# Both baselines used by the tools must exist in every synthetic tree
+FIXED_LOCALES = ["en-US", "zh-CN"]
+
+COMMANDS = {
+    "quick-check": ["i18n-refactor-helper.py", "quick-check"],
+    "validate": ["validate-i18n-consistency.py"],
+    "detect-missing": ["i18n-refactor-helper.py", "detect-missing"],
+    "compare": ["i18n-refactor-helper.py", "compare"],
+    "remove-extra-dry": ["i18n-refactor-helper.py", "remove-extra", "--dry"],
+}
+
+# Regressions smaller than this are treated as noise, whatever the ratio
+NOISE_FLOOR_SECONDS = 0.05
+NOISE_FLOOR_KB = 2048
+
+
+class Scenario(NamedTuple):
+    name: str
+    locales: int
+    keys: int
+    depth: int
+    # Fraction of keys removed from (and added to) each non-baseline locale
+    drift: float
+
+    @property
+    def slug(self) -> str:
+        return f"{self.locales}l-{self.keys}k-d{self.depth}-{int(self.drift * 1000)}"
+
+
+SCENARIOS = {
+    "small": Scenario("small", 10, 2500, 3, 0.0),
+    "drift": Scenario("drift", 10, 2500, 3, 0.02),
+    "medium": Scenario("medium", 30, 25000, 4, 0.0),
+    "wide": Scenario("wide", 100, 25000, 4, 0.001),
+    "deep": Scenario("deep", 10, 250000, 6, 0.0),
+}
+
+
+class CommandResult(NamedTuple):
+    seconds: float
+    max_rss_kb: int
+    exit_code: int
+
+
+def locale_codes(count: int) -> List[str]:
+    """FIXED_LOCALES plus synthetic codes accepted by the language config parser"""
+    return FIXED_LOCALES + [f"xx-L{i:03d}" for i in range(max(0, count - len(FIXED_LOCALES)))]
+
+
+def _build_tree(keys: int, depth: int, rng: random.Random) -> Dict[str, Any]:
+    """About `keys` leaves spread evenly over `depth` levels"""
+    fanout = max(2, round(keys ** (1 / depth)))
+    tree: Dict[str, Any] = {}
+    for index in range(keys):
+        node = tree
+        rest = index
+        for level in range(depth - 1):
+            name = f"section{rest % fanout}" if level == 0 else f"group{rest % fanout}"
+            rest //= fanout
+            node = node.setdefault(name, {})
+        words = " ".join(rng.choice(("Save", "the", "file", "user", "group", "failed", "to", "load"))
+                         for _ in range(rng.randint(1, 8)))
+        node[f"key{index}"] = f"{words} {{count}}" if index % 7 == 0 else words
+    return tree
+
+
+def _leaf_parents(tree: Dict[str, Any], path=()) -> List[tuple]:
+    parents = []
+    for key, value in tree.items():
+        if isinstance(value, dict):
+            parents.extend(_leaf_parents(value, path + (key,)))
+        else:
+            parents.append(path)
+            break
+    return parents
+
+
+def _drift(tree: Dict[str, Any], drift: float, rng: random.Random) -> Dict[str, Any]:
+    """Copy of `tree` with some leaves removed and some extra leaves added"""
+    tree = json.loads(json.dumps(tree))
+    parents = _leaf_parents(tree)
+    changes = int(drift * sum(len(_node(tree, p)) for p in parents))
+    for i in range(changes):
+        node = _node(tree, rng.choice(parents))
+        if node:
+            node.pop(rng.choice(list(node)))
+        _node(tree, rng.choice(parents))[f"extra{i}"] = "Extra"
+    return tree
+
+
+def _node(tree: Dict[str, Any], path: tuple) -> Dict[str, Any]:
+    for key in path:
+        tree = tree[key]
+    return tree
+
+
+def generate(scenario: Scenario, root: Path, seed: int = 1) -> Path:
+    """Write messages/*.json and lib/config/language-config.ts under `root` (reused when present)"""
+    config_path = root / "lib/config/language-config.ts"
+    if config_path.exists():
+        return config_path
+
+    rng = random.Random(seed)
+    base = _build_tree(scenario.keys, scenario.depth, rng)
+    codes = locale_codes(scenario.locales)
+    for code in codes:
+        data = base if code in FIXED_LOCALES or not scenario.drift else _drift(base, scenario.drift, rng)
+        write_atomic(root / "messages" / f"{code}.json", canonical_json(data))
+
+    entries = "".join(
+        f"  '{code}': {{\n    name: '{code}',\n    nativeName: '{code}',\n    code: '{code}',\n  }},\n"
+        for code in codes
+    )
+    config = f"export const SUPPORTED_LANGUAGES = {{\n{entries}}} as const;\n"
+    write_atomic(config_path, config.encode("utf-8"))
+    return config_path
+
+
+def run_command(args: List[str], root: Path, config_path: Path, warm: bool) -> CommandResult:
+    """Run one command in `root`; peak RSS comes from wait4() for that child only"""
+    argv = [sys.executable, str(SCRIPTS_DIR / args[0]), *args[1:]]
+    if not warm:
+        argv.append("--no-cache")
+    env = dict(os.environ, I18N_LANGUAGE_CONFIG=str(config_path.resolve()))
+
+    started = time.perf_counter()
+    process = subprocess.Popen(argv, cwd=root, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - started
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    max_rss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return CommandResult(elapsed, max_rss, process.returncode)
+
+
+def run_scenario(scenario: Scenario, repeat: int, warm: bool) -> Dict[str, Dict[str, Any]]:
+    root = BENCH_DIR / scenario.slug
+    print(f"🧪 {scenario.name}: {scenario.locales} locales x {scenario.keys} keys, "
+          f"depth {scenario.depth}, drift {scenario.drift:.1%} ({root})")
+    config_path = generate(scenario, root)
+
+    results = {}
+    for name, args in COMMANDS.items():
+        if warm:
+            # Populate the cache first so every measured run is warm
+            run_command(args, root, config_path, warm)
+        runs = [run_command(args, root, config_path, warm) for _ in range(repeat)]
+        result = {
+            "seconds": round(statistics.median(run.seconds for run in runs), 4),
+            "maxRssKb": max(run.max_rss_kb for run in runs),
+            "exitCode": runs[0].exit_code,
+        }
+        results[name] = result
+        print(f"  {name:<18} {result['seconds']:>8.3f} s  {result['maxRssKb'] / 1024:>8.1f} MiB  "
+              f"(exit {result['exitCode']})")
+    return results
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, Dict[str, Any]]], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Regressions beyond `threshold` (relative) and the noise floors"""
+    regressions = []
+    for scenario, commands in results.items():
+        for command, result in commands.items():
+            previous = baseline.get(scenario, {}).get(command)
+            if previous is None:
+                continue
+            time_limit = max(previous["seconds"] * (1 + threshold), previous["seconds"] + NOISE_FLOOR_SECONDS)
+            if result["seconds"] > time_limit:
+                regressions.append(f"{scenario} {command}: {result['seconds']:.3f} s "
+                                   f"(baseline {previous['seconds']:.3f} s)")
+            rss_limit = max(previous["maxRssKb"] * (1 + threshold), previous["maxRssKb"] + NOISE_FLOOR_KB)
+            if result["maxRssKb"] > rss_limit:
+                regressions.append(f"{scenario} {command}: {result['maxRssKb']} KiB peak RSS "
+                                   f"(baseline {previous['maxRssKb']} KiB)")
+    return regressions
+
+
+def main():
+    """Main function"""
+    if "--help" in sys.argv:
+        print("Usage: python3 i18n-benchmark.py [options]")
+        print(f"  --scenario A,B       - scenarios to run: {', '.join(SCENARIOS)} (default small,drift)")
+        print("  --locales N --keys N [--depth N] [--drift F] - run a custom scenario instead")
+        print("  --repeat N           - runs per command, the median is reported (default 3)")
+        print("  --warm               - measure with the content-hash cache populated")
+        print(f"  --baseline-file PATH - baseline for the regression gate (default {BENCH_BASELINE_PATH.relative_to(PROJECT_ROOT)})")
+        print("  --save-baseline      - store these results as the baseline")
+        print("  --threshold F        - allowed relative regression (default 0.25)")
+        print("  --output PATH        - also write the results as JSON")
+        return 0
+
+    if get_option("--locales") or get_option("--keys"):
+        scenarios = [Scenario(
+            "custom",
+            int(get_option("--locales", "10")),
+            int(get_option("--keys", "2500")),
+            int(get_option("--depth", "3")),
+            float(get_option("--drift", "0")),
+        )]
+    else:
+        names = get_option("--scenario", "small,drift").split(",")
+        unknown = [name for name in names if name not in SCENARIOS]
+        if unknown:
+            print(f"❌ Unknown scenarios: {', '.join(unknown)}")
+            return 1
+        scenarios = [SCENARIOS[name] for name in names]
+
+    repeat = int(get_option("--repeat", "3"))
+    warm = "--warm" in sys.argv
+    threshold = float(get_option("--threshold", "0.25"))
+    baseline_file = Path(get_option("--baseline-file", str(BENCH_BASELINE_PATH)))
+
+    results = {}
+    for scenario in scenarios:
+        # Custom scenarios are keyed by shape so their baselines stay comparable
+        key = scenario.name if scenario.name != "custom" else scenario.slug
+        results[key] = run_scenario(scenario, repeat, warm)
+
+    output = get_option("--output")
+    if output:
+        write_atomic(Path(output), (json.dumps(results, indent=2) + "\n").encode("utf-8"))
+        print(f"\n📝 Results written to {output}")
+
+    if "--save-baseline" in sys.argv:
+        baseline = {}
+        if baseline_file.exists():
+            baseline = json.loads(baseline_file.read_text(encoding="utf-8"))
+        baseline.update(results)
+        write_atomic(baseline_file, (json.dumps(baseline, indent=2) + "\n").encode("utf-8"))
+        print(f"\n💾 Saved baseline to {baseline_file}")
+        return 0
+
+    if not baseline_file.exists():
+        print(f"\nℹ️  No baseline at {baseline_file} (use --save-baseline to create one)")
+        return 0
+
+    regressions = compare_to_baseline(results, json.loads(baseline_file.read_text(encoding="utf-8")), threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regressions beyond {threshold:.0%}:")
+        for regression in regressions:
+            print(f"    {regression}")
+        return 1
+    print(f"\n✅ No regressions beyond {threshold:.0%} against {baseline_file}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+const fs = require('node:fs');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+// Runs `i18n-refactor-helper.py build-bundles` before `next build`. Python is
+// optional for building the app: without it the bundles are skipped and the
+// runtime loads messages/*.json directly (see i18n/request.ts).
+const HELPER = path.resolve(__dirname, 'i18n-refactor-helper.py');
+const BUNDLE_DIR = path.resolve(__dirname, '../messages/.build');
+const INTERPRETERS =
+  process.platform === 'win32' ? ['python3', 'python', 'py'] : ['python3'];
+
+function findPython() {
+  for (const command of INTERPRETERS) {
+    const result = spawnSync(command, ['--version'], { stdio: 'ignore' });
+    if (!result.error && result.status === 0) {
+      return command;
+    }
+  }
+  return null;
+}
+
+// Bundles left over from an earlier build would be served instead of the
+// current sources, so drop them when they cannot be regenerated.
+function removeStaleBundles() {
+  if (!fs.existsSync(BUNDLE_DIR)) {
+    return 0;
+  }
+  const bundles = fs
+    .readdirSync(BUNDLE_DIR)
+    .filter(name => name.endsWith('.json'));
+  for (const name of bundles) {
+    fs.rmSync(path.join(BUNDLE_DIR, name));
+  }
+  return bundles.length;
+}
+
+const python = findPython();
+if (!python) {
+  const removed = removeStaleBundles();
+  console.warn(
+    '⚠️  python3 not found, skipping i18n bundles; messages/*.json are loaded at runtime instead'
+  );
+  if (removed) {
+    console.warn(
+      `   Removed ${removed} stale bundle files from messages/.build`
+    );
+  }
+  process.exit(0);
+}
+
+const result = spawnSync(python, [HELPER, 'build-bundles'], {
+  stdio: 'inherit',
+});
+process.exit(result.status ?? 1);
@@ -5,423 +5,182 @@ Focuses on checking the structural consistency of translation files
 """
 
 import json
-import os
 import sys
-import re
-from typing import Dict, Set, List, Any, Optional
+from typing import Optional
 from pathlib import Path
 
-class I18nConsistencyChecker:
-    def __init__(self):
-        self.languages = self.load_languages_from_ts(verbose=True)
-        if not self.languages:
-            print("❌ Error: Could not load languages from config file. Aborting.", file=sys.stderr)
-            sys.exit(1)
-            
-        self.messages_dir = Path("messages")
-            
-
-    def load_languages_from_ts(self, verbose: bool = True) -> List[str]:
-        """Load supported language list from lib/config/language-config.ts"""
-        # Script is in scripts/ directory, TS file path is relative to project root
-        project_root = Path(__file__).resolve().parent.parent
-        ts_file_path = project_root / "lib/config/language-config.ts"
-    
-        if not ts_file_path.exists():
-            print(f"❌ Language config file not found at: {ts_file_path}", file=sys.stderr)
-            return []
-
-        try:
-            content = ts_file_path.read_text(encoding="utf-8")
-
-            # Find SUPPORTED_LANGUAGES object body (non-greedy match)
-            match = re.search(
-                r"export\s+const\s+SUPPORTED_LANGUAGES\s*=\s*{(.+?)}\s*as\s+const;",
-                content,
-                re.DOTALL,
-            )
-            if not match:
-                print("❌ Could not find SUPPORTED_LANGUAGES in the config file.", file=sys.stderr)
-                return []
-
-            obj_content = match.group(1)
-
-            # Match general language codes (supporting en, zh-Hans, es-419, sr-Latn-RS, etc.)
-            lang_codes = re.findall(
-                r"\s*['\"]([a-z]{2,3}(?:-[A-Za-z0-9]{2,8})*)['\"]\s*:",
-                obj_content,
-            )
-
-            if lang_codes:
-                if verbose:
-                    print(f"✅ Loaded {len(lang_codes)} languages: {', '.join(lang_codes)}")
-            else:
-                print("❌ No languages found in language-config.ts", file=sys.stderr)
-
-            return lang_codes
-
-        except Exception as e:
-            print(f"❌ Error reading or parsing {ts_file_path}: {e}", file=sys.stderr)
-            return []
-
-    def get_all_keys(self, obj: Any, prefix: str = "") -> Set[str]:
-        """Recursively get all key paths"""
-        keys = set()
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                current_path = f"{prefix}.{key}" if prefix else key
-                keys.add(current_path)
-                if isinstance(value, dict):
-                    keys.update(self.get_all_keys(value, current_path))
-        return keys
-    
-    def find_key_line_number(self, file_path: Path, key_path: str) -> Optional[int]:
-        """Find the line number of a key in the file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Extract the last level key name
-            key_parts = key_path.split('.')
-            target_key = key_parts[-1]
-            
-            # Search for the line containing the key
-            for i, line in enumerate(lines, 1):
-                if f'"{target_key}":' in line:
-                    return i
-            
-            return None
-        except Exception:
-            return None
-    
-    def load_translation_files(self) -> Optional[Dict[str, Dict]]:
-        """Load all translation files"""
-        translations = {}
-        
-        for lang in self.languages:
-            file_path = self.messages_dir / f"{lang}.json"
-            
-            if not file_path.exists():
-                print(f"❌ Translation file not found: {file_path}")
-                return None
-            
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    translations[lang] = json.load(f)
-            except json.JSONDecodeError as e:
-                print(f"❌ Invalid JSON in {file_path}: {e}")
-                return None
-            except Exception as e:
-                print(f"❌ Error loading {file_path}: {e}")
-                return None
-        
-        return translations
-
-    def detect_missing_keys(self) -> Optional[Dict[str, List[Dict[str, Any]]]]:
-        """Detect missing keys, return details including line number"""
-        print("🔍 Detecting missing keys...")
-        
-        translations = self.load_translation_files()
-        if not translations:
-            return None
-        
-        # Get all keys
-        all_keys = {}
-        for lang, data in translations.items():
-            all_keys[lang] = self.get_all_keys(data)
-        
-        # Use Chinese as the base to check other languages
-        base_lang = 'zh-CN'
-        base_keys = all_keys[base_lang]
-        base_file = self.messages_dir / f"{base_lang}.json"
-        
-        missing_info = {}
-        has_missing = False
-        
-        for lang in all_keys:
-            if lang == base_lang:
-                continue
-            
-            current_keys = all_keys[lang]
-            missing_keys = base_keys - current_keys
-            extra_keys = current_keys - base_keys
-            
-            if missing_keys:
-                has_missing = True
-                missing_info[lang] = []
-                
-                print(f"\n❌ {lang} missing {len(missing_keys)} keys:")
-                
-                for key in sorted(missing_keys):
-                    # Get line number
-                    line_num = self.find_key_line_number(base_file, key)
-                    
-                    print(f"    📍 {key} (line ~{line_num if line_num else 'unknown'})")
-            
-            if extra_keys:
-                has_missing = True
-                print(f"\n❌ {lang} has {len(extra_keys)} extra keys:")
-                for key in sorted(extra_keys):
-                    print(f"    ➕ {key}")
-            
-            if not missing_keys and not extra_keys:
-                print(f"✅ {lang} has consistent keys")
-        
-        return missing_info if has_missing else None
-
-    def validate_consistency(self, silent: bool = False) -> bool:
-        """Validate translation file consistency"""
-        if not silent:
-            print("🔍 Validating translation file consistency...")
-        
-        translations = self.load_translation_files()
-        if not translations:
-            return False
-        
-        # Validate line count consistency
-        line_counts = {}
-        for lang in self.languages:
-            file_path = self.messages_dir / f"{lang}.json"
-            with open(file_path, 'r', encoding='utf-8') as f:
-                line_counts[lang] = len(f.readlines())
-        
-        if not silent:
-            print("📊 File line counts:")
-            for lang, count in line_counts.items():
-                print(f"  {lang}: {count} lines")
-        
-        unique_counts = set(line_counts.values())
-        if len(unique_counts) != 1:
-            print("❌ File line counts are inconsistent")
-            return False
-        
-        # Validate structure consistency
-        all_keys = {}
-        for lang, data in translations.items():
-            all_keys[lang] = self.get_all_keys(data)
-        
-        if not silent:
-            print("🔧 Structure key counts:")
-            for lang, keys in all_keys.items():
-                print(f"  {lang}: {len(keys)} keys")
-        
-        # Use Chinese as the base to check other languages
-        base_lang = 'zh-CN'
-        base_keys = all_keys[base_lang]
-        
-        inconsistent = False
-        for lang in all_keys:
-            if lang == base_lang:
-                continue
-            
-            current_keys = all_keys[lang]
-            missing_keys = base_keys - current_keys
-            extra_keys = current_keys - base_keys
-            
-            if missing_keys or extra_keys:
-                if not silent:
-                    print(f"❌ {lang} structure is inconsistent:")
-                    if missing_keys:
-                        print(f"    Missing {len(missing_keys)} keys")
-                    if extra_keys:
-                        print(f"    Extra {len(extra_keys)} keys")
-                inconsistent = True
-            elif not silent:
-                print(f"✅ {lang} structure is consistent")
-        
-        return not inconsistent
-
-    def quick_check(self) -> bool:
-        """Quick check (silent mode)"""
-        return self.validate_consistency(silent=True)
-    
-    def compare_keys(self, show_details: bool = False) -> bool:
-        """Compare key counts against English baseline with numerical differences"""
-        print("🔍 Comparing translation key counts against English baseline...")
-        
-        translations = self.load_translation_files()
-        if not translations:
-            return False
-            
-        # Get all keys for each language
-        all_keys = {}
-        for lang, data in translations.items():
-            all_keys[lang] = self.get_all_keys(data)
-        
-        # Use English as baseline
-        baseline_lang = 'en-US'
-        if baseline_lang not in all_keys:
-            print(f"❌ Baseline language '{baseline_lang}' not found")
-            return False
-            
-        baseline_count = len(all_keys[baseline_lang])
-        baseline_keys = all_keys[baseline_lang]
-        
-        print(f"📊 Key count comparison (baseline: {baseline_lang} with {baseline_count} keys):")
-        print()
-        
-        has_inconsistencies = False
-        results = []
-        
-        for lang in sorted(all_keys.keys()):
-            current_keys = all_keys[lang]
-            current_count = len(current_keys)
-            difference = current_count - baseline_count
-            
-            # Calculate missing and extra keys
-            if lang != baseline_lang:
-                missing_keys = baseline_keys - current_keys
-                extra_keys = current_keys - baseline_keys
-                missing_count = len(missing_keys)
-                extra_count = len(extra_keys)
-                
-                if missing_count > 0 or extra_count > 0:
-                    has_inconsistencies = True
-            else:
-                missing_count = 0
-                extra_count = 0
-            
-            # Format the difference display
-            if difference == 0:
-                diff_display = "0"
-                status_emoji = "✅"
-            elif difference > 0:
-                diff_display = f"+{difference}"
-                status_emoji = "⚠️ "
-            else:
-                diff_display = str(difference)
-                status_emoji = "❌"
-            
-            results.append({
-                'lang': lang,
-                'count': current_count,
-                'diff': difference,
-                'diff_display': diff_display,
-                'status_emoji': status_emoji,
-                'missing_count': missing_count,
-                'extra_count': extra_count
-            })
-            
-            print(f"  {status_emoji} {lang:<8} {current_count:>4} keys ({diff_display})")
-        
-        if show_details and has_inconsistencies:
-            print("\n📝 Detailed breakdown:")
-            for result in results:
-                if result['lang'] == baseline_lang:
-                    continue
-                    
-                if result['missing_count'] > 0 or result['extra_count'] > 0:
-                    print(f"\n  {result['lang']}:")
-                    if result['missing_count'] > 0:
-                        print(f"    ❌ Missing: {result['missing_count']} keys")
-                    if result['extra_count'] > 0:
-                        print(f"    ➕ Extra: {result['extra_count']} keys")
-        
-        return not has_inconsistencies
-    
-    def remove_extra_keys(self, dry_run: bool = False) -> bool:
-        """Remove extra keys that don't exist in English baseline"""
-        print("🧹 Removing extra keys not present in English baseline...")
-        
-        translations = self.load_translation_files()
-        if not translations:
-            return False
-            
-        # Get baseline keys (English)
-        baseline_lang = 'en-US'
-        if baseline_lang not in translations:
-            print(f"❌ Baseline language '{baseline_lang}' not found")
-            return False
-            
-        baseline_keys = self.get_all_keys(translations[baseline_lang])
-        
-        removed_count = 0
-        processed_files = []
-        
-        for lang in translations.keys():
-            if lang == baseline_lang:
-                continue
-                
-            current_keys = self.get_all_keys(translations[lang])
-            extra_keys = current_keys - baseline_keys
-            
-            if not extra_keys:
-                print(f"✅ {lang}: No extra keys to remove")
-                continue
-            
-            print(f"🔍 {lang}: Found {len(extra_keys)} extra keys")
-            if not dry_run:
-                # Load the original file
-                file_path = self.messages_dir / f"{lang}.json"
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Remove extra keys
-                    for key_path in sorted(extra_keys):
-                        keys = key_path.split('.')
-                        current_obj = data
-                        
-                        # Navigate to parent object
-                        for key in keys[:-1]:
-                            if isinstance(current_obj, dict) and key in current_obj:
-                                current_obj = current_obj[key]
-                            else:
-                                break
-                        else:
-                            # Remove the key if parent exists
-                            if isinstance(current_obj, dict) and keys[-1] in current_obj:
-                                del current_obj[keys[-1]]
-                                removed_count += 1
-                                print(f"    ❌ Removed: {key_path}")
-                    
-                    # Write back the file
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, ensure_ascii=False, indent=2)
-                        f.write('\n')  # Add trailing newline
-                    
-                    processed_files.append(lang)
-                    
-                except Exception as e:
-                    print(f"❌ Error processing {lang}: {e}")
-                    return False
-            else:
-                print(f"    🔍 Would remove {len(extra_keys)} keys:")
-                for key_path in sorted(extra_keys):
-                    print(f"      - {key_path}")
-        
-        if dry_run:
-            print(f"\n🔍 Dry run completed. Would process {len([l for l in translations.keys() if l != baseline_lang])} files")
-        else:
-            if processed_files:
-                print(f"\n✅ Successfully processed {len(processed_files)} files, removed {removed_count} extra keys")
-                print("📝 Processed files:", ", ".join(processed_files))
-            else:
-                print("\n✅ No files needed processing")
-        
-        return True
+from i18n_catalog import CatalogError, get_jobs_option, get_option, write_atomic
+from i18n_checker import SIZE_BASELINE_PATH, I18nConsistencyChecker
+from i18n_profile import get_profile_format, get_profiler, print_report
+from i18n_report import get_report_writer
 
 def main():
     """Main function"""
     if len(sys.argv) < 2:
+        from i18n_dupes import DEFAULT_THRESHOLD
+        from i18n_translate import BACKENDS
+
         print("Usage: python3 i18n-refactor-helper.py <command>")
         print("Commands:")
         print("  detect-missing       - detect missing keys")
         print("  validate             - validate consistency")
-        print("  quick-check          - quick check")
+        print("  quick-check          - quick check (keys, line counts and placeholders)")
+        print("  quick-check --staged - check only staged locales, as staged in the git index")
         print("  compare              - compare key counts against English baseline")
         print("  compare --details    - compare with detailed breakdown")
+        print("  coverage             - language x key coverage matrix summary")
+        print("  coverage --details   - also list every key missing in some languages")
+        print("  placeholders         - check ICU arguments, select arms and tags against English")
+        print("  usage                - find unused keys and keys used in code but not defined")
+        print("  usage --details      - also list every unused key")
+        print("  size-report          - raw/minified/gzip/brotli sizes per locale and namespace")
+        print("  size-report --budget FILE - fail when a namespace exceeds its size budget")
+        print("  size-report --save-baseline - store sizes for later comparison")
+        print("  build-bundles        - write pre-merged fallback bundles, namespace splits and manifest")
+        print("  build-bundles --details - also list namespace sizes and hashes")
+        print("  index                - write per-section structural and content hashes (ETags)")
+        print("  index --details      - also list sections whose keys differ from English")
+        print("  compile              - write flat catalogs with parsed ICU signatures, rejecting malformed messages")
+        print("  compile --module ts  - emit TypeScript modules instead of JSON")
         print("  remove-extra         - remove extra keys not in English baseline")
         print("  remove-extra --dry   - preview extra keys to be removed")
+        print("  sync                 - prune, fill and reorder keys to match English in one pass")
+        print("  sync --dry           - preview what sync would change")
+        print("  translate --backend NAME - machine-translate missing keys from English")
+        print("  translate --backend NAME --dry - show what would be translated without sending requests")
+        print("  stale                - list translations whose English source changed")
+        print("  stale --accept       - record current translations as up to date")
+        print("  pack                 - write all locales into one dictionary-encoded pack (export/backup)")
+        print("  pack --verify        - check that every locale round-trips through the pack format")
+        print("  unpack FILE          - restore locale files from a pack (--dry to preview)")
+        print("  dupes                - exact and near-duplicate messages with their key paths")
+        print("  dupes --details      - list every cluster")
+        print("  diff-revs A [B]      - keys added, removed and changed per locale between git revisions (B defaults to HEAD)")
+        print("  diff-revs A B --details - also show the values")
+        print("  diff-revs A B --format json [--output PATH] - print (or write) the diff as JSON")
+        print("  journal              - apply pending admin edits from messages/.journal/<locale>.jsonl")
+        print("  journal --dry        - validate pending edits without writing")
+        print("  watch                - re-validate locales whenever a messages file changes")
+        print("  watch --socket PATH  - also publish JSON results on a Unix socket")
+        print("Options:")
+        print("  --no-cache           - ignore the content-hash cache in .cache/i18n")
+        print("  --jobs N             - load and diff locales in N processes (0 = all CPUs)")
+        print("  --baseline LANG      - baseline language for coverage, placeholders and index (default en-US) and watch (default zh-CN)")
+        print("  --fill MODE          - sync fill for missing keys: fallback (English) or marker")
+        print("  --poll               - watch by polling file mtimes instead of inotify")
+        print(f"  --baseline-file PATH - size baseline file (default {SIZE_BASELINE_PATH})")
+        print(f"  --backend NAME       - translation backend, required by translate: {', '.join(BACKENDS)}")
+        print("  --lang LANG[,LANG]   - translate or compact journals of only these languages (dupes: one language, default en-US)")
+        print(f"  --threshold F        - dupes near-duplicate similarity (default {DEFAULT_THRESHOLD})")
+        print("  --concurrency N      - translation requests in flight (default 4)")
+        print("  --report-format FORMAT - also write findings as json, sarif or junit (default text)")
+        print("  --report PATH        - findings report file (default i18n-report.<ext>)")
+        print("  --output PATH        - pack file (default messages/.build/catalogs.pack.json), or the diff-revs JSON file")
+        print("  --profile            - report time per phase and locale, and peak memory (stderr)")
+        print("  --profile=json       - print the profile report as JSON")
+        print("  --cprofile FILE      - with --profile, also dump cProfile stats to FILE")
         return 1
     
     command = sys.argv[1]
-    checker = I18nConsistencyChecker()
+    try:
+        profile_format = get_profile_format()
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    if profile_format is None:
+        return run_command(command)
     
+    profiler = get_profiler()
+    profiler.start(cprofile_path=get_option("--cprofile"))
+    try:
+        # The command phase's own time is logic and console output
+        with profiler.phase(command):
+            return run_command(command)
+    finally:
+        print_report(profiler.stop(), profile_format)
+
+def diff_revisions(
+    old_rev: str, new_rev: str = "HEAD", as_json: bool = False,
+    output: Optional[str] = None, show_details: bool = False,
+) -> bool:
+    """Added, removed and changed keys per locale between two git revisions"""
+    from i18n_git import CatFile, RevisionReader
+
+    try:
+        with CatFile() as cat_file:
+            reader = RevisionReader(cat_file)
+            old_commit, new_commit = reader.resolve(old_rev), reader.resolve(new_rev)
+            changes = reader.diff(old_commit, new_commit)
+    except CatalogError as e:
+        print(f"❌ {e}")
+        return False
+
+    if as_json:
+        document = {
+            "from": {"rev": old_rev, "commit": old_commit},
+            "to": {"rev": new_rev, "commit": new_commit},
+            "locales": {change.locale: change.to_json() for change in changes},
+        }
+        content = json.dumps(document, ensure_ascii=False, indent=2) + "\n"
+        if output:
+            write_atomic(Path(output), content.encode("utf-8"))
+            print(f"📝 Diff written to {output}")
+        else:
+            sys.stdout.write(content)
+        return True
+
+    print(f"🔀 Translation changes {old_rev} ({old_commit[:12]}) → {new_rev} ({new_commit[:12]})")
+    if not changes:
+        print("✅ No key changes")
+        return True
+    for change in changes:
+        print(f"\n📄 {change.locale}: +{len(change.added)} -{len(change.removed)} ~{len(change.changed)}")
+        for path, value in change.added.items():
+            print(f"    + {path}" + (f": {json.dumps(value, ensure_ascii=False)}" if show_details else ""))
+        for path, value in change.removed.items():
+            print(f"    - {path}" + (f": {json.dumps(value, ensure_ascii=False)}" if show_details else ""))
+        for path, (old, new) in change.changed.items():
+            detail = f": {json.dumps(old, ensure_ascii=False)} → {json.dumps(new, ensure_ascii=False)}"
+            print(f"    ~ {path}" + (detail if show_details else ""))
+    return True
+
+def run_command(command: str) -> int:
+    """Run one command; returns the process exit code"""
     # Parse additional arguments
     show_details = "--details" in sys.argv
     dry_run = "--dry" in sys.argv or "--dry-run" in sys.argv
+    use_cache = "--no-cache" not in sys.argv
+    jobs = get_jobs_option()
+    
+    if command == "diff-revs":
+        # Reads git objects only and renders --format json itself, so it needs no checker or report
+        revs = [arg for arg in sys.argv[2:4] if not arg.startswith("--")]
+        if not revs:
+            print("❌ Usage: diff-revs A [B]")
+            return 1
+        success = diff_revisions(
+            revs[0], revs[1] if len(revs) > 1 else "HEAD",
+            as_json=get_option("--format", "text") == "json",
+            output=get_option("--output"),
+            show_details=show_details,
+        )
+        return 0 if success else 1
     
+    checker = I18nConsistencyChecker(use_cache=use_cache, jobs=jobs)
+    try:
+        checker.reporter = get_report_writer(command)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    
+    exit_code = dispatch_command(checker, command, show_details, dry_run)
+    if checker.reporter is not None:
+        checker.reporter.close(passed=exit_code == 0)
+        print(f"📝 {checker.reporter.count} findings written to {checker.reporter.stream.name}")
+    return exit_code
+
+def dispatch_command(checker: I18nConsistencyChecker, command: str, show_details: bool, dry_run: bool) -> int:
+    """Run the checker method for `command`"""
     try:
         if command == "detect-missing":
             missing = checker.detect_missing_keys()
@@ -432,7 +191,7 @@ def main():
             return 0 if success else 1
         
         elif command == "quick-check":
-            success = checker.quick_check()
+            success = checker.quick_check_staged() if "--staged" in sys.argv else checker.quick_check()
             if success:
                 print("✅ Quick check passed")
             else:
@@ -443,10 +202,134 @@ def main():
             success = checker.compare_keys(show_details=show_details)
             return 0 if success else 1
         
+        elif command == "coverage":
+            baseline_lang = get_option("--baseline", "en-US")
+            success = checker.show_coverage(baseline_lang=baseline_lang, show_details=show_details)
+            return 0 if success else 1
+        
+        elif command == "placeholders":
+            success = checker.check_placeholders(base_lang=get_option("--baseline", "en-US"))
+            return 0 if success else 1
+        
+        elif command == "usage":
+            success = checker.show_usage(show_details=show_details)
+            return 0 if success else 1
+        
+        elif command == "size-report":
+            success = checker.show_size_report(
+                show_details=show_details,
+                budget_path=get_option("--budget"),
+                baseline_path=get_option("--baseline-file", SIZE_BASELINE_PATH),
+                save_baseline="--save-baseline" in sys.argv,
+            )
+            return 0 if success else 1
+        
+        elif command == "build-bundles":
+            success = checker.build_message_bundles(show_details=show_details)
+            return 0 if success else 1
+        
+        elif command == "index":
+            success = checker.build_hash_index(
+                baseline_lang=get_option("--baseline", "en-US"), show_details=show_details
+            )
+            return 0 if success else 1
+        
+        elif command == "compile":
+            success = checker.compile_messages(
+                module=get_option("--module", "json"), show_details=show_details
+            )
+            return 0 if success else 1
+        
         elif command == "remove-extra":
             success = checker.remove_extra_keys(dry_run=dry_run)
             return 0 if success else 1
-        
+
+        elif command == "stale":
+            success = checker.show_stale(show_details=show_details, accept="--accept" in sys.argv)
+            return 0 if success else 1
+
+        elif command == "sync":
+            success = checker.sync_structure(
+                baseline_lang=get_option("--baseline", "en-US"),
+                fill=get_option("--fill", "fallback"),
+                dry_run=dry_run,
+                show_details=show_details,
+            )
+            return 0 if success else 1
+
+        elif command == "pack":
+            output = get_option("--output")
+            success = checker.pack_catalogs(Path(output) if output else None, verify="--verify" in sys.argv)
+            return 0 if success else 1
+
+        elif command == "unpack":
+            files = [arg for arg in sys.argv[2:3] if not arg.startswith("--")]
+            if not files:
+                print("❌ Usage: unpack FILE")
+                return 1
+            success = checker.unpack_catalogs(Path(files[0]), dry_run=dry_run)
+            return 0 if success else 1
+
+        elif command == "dupes":
+            from i18n_dupes import DEFAULT_THRESHOLD
+
+            value = get_option("--threshold", str(DEFAULT_THRESHOLD))
+            try:
+                threshold = float(value)
+                valid = 0.0 <= threshold <= 1.0
+            except ValueError:
+                valid = False
+            if not valid:
+                print(f"❌ Invalid --threshold value: {value} (expected a similarity between 0 and 1)")
+                return 1
+            success = checker.show_duplicates(
+                lang=get_option("--lang", "en-US"),
+                threshold=threshold,
+                show_details=show_details,
+            )
+            return 0 if success else 1
+
+        elif command == "journal":
+            langs = get_option("--lang")
+            success = checker.compact_journals(
+                target_langs=langs.split(",") if langs else None, dry_run=dry_run
+            )
+            return 0 if success else 1
+
+        elif command == "watch":
+            success = checker.watch_files(
+                baseline_lang=get_option("--baseline", "zh-CN"),
+                socket_path=get_option("--socket"),
+                polling="--poll" in sys.argv,
+            )
+            return 0 if success else 1
+
+        elif command == "translate":
+            from i18n_translate import BACKENDS
+
+            # No default: mymemory sends catalog strings to an external service
+            backend_name = get_option("--backend")
+            if backend_name is None:
+                print(f"❌ Usage: translate --backend NAME ({', '.join(BACKENDS)})")
+                return 1
+            value = get_option("--concurrency", "4")
+            try:
+                concurrency = int(value)
+                valid = concurrency >= 1
+            except ValueError:
+                valid = False
+            if not valid:
+                print(f"❌ Invalid --concurrency value: {value} (expected a positive integer)")
+                return 1
+            langs = get_option("--lang")
+            success = checker.translate_missing_keys(
+                backend_name=backend_name,
+                target_langs=langs.split(",") if langs else None,
+                concurrency=concurrency,
+                dry_run=dry_run,
+            )
+            return 0 if success else 1
+
         else:
             print(f"❌ Unknown command: {command}")
             return 1
@@ -0,0 +1,359 @@
+"""
+i18n message bundle builder
+Writes pre-merged, minified message bundles so the request path can load one
+ready-made object per locale instead of merging the English fallback at runtime,
+plus per-namespace splits and a manifest so pages can load only what they use,
+flat precompiled catalogs with message signatures, a subtree hash index, and
+measures what each locale and namespace costs on the wire.
+"""
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from i18n_catalog import MESSAGES_DIR, TranslationModel, write_atomic
+from i18n_icu import IcuSyntaxError, parse_message
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BUNDLE_DIR = MESSAGES_DIR / ".build"
+NAMESPACE_DIRNAME = "namespaces"
+MANIFEST_FILENAME = "manifest.json"
+HASH_INDEX_FILENAME = "hash-index.json"
+HASH_INDEX_VERSION = 1
+FALLBACK_LOCALE = "en-US"
+
+COMPILED_DIRNAME = "compiled"
+COMPILED_MODULES = ("json", "ts")
+
+# Top-level keys that group per-route messages; these are split one level deeper
+NESTED_NAMESPACES = ("pages",)
+
+
+class NamespaceEntry(NamedTuple):
+    file: str
+    bytes: int
+    hash: str
+
+
+class SizeEntry(NamedTuple):
+    """Byte sizes of one message payload; brotli is None when the module is unavailable"""
+
+    raw: int
+    minified: int
+    gzip: int
+    brotli: Optional[int]
+
+
+# Key used for whole-locale totals in size reports
+TOTAL = "(total)"
+SIZE_METRICS = SizeEntry._fields
+
+
+class BundleResult(NamedTuple):
+    locale: str
+    size: int
+    written: bool
+    namespaces: Dict[str, NamespaceEntry]
+
+
+def merge_fallback(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill keys missing from `target` with `source`, like deepMerge in i18n/request.ts"""
+    result = dict(target)
+
+    for key, value in source.items():
+        current = result.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            result[key] = merge_fallback(current, value)
+        elif key not in result:
+            # Only use fallback if key doesn't exist in target
+            result[key] = value
+
+    return result
+
+
+def minify(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(content: bytes) -> str:
+    """Short content hash used for cache busting"""
+    return hashlib.sha256(content).hexdigest()[:16]
+
+
+def split_namespaces(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Split a message tree into namespaces (`common`, `pages.chat`, ...)"""
+    namespaces = {}
+
+    for key, value in data.items():
+        if key in NESTED_NAMESPACES and isinstance(value, dict):
+            for child, child_value in value.items():
+                namespaces[f"{key}.{child}"] = child_value
+        else:
+            namespaces[key] = value
+
+    return namespaces
+
+
+def _write_namespaces(
+    locale: str, merged: Dict[str, Any], bundle_dir: Path
+) -> Dict[str, NamespaceEntry]:
+    """Write one minified file per namespace and remove files of namespaces that no longer exist"""
+    locale_dir = bundle_dir / NAMESPACE_DIRNAME / locale
+    entries = {}
+
+    for namespace, value in split_namespaces(merged).items():
+        content = minify(value)
+        file_name = f"{namespace}.json"
+        write_atomic(locale_dir / file_name, content)
+        entries[namespace] = NamespaceEntry(
+            f"{NAMESPACE_DIRNAME}/{locale}/{file_name}", len(content), content_hash(content)
+        )
+
+    for stale in locale_dir.glob("*.json"):
+        if stale.stem not in entries:
+            stale.unlink()
+
+    return entries
+
+
+def build_bundles(
+    model: TranslationModel,
+    bundle_dir: Path = BUNDLE_DIR,
+    fallback_locale: str = FALLBACK_LOCALE,
+) -> List[BundleResult]:
+    """Write full bundles, namespace bundles and the manifest for every language
+
+    Full bundles go to <bundle_dir>/<locale>.json, namespaces to
+    <bundle_dir>/namespaces/<locale>/<namespace>.json. Files whose content is
+    unchanged are left untouched.
+    """
+    fallback = model.catalog(fallback_locale).data
+    results = []
+
+    for catalog in model.catalogs():
+        if catalog.locale == fallback_locale:
+            merged = catalog.data
+        else:
+            merged = merge_fallback(catalog.data, fallback)
+        content = minify(merged)
+        written = write_atomic(bundle_dir / f"{catalog.locale}.json", content)
+        namespaces = _write_namespaces(catalog.locale, merged, bundle_dir)
+        results.append(BundleResult(catalog.locale, len(content), written, namespaces))
+
+    write_manifest(results, bundle_dir, fallback_locale)
+    return results
+
+
+def write_manifest(results: List[BundleResult], bundle_dir: Path, fallback_locale: str) -> None:
+    """Write <bundle_dir>/manifest.json listing namespaces with their sizes and hashes"""
+    namespaces = sorted({name for result in results for name in result.namespaces})
+    manifest = {
+        "fallbackLocale": fallback_locale,
+        "namespaces": namespaces,
+        "locales": {
+            result.locale: {
+                "bytes": result.size,
+                "namespaces": {
+                    name: entry._asdict() for name, entry in result.namespaces.items()
+                },
+            }
+            for result in results
+        },
+    }
+    content = json.dumps(manifest, ensure_ascii=False, indent=2) + "\n"
+    write_atomic(bundle_dir / MANIFEST_FILENAME, content.encode("utf-8"))
+
+
+def write_hash_index(model: TranslationModel, bundle_dir: Path = BUNDLE_DIR) -> Path:
+    """Write <bundle_dir>/hash-index.json with the subtree hashes of every language
+
+    Each locale maps object key paths ("" is the whole file) to their structural
+    and content hashes; the content hash of a section is usable as its ETag.
+    """
+    index = {
+        "version": HASH_INDEX_VERSION,
+        "locales": {
+            catalog.locale: {
+                path: {"shape": shape, "content": content}
+                for path, (shape, content) in sorted(catalog.hashes.items())
+            }
+            for catalog in model.catalogs()
+        },
+    }
+    path = bundle_dir / HASH_INDEX_FILENAME
+    write_atomic(path, (json.dumps(index, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8"))
+    return path
+
+
+class CompiledCatalog(NamedTuple):
+    locale: str
+    # Dotted key -> message (lists and other non-object values are kept as they are)
+    messages: Dict[str, Any]
+    # Dotted key -> compact MessageSignature for messages with arguments or tags
+    signatures: Dict[str, Dict[str, Any]]
+
+
+class CompileError(NamedTuple):
+    locale: str
+    path: str
+    message: str
+
+
+def flatten_messages(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flat dotted-key view of a message tree"""
+    flat = {}
+    for key, value in data.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten_messages(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+def compile_catalog(locale: str, data: Dict[str, Any]) -> Tuple[CompiledCatalog, List[CompileError]]:
+    """Flatten a message tree and parse every string message once"""
+    messages = flatten_messages(data)
+    signatures = {}
+    errors = []
+
+    for path, value in messages.items():
+        if not isinstance(value, str):
+            continue
+        try:
+            signature = parse_message(value).to_json()
+        except IcuSyntaxError as e:
+            errors.append(CompileError(locale, path, str(e)))
+            continue
+        if signature:
+            signatures[path] = signature
+
+    return CompiledCatalog(locale, messages, signatures), errors
+
+
+def compile_catalogs(
+    model: TranslationModel, fallback_locale: str = FALLBACK_LOCALE
+) -> Tuple[List[CompiledCatalog], List[CompileError]]:
+    """Compile the shipped (fallback-merged) messages of every language"""
+    fallback = model.catalog(fallback_locale).data
+    compiled = []
+    errors = []
+
+    for catalog in model.catalogs():
+        if catalog.locale == fallback_locale:
+            merged = catalog.data
+        else:
+            merged = merge_fallback(catalog.data, fallback)
+        result, locale_errors = compile_catalog(catalog.locale, merged)
+        compiled.append(result)
+        errors.extend(locale_errors)
+
+    return compiled, errors
+
+
+def write_compiled(
+    compiled: List[CompiledCatalog], bundle_dir: Path = BUNDLE_DIR, module: str = "json"
+) -> List[Path]:
+    """Write <bundle_dir>/compiled/<locale>.json (or .ts modules); returns the paths written"""
+    if module not in COMPILED_MODULES:
+        raise ValueError(f"Unknown module type '{module}', expected one of: {', '.join(COMPILED_MODULES)}")
+    out_dir = bundle_dir / COMPILED_DIRNAME
+    written = []
+
+    for catalog in compiled:
+        path = out_dir / f"{catalog.locale}.{module}"
+        messages = json.dumps(catalog.messages, ensure_ascii=False, separators=(",", ":"))
+        signatures = json.dumps(catalog.signatures, ensure_ascii=False, separators=(",", ":"))
+        if module == "json":
+            content = f'{{"locale":{json.dumps(catalog.locale)},"messages":{messages},"signatures":{signatures}}}'
+        else:
+            content = (
+                "// Generated by scripts/i18n-refactor-helper.py compile. Do not edit.\n"
+                "export interface MessageSignature {\n"
+                "  args?: Record<string, string>;\n"
+                "  arms?: Record<string, string[]>;\n"
+                "  tags?: string[];\n"
+                "}\n\n"
+                f"export const locale = {json.dumps(catalog.locale)};\n"
+                f"export const messages: Record<string, unknown> = {messages};\n"
+                f"export const signatures: Record<string, MessageSignature> = {signatures};\n"
+                "export default messages;\n"
+            )
+        if write_atomic(path, content.encode("utf-8")):
+            written.append(path)
+
+    return written
+
+
+def measure(data: Any) -> SizeEntry:
+    """Pretty-printed, minified, gzip (level 9) and brotli sizes of a JSON value"""
+    raw = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    content = minify(data)
+    return SizeEntry(
+        len(raw),
+        len(content),
+        len(gzip.compress(content, compresslevel=9, mtime=0)),
+        len(brotli.compress(content)) if brotli is not None else None,
+    )
+
+
+def size_report(
+    model: TranslationModel, fallback_locale: str = FALLBACK_LOCALE
+) -> Dict[str, Dict[str, SizeEntry]]:
+    """Sizes of the shipped (fallback-merged) payload per locale and namespace
+
+    Each locale maps namespace -> SizeEntry, plus TOTAL for the whole bundle.
+    """
+    fallback = model.catalog(fallback_locale).data
+    report = {}
+
+    for catalog in model.catalogs():
+        if catalog.locale == fallback_locale:
+            merged = catalog.data
+        else:
+            merged = merge_fallback(catalog.data, fallback)
+        sizes = {TOTAL: measure(merged)}
+        for namespace, value in sorted(split_namespaces(merged).items()):
+            sizes[namespace] = measure(value)
+        report[catalog.locale] = sizes
+
+    return report
+
+
+def report_to_json(report: Dict[str, Dict[str, SizeEntry]]) -> Dict[str, Any]:
+    return {
+        locale: {namespace: entry._asdict() for namespace, entry in sizes.items()}
+        for locale, sizes in report.items()
+    }
+
+
+def check_budget(
+    report: Dict[str, Dict[str, SizeEntry]], budget: Dict[str, Any]
+) -> List[str]:
+    """Return a message for every locale/namespace over its limit
+
+    Budget format: {"metric": "gzip", "limits": {"*": 8000, "pages.admin": 12000}}.
+    "*" applies to namespaces without their own limit; TOTAL may be limited too.
+    """
+    metric = budget.get("metric", "gzip")
+    if metric not in SIZE_METRICS:
+        raise ValueError(f"Unknown budget metric '{metric}', expected one of: {', '.join(SIZE_METRICS)}")
+    limits = budget.get("limits", {})
+    violations = []
+
+    for locale, sizes in report.items():
+        for namespace, entry in sizes.items():
+            limit = limits.get(namespace, limits.get("*") if namespace != TOTAL else None)
+            value = getattr(entry, metric)
+            if limit is not None and value is not None and value > limit:
+                violations.append(
+                    f"{locale} {namespace}: {value} {metric} bytes exceeds budget of {limit} (+{value - limit})"
+                )
+
+    return violations
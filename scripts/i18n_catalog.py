@@ -0,0 +1,809 @@
+"""
+Shared i18n catalog model
+Loads the language list and every translation file once per process so that
+all i18n scripts and commands reuse the same raw bytes, parsed trees and key sets.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from i18n_icu import ParityIssue, check_parity, message_signatures
+from i18n_profile import get_profiler
+
+# Script is in scripts/ directory, TS file path is relative to project root
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# I18N_LANGUAGE_CONFIG points the tools at another config (used by the benchmark harness)
+LANGUAGE_CONFIG_PATH = Path(
+    os.environ.get("I18N_LANGUAGE_CONFIG") or PROJECT_ROOT / "lib/config/language-config.ts"
+)
+MESSAGES_DIR = Path("messages")
+# Per-locale summaries keyed by content hash; bump the version when the summary layout changes
+CACHE_DIR = Path(".cache/i18n/v6")
+
+# One JSON token per match: whitespace, string, punctuation or a scalar literal
+JSON_TOKEN_PATTERN = re.compile(
+    r'(?P<ws>\s+)'
+    r'|(?P<str>"(?:[^"\\]|\\.)*")'
+    r'|(?P<punct>[{}\[\]:,])'
+    r'|(?P<num>-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?)'
+    r'|(?P<lit>true|false|null)'
+)
+_LITERALS = {"true": True, "false": False, "null": None}
+# Trie segments of a key path: dotted names and [i] list items
+_PATH_SEGMENT = re.compile(r"[^.\[]+|\[\d+\]")
+
+_languages_cache: Optional[List[str]] = None
+_model: Optional["TranslationModel"] = None
+
+
+class CatalogError(Exception):
+    """Raised when a translation file cannot be read or parsed"""
+
+
+def load_languages_from_ts(verbose: bool = True) -> List[str]:
+    """Load supported language list from lib/config/language-config.ts (parsed once per process)"""
+    global _languages_cache
+
+    if _languages_cache is None:
+        with get_profiler().phase("config"):
+            _languages_cache = _parse_language_config(LANGUAGE_CONFIG_PATH)
+        if _languages_cache and verbose:
+            print(f"✅ Loaded {len(_languages_cache)} languages: {', '.join(_languages_cache)}")
+
+    return list(_languages_cache)
+
+
+def _parse_language_config(ts_file_path: Path) -> List[str]:
+    """Extract language codes from the SUPPORTED_LANGUAGES object"""
+    if not ts_file_path.exists():
+        print(f"❌ Language config file not found at: {ts_file_path}", file=sys.stderr)
+        return []
+
+    try:
+        content = ts_file_path.read_text(encoding="utf-8")
+
+        # Find SUPPORTED_LANGUAGES object body (non-greedy match)
+        match = re.search(
+            r"export\s+const\s+SUPPORTED_LANGUAGES\s*=\s*{(.+?)}\s*as\s+const;",
+            content,
+            re.DOTALL,
+        )
+        if not match:
+            print("❌ Could not find SUPPORTED_LANGUAGES in the config file.", file=sys.stderr)
+            return []
+
+        obj_content = match.group(1)
+
+        # Match general language codes (supporting en, zh-Hans, es-419, sr-Latn-RS, etc.)
+        lang_codes = re.findall(
+            r"\s*['\"]([a-z]{2,3}(?:-[A-Za-z0-9]{2,8})*)['\"]\s*:",
+            obj_content,
+        )
+
+        if not lang_codes:
+            print("❌ No languages found in language-config.ts", file=sys.stderr)
+
+        return lang_codes
+
+    except Exception as e:
+        print(f"❌ Error reading or parsing {ts_file_path}: {e}", file=sys.stderr)
+        return []
+
+
+# Structural digest of every leaf value (strings, numbers, lists' items...)
+_LEAF_DIGEST = bytes(8)
+
+
+def _shape_digest(children: Dict[str, bytes]) -> bytes:
+    """Merkle digest of a node's key set from its children's digests (key order is ignored)"""
+    content = b"".join(name.encode("utf-8") + b"\0" + children[name] for name in sorted(children))
+    return hashlib.blake2b(content, digest_size=8).digest()
+
+
+class KeyNode:
+    """Trie node; `children` is None for leaf values
+
+    `digest` is a structural Merkle hash, computed on first use, so two nodes with
+    the same digest have the same key paths below them.
+    """
+
+    __slots__ = ("children", "_digest")
+
+    def __init__(self, children: Optional[Dict[str, "KeyNode"]] = None):
+        self.children = children
+        self._digest = _LEAF_DIGEST if children is None else None
+
+    @property
+    def digest(self) -> bytes:
+        if self._digest is None:
+            self._digest = _shape_digest({name: child.digest for name, child in self.children.items()})
+        return self._digest
+
+
+# Leaves carry no data, so every trie shares one leaf node
+_LEAF = KeyNode()
+
+
+def subtree_hashes(obj: Any) -> Dict[str, List[str]]:
+    """[structural hash, content hash] of every object and list in a message tree, by key path
+
+    Paths are in preorder ("" is the root, first). Structural hashes match
+    KeyNode.digest; content hashes change with any value or key order change
+    below the node, so they can serve as section ETags.
+    """
+    hashes: Dict[str, Any] = {}
+
+    def walk(value: Any, path: str) -> Tuple[bytes, str]:
+        # Reserve the slot so the parent precedes its children
+        hashes[path] = None
+        if isinstance(value, dict):
+            items = value.items()
+        else:
+            items = ((f"[{i}]", item) for i, item in enumerate(value))
+
+        shapes = {}
+        # Length-prefixed so that no two different trees serialise alike
+        parts = []
+        for name, child in items:
+            if isinstance(child, (dict, list)):
+                shapes[name], child_content = walk(child, _join_segment(path, name))
+                parts.append(f"{len(name)}:{name}o{child_content}")
+            else:
+                shapes[name] = _LEAF_DIGEST
+                text = child if isinstance(child, str) else json.dumps(child)
+                kind = "s" if isinstance(child, str) else "j"
+                parts.append(f"{len(name)}:{name}{kind}{len(text)}:{text}")
+        shape = _shape_digest(shapes)
+        content = hashlib.blake2b("".join(parts).encode("utf-8"), digest_size=8).hexdigest()
+        hashes[path] = [shape.hex(), content]
+        return shape, content
+
+    walk(obj, "")
+    return hashes
+
+
+def _join_segment(prefix: str, name: str) -> str:
+    if not prefix:
+        return name
+    return prefix + name if name.startswith("[") else f"{prefix}.{name}"
+
+
+class KeyTrie:
+    """Key paths stored as a trie of interned segments
+
+    Segment names are shared between locales through sys.intern and leaves share a
+    single node, so a deep key costs one small node instead of a full dotted string
+    per prefix. List items are `[i]` segments (`key[i]` in a path); they are walked
+    through but are not key paths themselves.
+    """
+
+    __slots__ = ("root",)
+
+    def __init__(self, root: KeyNode):
+        self.root = root
+
+    @classmethod
+    def from_tree(cls, obj: Any) -> "KeyTrie":
+        return cls(_node_from_tree(obj))
+
+    def paths(self, object_keys: bool = False, prefix: str = "") -> Iterator[str]:
+        """Yield every key path (object key paths only when `object_keys`)"""
+        stack = [(prefix, self.root)]
+        while stack:
+            prefix, node = stack.pop()
+            if not node.children:
+                continue
+            for name, child in node.children.items():
+                is_item = name.startswith("[")
+                if is_item and object_keys:
+                    continue
+                path = _join_segment(prefix, name)
+                if not is_item:
+                    yield path
+                stack.append((path, child))
+
+    def count(self, object_keys: bool = False) -> int:
+        total = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if not node.children:
+                continue
+            for name, child in node.children.items():
+                if name.startswith("["):
+                    if object_keys:
+                        continue
+                else:
+                    total += 1
+                stack.append(child)
+        return total
+
+    def __contains__(self, path: str) -> bool:
+        node = self.root
+        for name in _PATH_SEGMENT.findall(path):
+            if not node.children or name not in node.children:
+                return False
+            node = node.children[name]
+        return True
+
+    def difference(self, other: "KeyTrie") -> List[str]:
+        """Sorted paths present here but not in `other`, walking both tries in parallel
+
+        Subtrees with equal structural digests are skipped without being walked.
+        """
+        result: List[str] = []
+        if self.root.digest == other.root.digest:
+            return result
+        stack = [("", self.root, other.root)]
+        while stack:
+            prefix, node, other_node = stack.pop()
+            if not node.children:
+                continue
+            other_children = other_node.children or {}
+            for name, child in node.children.items():
+                path = _join_segment(prefix, name)
+                other_child = other_children.get(name)
+                if other_child is None:
+                    # The whole subtree is absent from `other`
+                    if not name.startswith("["):
+                        result.append(path)
+                    result.extend(KeyTrie(child).paths(prefix=path))
+                elif child.children and child.digest != other_child.digest:
+                    stack.append((path, child, other_child))
+        result.sort()
+        return result
+
+
+def _node_from_tree(obj: Any) -> KeyNode:
+    if isinstance(obj, dict):
+        return KeyNode({sys.intern(key): _node_from_tree(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return KeyNode({sys.intern(f"[{i}]"): _node_from_tree(item) for i, item in enumerate(obj)})
+    return _LEAF
+
+
+class KeyPosition(NamedTuple):
+    """Location of a key in a JSON file (1-based line and column of the key token)"""
+
+    path: str
+    value: Any
+    line: int
+    column: int
+
+
+def iter_key_positions(text: str) -> Iterator[KeyPosition]:
+    """Tokenize JSON text in a single pass, yielding every key path with its position
+
+    Paths are dotted, with list items as `key[i]`. Objects and lists are yielded
+    with a value of None; list items are located at their value token.
+    """
+    # Frame: [is_object, path, pending_key, key_line, key_column, list_index]
+    stack: List[list] = []
+    line = 1
+    line_start = 0
+    pos = 0
+    length = len(text)
+
+    while pos < length:
+        match = JSON_TOKEN_PATTERN.match(text, pos)
+        if match is None:
+            raise CatalogError(f"Unexpected character at line {line}, column {pos - line_start + 1}")
+        kind = match.lastgroup
+        token = match.group()
+        column = pos - line_start + 1
+        pos = match.end()
+
+        if kind == "ws":
+            newlines = token.count("\n")
+            if newlines:
+                line += newlines
+                line_start = match.start() + token.rindex("\n") + 1
+            continue
+
+        frame = stack[-1] if stack else None
+        if kind == "punct":
+            if token == ",":
+                if frame is not None and not frame[0]:
+                    frame[5] += 1
+            elif token in "}]":
+                stack.pop()
+            elif token == ":":
+                pass
+            else:
+                child = _child_path(frame, line, column)
+                if child is not None:
+                    yield KeyPosition(child[0], None, child[1], child[2])
+                stack.append([token == "{", child[0] if child else "", None, 0, 0, 0])
+            continue
+
+        if kind == "str":
+            value = token[1:-1] if "\\" not in token else json.loads(token)
+            if frame is not None and frame[0] and frame[2] is None:
+                frame[2], frame[3], frame[4] = value, line, column
+                continue
+        elif kind == "num":
+            value = json.loads(token)
+        else:
+            value = _LITERALS[token]
+
+        child = _child_path(frame, line, column)
+        if child is not None:
+            yield KeyPosition(child[0], value, child[1], child[2])
+
+
+def _child_path(frame: Optional[list], line: int, column: int) -> Optional[tuple]:
+    """Resolve the path and position of the value that starts inside `frame`"""
+    if frame is None:
+        return None
+    if frame[0]:
+        key = frame[2]
+        frame[2] = None
+        path = f"{frame[1]}.{key}" if frame[1] else key
+        return path, frame[3], frame[4]
+    return f"{frame[1]}[{frame[5]}]", line, column
+
+
+class LocaleCatalog:
+    """One translation file; every derived view is computed on first access"""
+
+    def __init__(self, locale: str, path: Path, cache_dir: Optional[Path] = None):
+        self.locale = locale
+        self.path = path
+        self.cache_dir = cache_dir
+
+    @cached_property
+    def raw(self) -> bytes:
+        """File content as read from disk"""
+        if not self.path.exists():
+            raise CatalogError(f"Translation file not found: {self.path}")
+        try:
+            with get_profiler().phase("read", self.locale):
+                return self.path.read_bytes()
+        except OSError as e:
+            raise CatalogError(f"Error loading {self.path}: {e}") from e
+
+    @cached_property
+    def text(self) -> str:
+        return self.raw.decode("utf-8")
+
+    @cached_property
+    def data(self) -> Dict[str, Any]:
+        """Parsed JSON tree"""
+        try:
+            with get_profiler().phase("decode", self.locale):
+                return json.loads(self.text)
+        except json.JSONDecodeError as e:
+            raise CatalogError(f"Invalid JSON in {self.path}: {e}") from e
+
+    @cached_property
+    def digest(self) -> str:
+        return hashlib.sha256(self.raw).hexdigest()
+
+    @cached_property
+    def summary(self) -> Dict[str, Any]:
+        """Line count, key counts, structural digest and ICU message signatures
+
+        Served from the on-disk cache when the content is unchanged. Only data that
+        costs more to derive than the file costs to parse is cached; key paths come
+        from the parsed tree.
+        """
+        profiler = get_profiler()
+        with profiler.phase("cache", self.locale):
+            cached = self._read_cached_summary()
+        if cached is not None:
+            return cached
+
+        with profiler.phase("flatten", self.locale):
+            raw = self.raw
+            trie = KeyTrie.from_tree(self.data)
+            summary = {
+                "line_count": raw.count(b"\n") + (1 if raw and not raw.endswith(b"\n") else 0),
+                "key_count": trie.count(),
+                "object_key_count": trie.count(object_keys=True),
+                "shape_digest": trie.root.digest.hex(),
+                "placeholders": message_signatures(self.data),
+            }
+            self.__dict__["trie"] = trie
+        with profiler.phase("cache", self.locale):
+            self._write_cached_summary(summary)
+        return summary
+
+    @property
+    def loaded(self) -> bool:
+        return "summary" in self.__dict__
+
+    def adopt_summary(self, summary: Dict[str, Any]) -> None:
+        """Use a summary computed elsewhere (e.g. in a worker process)"""
+        self.__dict__["summary"] = summary
+
+    @cached_property
+    def line_count(self) -> int:
+        """Line count, matching len(f.readlines())"""
+        return self.summary["line_count"]
+
+    def key_count(self, object_keys: bool = False) -> int:
+        """Number of key paths (object key paths only when `object_keys`)"""
+        return self.summary["object_key_count" if object_keys else "key_count"]
+
+    @cached_property
+    def shape_digest(self) -> str:
+        """Structural digest of the whole file; equal digests mean equal key paths"""
+        return self.summary["shape_digest"]
+
+    @cached_property
+    def trie(self) -> KeyTrie:
+        """Key index used for diffs without materialising path strings"""
+        data = self.data
+        with get_profiler().phase("index", self.locale):
+            return KeyTrie.from_tree(data)
+
+    @cached_property
+    def placeholders(self) -> Dict[str, Dict[str, Any]]:
+        """ICU signature of every message with arguments or tags (see i18n_icu)"""
+        return self.summary["placeholders"]
+
+    @cached_property
+    def hashes(self) -> Dict[str, List[str]]:
+        """[structural hash, content hash] of every object and list, by key path (see subtree_hashes)"""
+        with get_profiler().phase("hash", self.locale):
+            return subtree_hashes(self.data)
+
+    @cached_property
+    def keys(self) -> Set[str]:
+        """Object key paths only (list items are treated as leaf values)"""
+        return set(self.trie.paths(object_keys=True))
+
+    @cached_property
+    def positions(self) -> Dict[str, KeyPosition]:
+        """Exact position of every key path, built with one tokenizer pass"""
+        return {position.path: position for position in iter_key_positions(self.text)}
+
+    def line_of(self, path: str) -> Optional[int]:
+        position = self.positions.get(path)
+        return position.line if position else None
+
+    def _cache_file(self) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{self.locale}-{self.digest}.json"
+
+    def _read_cached_summary(self) -> Optional[Dict[str, Any]]:
+        cache_file = self._cache_file()
+        if cache_file is None or not cache_file.exists():
+            return None
+        try:
+            summary = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return summary
+
+    def _write_cached_summary(self, summary: Dict[str, Any]) -> None:
+        """Store the summary and drop entries for older revisions of this locale (best effort)"""
+        cache_file = self._cache_file()
+        if cache_file is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in self.cache_dir.glob(f"{self.locale}-{'[0-9a-f]' * 64}.json"):
+                stale.unlink()
+            write_atomic(cache_file, json.dumps(summary, ensure_ascii=False).encode("utf-8"))
+        except OSError:
+            pass
+
+
+class KeyDiff(NamedTuple):
+    """Key paths a locale lacks or adds relative to a baseline, sorted"""
+
+    missing: List[str]
+    extra: List[str]
+
+    def object_keys(self) -> "KeyDiff":
+        """Restrict the diff to object key paths, matching LocaleCatalog.keys"""
+        return KeyDiff(
+            [path for path in self.missing if "[" not in path],
+            [path for path in self.extra if "[" not in path],
+        )
+
+
+def diff_tries(base: KeyTrie, current: KeyTrie) -> KeyDiff:
+    return KeyDiff(base.difference(current), current.difference(base))
+
+
+def diff_catalogs(base: LocaleCatalog, current: LocaleCatalog) -> KeyDiff:
+    """Key diff of two locales; neither trie is built when their structural digests match"""
+    if base.shape_digest == current.shape_digest:
+        return KeyDiff([], [])
+    return diff_tries(base.trie, current.trie)
+
+
+class KeyCoverage:
+    """Locale x key presence matrix over interned key paths
+
+    Every distinct path gets an integer ID (in sorted path order, so bit order is
+    output order). Each locale row is a bitset stored as a Python int built from a
+    bytearray, and each key column is a small locale bitmask, so baseline diffs and
+    "missing in which locales" queries are bitwise operations.
+    """
+
+    def __init__(self, locales: List[str], path_sets: List[Set[str]]):
+        self.locales = list(locales)
+        self.paths: List[str] = sorted(set().union(*path_sets)) if path_sets else []
+        self.ids: Dict[str, int] = {path: i for i, path in enumerate(self.paths)}
+        self.full_mask = (1 << len(self.locales)) - 1
+
+        self.rows: Dict[str, int] = {}
+        self.columns: List[int] = [0] * len(self.paths)
+        for index, (locale, paths) in enumerate(zip(self.locales, path_sets)):
+            bits = bytearray((len(self.paths) + 7) // 8)
+            locale_bit = 1 << index
+            for path in paths:
+                key_id = self.ids[path]
+                bits[key_id >> 3] |= 1 << (key_id & 7)
+                self.columns[key_id] |= locale_bit
+            self.rows[locale] = int.from_bytes(bits, "little")
+
+    def paths_of(self, mask: int) -> List[str]:
+        """Key paths whose bits are set in a row-shaped mask, in sorted order"""
+        paths = self.paths
+        result = []
+        for byte_index, byte in enumerate(mask.to_bytes((len(paths) + 7) // 8, "little")):
+            while byte:
+                low = byte & -byte
+                result.append(paths[(byte_index << 3) + low.bit_length() - 1])
+                byte ^= low
+        return result
+
+    def count(self, locale: str) -> int:
+        return bin(self.rows[locale]).count("1")
+
+    def diff(self, locale: str, base_lang: str) -> KeyDiff:
+        row, base_row = self.rows[locale], self.rows[base_lang]
+        return KeyDiff(self.paths_of(base_row & ~row), self.paths_of(row & ~base_row))
+
+    def incomplete(self) -> Dict[str, List[str]]:
+        """Every key that is absent from at least one locale, mapped to those locales"""
+        result = {}
+        for key_id, column in enumerate(self.columns):
+            missing = self.full_mask & ~column
+            if missing:
+                result[self.paths[key_id]] = [
+                    locale for index, locale in enumerate(self.locales) if missing >> index & 1
+                ]
+        return result
+
+
+def _process_locale(
+    args: Tuple[str, Path, Optional[Path], Optional[KeyTrie]]
+) -> Tuple[Dict[str, Any], Optional[KeyDiff]]:
+    """Worker: load and flatten one locale, then diff it against the baseline trie if given"""
+    locale, path, cache_dir, base_trie = args
+    catalog = LocaleCatalog(locale, path, cache_dir)
+    summary = catalog.summary
+    diff = diff_tries(base_trie, catalog.trie) if base_trie is not None else None
+    return summary, diff
+
+
+def write_atomic(path: Path, content: bytes) -> bool:
+    """Write `content` via a temporary file and rename; returns False when the file was already identical"""
+    if path.exists() and path.read_bytes() == content:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return True
+
+
+def canonical_json(data: Any) -> bytes:
+    """Canonical on-disk form of a messages file: 2-space indent, UTF-8, trailing newline"""
+    return (json.dumps(data, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
+# Prefix for values filled from the baseline by `sync --fill marker`
+SYNC_MARKER = "[MISSING] "
+_ABSENT = object()
+
+
+class SyncResult(NamedTuple):
+    data: Dict[str, Any]
+    filled: List[str]
+    pruned: List[str]
+    # Objects whose key order was changed to match the baseline
+    reordered: List[str]
+
+
+def sync_tree(base: Dict[str, Any], target: Dict[str, Any], marker: Optional[str] = None) -> SyncResult:
+    """Rebuild `target` in one walk so its keys exactly match `base`, in base order
+
+    Extra keys are dropped, missing keys (or values whose object/leaf kind differs)
+    are filled with the baseline value, prefixed with `marker` for strings when given.
+    """
+    filled: List[str] = []
+    pruned: List[str] = []
+    reordered: List[str] = []
+
+    def fill(value: Any) -> Any:
+        if marker and isinstance(value, str):
+            return f"{marker}{value}"
+        return value
+
+    def walk(base_node: Dict[str, Any], node: Dict[str, Any], prefix: str) -> Dict[str, Any]:
+        result = {}
+        for key, base_value in base_node.items():
+            path = f"{prefix}.{key}" if prefix else key
+            value = node.get(key, _ABSENT)
+            if isinstance(base_value, dict):
+                if isinstance(value, dict):
+                    result[key] = walk(base_value, value, path)
+                else:
+                    filled.append(path)
+                    result[key] = walk(base_value, {}, path)
+            elif value is _ABSENT or isinstance(value, dict):
+                filled.append(path)
+                result[key] = fill(base_value)
+            else:
+                result[key] = value
+        kept = [key for key in node if key in base_node]
+        if kept != [key for key in base_node if key in node]:
+            reordered.append(prefix)
+        pruned.extend(f"{prefix}.{key}" if prefix else key for key in node if key not in base_node)
+        return result
+
+    data = walk(base, target, "")
+    return SyncResult(data, filled, sorted(pruned), reordered)
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Normalize a --jobs value; 0 means one worker per CPU"""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+class TranslationModel:
+    """In-memory view of all translation files for the configured languages"""
+
+    def __init__(
+        self,
+        languages: List[str],
+        messages_dir: Path = MESSAGES_DIR,
+        cache_dir: Optional[Path] = CACHE_DIR,
+    ):
+        self.languages = languages
+        self.messages_dir = messages_dir
+        self.cache_dir = cache_dir
+        self._catalogs: Dict[str, LocaleCatalog] = {}
+        self._diffs: Dict[str, Dict[str, KeyDiff]] = {}
+
+    def catalog(self, lang: str) -> LocaleCatalog:
+        if lang not in self._catalogs:
+            self._catalogs[lang] = LocaleCatalog(
+                lang, self.messages_dir / f"{lang}.json", self.cache_dir
+            )
+        return self._catalogs[lang]
+
+    def catalogs(self) -> List[LocaleCatalog]:
+        return [self.catalog(lang) for lang in self.languages]
+
+    def use_content(self, lang: str, raw: bytes) -> LocaleCatalog:
+        """Serve `lang` from `raw` (e.g. a staged git blob) instead of its file"""
+        self.invalidate(lang)
+        catalog = self.catalog(lang)
+        catalog.__dict__["raw"] = raw
+        return catalog
+
+    def translations(self) -> Dict[str, Dict[str, Any]]:
+        """Parsed trees for all languages; raises CatalogError on the first failure"""
+        return {catalog.locale: catalog.data for catalog in self.catalogs()}
+
+    def preload(self, jobs: int = 1) -> None:
+        """Load and flatten every locale, spreading the work over `jobs` processes"""
+        self._run_pool([c for c in self.catalogs() if not c.loaded], None, jobs)
+
+    def diff_against(self, base_lang: str, jobs: int = 1) -> Dict[str, KeyDiff]:
+        """Diff every other locale against `base_lang`, in configured language order
+
+        Locales that are not loaded yet are loaded, flattened and diffed in the
+        same worker task when `jobs` > 1.
+        """
+        if base_lang in self._diffs:
+            return self._diffs[base_lang]
+
+        base = self.catalog(base_lang)
+        others = [c for c in self.catalogs() if c.locale != base_lang]
+        pending = [c for c in others if not c.loaded]
+        diffs = self._run_pool(pending, base, jobs)
+
+        result = {}
+        for catalog in others:
+            if catalog.locale not in diffs:
+                with get_profiler().phase("diff", catalog.locale):
+                    diffs[catalog.locale] = diff_catalogs(base, catalog)
+            result[catalog.locale] = diffs[catalog.locale]
+        self._diffs[base_lang] = result
+        return result
+
+    def placeholder_parity(
+        self, base_lang: str, langs: Optional[List[str]] = None
+    ) -> Dict[str, List[ParityIssue]]:
+        """ICU signature issues of every locale (or `langs`) against `base_lang`, from the cached summaries"""
+        selected = self.languages if langs is None else [base_lang] + [lang for lang in langs if lang != base_lang]
+        catalogs = [self.catalog(lang) for lang in selected]
+        signatures = {c.locale: c.placeholders for c in catalogs}
+        # Locales with the baseline's structure share its key paths, so their tries are never built
+        base = self.catalog(base_lang)
+        paths = {c.locale: base.trie if c.shape_digest == base.shape_digest else c.trie for c in catalogs}
+        with get_profiler().phase("parity"):
+            return check_parity(signatures, paths, base_lang)
+
+    def _run_pool(
+        self, pending: List[LocaleCatalog], base: Optional[LocaleCatalog], jobs: int
+    ) -> Dict[str, KeyDiff]:
+        """Compute summaries (and diffs against `base`) for `pending`, storing summaries on the catalogs"""
+        jobs = resolve_jobs(jobs)
+        diffs = {}
+        if jobs <= 1 or len(pending) <= 1:
+            for catalog in pending:
+                catalog.summary
+            return diffs
+
+        # Only parallel runs pay for importing the process pool machinery
+        from concurrent.futures import ProcessPoolExecutor
+
+        base_trie = base.trie if base is not None else None
+        tasks = [(c.locale, c.path, c.cache_dir, base_trie) for c in pending]
+        # Worker time is not broken down by phase; profile with --jobs 1 for that
+        with get_profiler().phase("pool"), ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+            # map() yields in submission order, so the merge is deterministic
+            for catalog, (summary, diff) in zip(pending, pool.map(_process_locale, tasks)):
+                catalog.adopt_summary(summary)
+                if diff is not None:
+                    diffs[catalog.locale] = diff
+        return diffs
+
+    def invalidate(self, lang: str) -> None:
+        """Drop the cached views of a file after it has been rewritten"""
+        self._catalogs.pop(lang, None)
+        self._diffs.clear()
+
+
+def get_option(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Read a `--name value` or `--name=value` command line option"""
+    for i, arg in enumerate(sys.argv):
+        if arg == name and i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+        if arg.startswith(f"{name}="):
+            return arg.split("=", 1)[1]
+    return default
+
+
+def get_jobs_option() -> int:
+    """Parse --jobs N (default 1, 0 = all CPUs)"""
+    value = get_option("--jobs", "1")
+    try:
+        return int(value)
+    except ValueError:
+        print(f"❌ Invalid --jobs value: {value}", file=sys.stderr)
+        sys.exit(1)
+
+
+def get_model(verbose: bool = True, use_cache: bool = True) -> TranslationModel:
+    """Return the process-wide translation model"""
+    global _model
+
+    if _model is None:
+        _model = TranslationModel(
+            load_languages_from_ts(verbose=verbose),
+            cache_dir=CACHE_DIR if use_cache else None,
+        )
+    return _model
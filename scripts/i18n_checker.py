@@ -0,0 +1,1088 @@
+"""
+i18n consistency checker
+The checks and maintenance commands behind i18n-refactor-helper.py. They live in
+an importable module so Python caches their bytecode; a script run directly is
+recompiled on every run.
+"""
+
+import json
+import sys
+from typing import Dict, Set, List, Any, Optional
+from pathlib import Path
+
+from i18n_catalog import (
+    CatalogError,
+    KeyCoverage,
+    KeyDiff,
+    SYNC_MARKER,
+    canonical_json,
+    diff_catalogs,
+    get_model,
+    sync_tree,
+    write_atomic,
+)
+from i18n_report import Finding, ReportWriter
+
+# Feature modules (bundles, git, translate, watch...) are imported by the commands
+# that use them, so the checks run on every commit do not pay for their imports
+
+SIZE_BASELINE_PATH = ".cache/i18n/size-baseline.json"
+# Default pack file name, inside messages/.build
+PACK_FILENAME = "catalogs.pack.json"
+
+
+class I18nConsistencyChecker:
+    def __init__(self, use_cache: bool = True, jobs: int = 1):
+        self.model = get_model(verbose=True, use_cache=use_cache)
+        self.jobs = jobs
+        self.languages = self.model.languages
+        if not self.languages:
+            print("❌ Error: Could not load languages from config file. Aborting.", file=sys.stderr)
+            sys.exit(1)
+            
+        self.messages_dir = self.model.messages_dir
+        # Structured report selected with --report-format; per-key console lines are skipped when set
+        self.reporter: Optional[ReportWriter] = None
+
+    def get_all_keys(self, lang: str) -> Set[str]:
+        """Get all key paths of a language (flattened once per process)"""
+        return self.model.catalog(lang).keys
+    
+    def key_count(self, lang: str) -> int:
+        """Count key paths of a language from its key trie"""
+        return self.model.catalog(lang).key_count(object_keys=True)
+    
+    def find_key_line_number(self, lang: str, key_path: str) -> Optional[int]:
+        """Find the exact line number of a key path in a language file"""
+        try:
+            return self.model.catalog(lang).line_of(key_path)
+        except CatalogError:
+            return None
+    
+    def record(self, lang: str, key: str, kind: str, message: str, file_lang: Optional[str] = None) -> None:
+        """Add a finding to the structured report, located in the file of `file_lang` (default `lang`)"""
+        if self.reporter is None:
+            return
+        catalog = self.model.catalog(file_lang or lang)
+        position = catalog.positions.get(key)
+        self.reporter.add(Finding(
+            lang, key, kind, message, catalog.path.as_posix(),
+            position.line if position else None, position.column if position else None,
+        ))
+    
+    def record_diffs(self, diffs: Dict[str, KeyDiff], base_lang: str) -> None:
+        """Report every missing key (at its baseline position) and extra key"""
+        if self.reporter is None:
+            return
+        for lang, (missing_keys, extra_keys) in diffs.items():
+            for key in missing_keys:
+                self.record(lang, key, "missing-key", f"{lang} is missing '{key}' (defined in {base_lang})", base_lang)
+            for key in extra_keys:
+                self.record(lang, key, "extra-key", f"'{key}' in {lang} does not exist in {base_lang}")
+    
+    def load_translation_files(self) -> Optional[Dict[str, Dict]]:
+        """Load all translation files"""
+        try:
+            return self.model.translations()
+        except CatalogError as e:
+            print(f"❌ {e}")
+            return None
+
+    def load_summaries(self) -> bool:
+        """Load key sets and line counts, parsing only files whose content hash is not cached"""
+        try:
+            self.model.preload(self.jobs)
+        except CatalogError as e:
+            print(f"❌ {e}")
+            return False
+        return True
+
+    def key_diffs(self, base_lang: str) -> Optional[Dict[str, KeyDiff]]:
+        """Missing/extra object keys of every other language against a baseline"""
+        if base_lang not in self.languages:
+            print(f"❌ Baseline language '{base_lang}' not found")
+            return None
+        try:
+            diffs = self.model.diff_against(base_lang, self.jobs)
+        except CatalogError as e:
+            print(f"❌ {e}")
+            return None
+        return {lang: diff.object_keys() for lang, diff in diffs.items()}
+
+    def detect_missing_keys(self) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """Detect missing keys, return details including line number"""
+        print("🔍 Detecting missing keys...")
+        
+        # Use Chinese as the base to check other languages
+        base_lang = 'zh-CN'
+        diffs = self.key_diffs(base_lang)
+        if diffs is None:
+            return None
+        
+        self.record_diffs(diffs, base_lang)
+        missing_info = {}
+        has_missing = False
+        
+        for lang, diff in diffs.items():
+            missing_keys, extra_keys = diff
+            
+            if missing_keys:
+                has_missing = True
+                missing_info[lang] = []
+                
+                print(f"\n❌ {lang} missing {len(missing_keys)} keys:")
+                
+                for key in missing_keys if self.reporter is None else ():
+                    # Get line number
+                    line_num = self.find_key_line_number(base_lang, key)
+                    
+                    print(f"    📍 {key} (line {line_num if line_num else 'unknown'})")
+            
+            if extra_keys:
+                has_missing = True
+                print(f"\n❌ {lang} has {len(extra_keys)} extra keys:")
+                for key in extra_keys if self.reporter is None else ():
+                    line_num = self.find_key_line_number(lang, key)
+                    print(f"    ➕ {key} (line {line_num if line_num else 'unknown'})")
+            
+            if not missing_keys and not extra_keys:
+                print(f"✅ {lang} has consistent keys")
+        
+        return missing_info if has_missing else None
+
+    def validate_consistency(self, silent: bool = False) -> bool:
+        """Validate translation file consistency"""
+        if not silent:
+            print("🔍 Validating translation file consistency...")
+        
+        # Use Chinese as the base to check other languages
+        base_lang = 'zh-CN'
+        diffs = self.key_diffs(base_lang)
+        if diffs is None:
+            return False
+        self.record_diffs(diffs, base_lang)
+        
+        # Validate line count consistency
+        line_counts = {}
+        for lang in self.languages:
+            line_counts[lang] = self.model.catalog(lang).line_count
+            if self.reporter is not None and line_counts[lang] != self.model.catalog(base_lang).line_count:
+                self.reporter.add(Finding(
+                    lang, "", "line-count",
+                    f"{lang} has {line_counts[lang]} lines, {base_lang} has {self.model.catalog(base_lang).line_count}",
+                    self.model.catalog(lang).path.as_posix(), line_counts[lang], 1,
+                ))
+        
+        if not silent:
+            print("📊 File line counts:")
+            for lang, count in line_counts.items():
+                print(f"  {lang}: {count} lines")
+        
+        unique_counts = set(line_counts.values())
+        if len(unique_counts) != 1:
+            print("❌ File line counts are inconsistent")
+            return False
+        
+        # Validate structure consistency
+        if not silent:
+            print("🔧 Structure key counts:")
+            for lang in self.languages:
+                print(f"  {lang}: {self.key_count(lang)} keys")
+        
+        inconsistent = False
+        for lang, (missing_keys, extra_keys) in diffs.items():
+            if missing_keys or extra_keys:
+                if not silent:
+                    print(f"❌ {lang} structure is inconsistent:")
+                    if missing_keys:
+                        print(f"    Missing {len(missing_keys)} keys")
+                    if extra_keys:
+                        print(f"    Extra {len(extra_keys)} keys")
+                inconsistent = True
+            elif not silent:
+                print(f"✅ {lang} structure is consistent")
+        
+        return not inconsistent
+
+    def check_placeholders(
+        self, base_lang: str = 'en-US', silent: bool = False, langs: Optional[List[str]] = None
+    ) -> bool:
+        """Compare ICU arguments, select arms and tags of every message against the baseline"""
+        if base_lang not in self.languages:
+            print(f"❌ Baseline language '{base_lang}' not found")
+            return False
+        if not silent:
+            print(f"🧮 Checking message placeholders against {base_lang}...")
+        
+        try:
+            issues = self.model.placeholder_parity(base_lang, langs)
+        except CatalogError as e:
+            print(f"❌ {e}")
+            return False
+        
+        for lang, lang_issues in issues.items():
+            for issue in lang_issues:
+                kind = "invalid-icu" if issue.kind == "invalid" else "placeholder-mismatch"
+                self.record(lang, issue.path, kind, issue.message)
+            if lang_issues:
+                print(f"❌ {lang} has {len(lang_issues)} placeholder issues")
+                if not silent:
+                    for issue in lang_issues:
+                        print(f"    {issue.path}: {issue.message}")
+            elif not silent:
+                print(f"✅ {lang} placeholders match")
+        
+        return not any(issues.values())
+
+    def quick_check(self) -> bool:
+        """Quick check (silent mode)"""
+        keys_ok = self.validate_consistency(silent=True)
+        placeholders_ok = self.check_placeholders(silent=True)
+        return keys_ok and placeholders_ok
+
+    def quick_check_staged(self) -> bool:
+        """Quick check of exactly what is staged: only changed locales, read from the git index"""
+        from i18n_git import CatFile, read_staged, staged_locales
+        
+        base_lang = 'zh-CN'
+        parity_lang = 'en-US'
+        try:
+            changed, deleted = staged_locales(self.messages_dir)
+        except CatalogError as e:
+            print(f"❌ {e}")
+            return False
+        
+        deleted = [lang for lang in deleted if lang in self.languages]
+        for lang in deleted:
+            print(f"❌ {lang} is a configured language but its file is staged for deletion")
+        changed = [lang for lang in self.languages if lang in changed]
+        if not changed:
+            if not deleted:
+                print("✅ No staged translation files")
+            return not deleted
+        
+        # A staged baseline change affects every locale
+        if base_lang in changed or parity_lang in changed:
+            checked = list(self.languages)
+        else:
+            checked = changed
+        needed = [lang for lang in self.languages if lang in checked or lang in (base_lang, parity_lang)]
+        try:
+            with CatFile() as cat_file:
+                contents = read_staged(cat_file, needed, self.messages_dir)
+        except CatalogError as e:
+            print(f"❌ {e}")
+            return False
+        for lang, raw in contents.items():
+            self.model.use_content(lang, raw)
+        
+        try:
+            base = self.model.catalog(base_lang)
+            diffs = {
+                lang: diff_catalogs(base, self.model.catalog(lang))
+                for lang in checked if lang != base_lang
+            }
+        except CatalogError as e:
+            print(f"❌ {e}")
+            return False
+        self.record_diffs(diffs, base_lang)
+        
+        consistent = not deleted
+        for lang, (missing_keys, extra_keys) in diffs.items():
+            catalog = self.model.catalog(lang)
+            if missing_keys or extra_keys:
+                print(f"❌ {lang} structure is inconsistent: {len(missing_keys)} missing, {len(extra_keys)} extra keys")
+                consistent = False
+            if catalog.line_count != base.line_count:
+                print(f"❌ {lang} has {catalog.line_count} lines, {base_lang} has {base.line_count}")
+                self.record(lang, "", "line-count", f"{lang} has {catalog.line_count} lines, "
+                            f"{base_lang} has {base.line_count}")
+                consistent = False
+        
+        placeholders_ok = self.check_placeholders(base_lang=parity_lang, silent=True, langs=checked)
+        if consistent and placeholders_ok:
+            print(f"✅ Staged locales checked: {', '.join(changed)}")
+        return consistent and placeholders_ok
+    
+    def compare_keys(self, show_details: bool = False) -> bool:
+        """Compare key counts against English baseline with numerical differences"""
+        print("🔍 Comparing translation key counts against English baseline...")
+        
+        # Use English as baseline
+        baseline_lang = 'en-US'
+        diffs = self.key_diffs(baseline_lang)
+        if diffs is None:
+            return False
+        self.record_diffs(diffs, baseline_lang)
+            
+        # Get key counts for each language
+        key_counts = {}
+        for lang in self.languages:
+            key_counts[lang] = self.key_count(lang)
+        
+        baseline_count = key_counts[baseline_lang]
+        
+        print(f"📊 Key count comparison (baseline: {baseline_lang} with {baseline_count} keys):")
+        print()
+        
+        has_inconsistencies = False
+        results = []
+        
+        for lang in sorted(key_counts.keys()):
+            current_count = key_counts[lang]
+            difference = current_count - baseline_count
+            
+            # Calculate missing and extra keys
+            if lang != baseline_lang:
+                missing_count = len(diffs[lang].missing)
+                extra_count = len(diffs[lang].extra)
+                
+                if missing_count > 0 or extra_count > 0:
+                    has_inconsistencies = True
+            else:
+                missing_count = 0
+                extra_count = 0
+            
+            # Format the difference display
+            if difference == 0:
+                diff_display = "0"
+                status_emoji = "✅"
+            elif difference > 0:
+                diff_display = f"+{difference}"
+                status_emoji = "⚠️ "
+            else:
+                diff_display = str(difference)
+                status_emoji = "❌"
+            
+            results.append({
+                'lang': lang,
+                'count': current_count,
+                'diff': difference,
+                'diff_display': diff_display,
+                'status_emoji': status_emoji,
+                'missing_count': missing_count,
+                'extra_count': extra_count
+            })
+            
+            print(f"  {status_emoji} {lang:<8} {current_count:>4} keys ({diff_display})")
+        
+        if show_details and has_inconsistencies:
+            print("\n📝 Detailed breakdown:")
+            for result in results:
+                if result['lang'] == baseline_lang:
+                    continue
+                    
+                if result['missing_count'] > 0 or result['extra_count'] > 0:
+                    print(f"\n  {result['lang']}:")
+                    if result['missing_count'] > 0:
+                        print(f"    ❌ Missing: {result['missing_count']} keys")
+                    if result['extra_count'] > 0:
+                        print(f"    ➕ Extra: {result['extra_count']} keys")
+        
+        return not has_inconsistencies
+    
+    def show_coverage(self, baseline_lang: str = 'en-US', show_details: bool = False) -> bool:
+        """Print the language x key coverage matrix summary against any baseline"""
+        print(f"🔍 Building key coverage matrix (baseline: {baseline_lang})...")
+        
+        if baseline_lang not in self.languages:
+            print(f"❌ Baseline language '{baseline_lang}' not found")
+            return False
+        if not self.load_summaries():
+            return False
+        
+        coverage = KeyCoverage(self.languages, [self.get_all_keys(lang) for lang in self.languages])
+        total = len(coverage.paths)
+        incomplete = coverage.incomplete()
+        
+        base_total = coverage.count(baseline_lang)
+        
+        print(f"📊 {total} unique keys across {len(self.languages)} languages, "
+              f"{total - len(incomplete)} present everywhere, {base_total} in {baseline_lang}:")
+        print()
+        print(f"     {'lang':<8} {'keys':>6} {'coverage':>9} {'missing':>8} {'extra':>6}")
+        consistent = True
+        for lang in self.languages:
+            # Coverage counts only the baseline's keys; extra keys are listed separately
+            missing, extra = coverage.diff(lang, baseline_lang)
+            consistent = consistent and not missing and not extra
+            status_emoji = "✅" if not missing and not extra else "❌"
+            percent = 100.0 * (base_total - len(missing)) / base_total if base_total else 100.0
+            print(f"  {status_emoji} {lang:<8} {coverage.count(lang):>6} {percent:>8.2f}% "
+                  f"{len(missing):>8} {len(extra):>6}")
+        
+        if show_details and incomplete:
+            print("\n📝 Keys missing in some languages:")
+            for key, langs in incomplete.items():
+                print(f"    {key}: {', '.join(langs)}")
+        
+        return consistent
+    
+    def remove_extra_keys(self, dry_run: bool = False) -> bool:
+        """Remove extra keys that don't exist in English baseline"""
+        print("🧹 Removing extra keys not present in English baseline...")
+        
+        # Diff against baseline keys (English)
+        baseline_lang = 'en-US'
+        diffs = self.key_diffs(baseline_lang)
+        if diffs is None:
+            return False
+        
+        removed_count = 0
+        processed_files = []
+        
+        for lang, diff in diffs.items():
+            extra_keys = diff.extra
+            
+            if not extra_keys:
+                print(f"✅ {lang}: No extra keys to remove")
+                continue
+            
+            print(f"🔍 {lang}: Found {len(extra_keys)} extra keys")
+            if not dry_run:
+                # Edit the already parsed tree in place
+                file_path = self.model.catalog(lang).path
+                try:
+                    data = self.model.catalog(lang).data
+                    
+                    # Remove extra keys
+                    for key_path in sorted(extra_keys):
+                        keys = key_path.split('.')
+                        current_obj = data
+                        
+                        # Navigate to parent object
+                        for key in keys[:-1]:
+                            if isinstance(current_obj, dict) and key in current_obj:
+                                current_obj = current_obj[key]
+                            else:
+                                break
+                        else:
+                            # Remove the key if parent exists
+                            if isinstance(current_obj, dict) and keys[-1] in current_obj:
+                                del current_obj[keys[-1]]
+                                removed_count += 1
+                                print(f"    ❌ Removed: {key_path}")
+                    
+                    # Write back the file
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        json.dump(data, f, ensure_ascii=False, indent=2)
+                        f.write('\n')  # Add trailing newline
+                    self.model.invalidate(lang)
+                    
+                    processed_files.append(lang)
+                    
+                except Exception as e:
+                    print(f"❌ Error processing {lang}: {e}")
+                    return False
+            else:
+                print(f"    🔍 Would remove {len(extra_keys)} keys:")
+                for key_path in extra_keys:
+                    print(f"      - {key_path}")
+        
+        if dry_run:
+            print(f"\n🔍 Dry run completed. Would process {len(diffs)} files")
+        else:
+            if processed_files:
+                print(f"\n✅ Successfully processed {len(processed_files)} files, removed {removed_count} extra keys")
+                print("📝 Processed files:", ", ".join(processed_files))
+            else:
+                print("\n✅ No files needed processing")
+        
+        return True
+
+    def build_message_bundles(self, show_details: bool = False) -> bool:
+        """Write pre-merged bundles, per-namespace bundles and their manifest"""
+        from i18n_bundles import BUNDLE_DIR, MANIFEST_FILENAME, build_bundles
+        
+        print(f"📦 Building pre-merged message bundles in {BUNDLE_DIR}...")
+        
+        try:
+            results = build_bundles(self.model)
+        except (CatalogError, OSError) as e:
+            print(f"❌ {e}")
+            return False
+        
+        for result in results:
+            status = "written" if result.written else "unchanged"
+            print(f"  ✅ {result.locale:<8} {result.size:>8} bytes, "
+                  f"{len(result.namespaces)} namespaces ({status})")
+            if show_details:
+                for name, entry in sorted(result.namespaces.items(), key=lambda item: -item[1].bytes):
+                    print(f"      {name:<32} {entry.bytes:>8} bytes  {entry.hash}")
+        
+        print(f"\n✅ Built {len(results)} bundles, manifest: {BUNDLE_DIR / MANIFEST_FILENAME}")
+        return True
+
+    def build_hash_index(self, baseline_lang: str = 'en-US', show_details: bool = False) -> bool:
+        """Write the subtree hash index and show which sections differ in structure from the baseline"""
+        from i18n_bundles import BUNDLE_DIR, HASH_INDEX_FILENAME, write_hash_index
+        
+        if baseline_lang not in self.languages:
+            print(f"❌ Baseline language '{baseline_lang}' not found")
+            return False
+        print(f"🌳 Indexing subtree hashes into {BUNDLE_DIR / HASH_INDEX_FILENAME}...")
+        
+        try:
+            write_hash_index(self.model)
+            base_hashes = self.model.catalog(baseline_lang).hashes
+        except (CatalogError, OSError) as e:
+            print(f"❌ {e}")
+            return False
+        
+        for lang in self.languages:
+            hashes = self.model.catalog(lang).hashes
+            differing = [
+                path for path, (shape, _) in base_hashes.items()
+                if path not in hashes or hashes[path][0] != shape
+            ]
+            if not differing:
+                print(f"  ✅ {lang:<8} {len(hashes):>5} subtrees, structure matches {baseline_lang}")
+                continue
+            # Report the innermost sections; their ancestors differ because of them
+            ancestors = {path.rsplit(".", 1)[0] if "." in path else "" for path in differing if path}
+            innermost = [path for path in differing if path not in ancestors]
+            print(f"  ⚠️  {lang:<8} {len(hashes):>5} subtrees, {len(innermost)} sections differ from {baseline_lang}")
+            if show_details:
+                for path in innermost:
+                    print(f"      {path or '(root)'}")
+        
+        print(f"\n✅ Indexed {len(self.languages)} languages")
+        return True
+
+    def compile_messages(self, module: str = "json", show_details: bool = False) -> bool:
+        """Write flat precompiled catalogs with message signatures; malformed ICU fails the build"""
+        from i18n_bundles import BUNDLE_DIR, COMPILED_DIRNAME, compile_catalogs, write_compiled
+        
+        out_dir = BUNDLE_DIR / COMPILED_DIRNAME
+        print(f"🧩 Compiling flat message catalogs into {out_dir}...")
+        
+        try:
+            compiled, errors = compile_catalogs(self.model)
+        except CatalogError as e:
+            print(f"❌ {e}")
+            return False
+        
+        if errors:
+            print(f"\n❌ {len(errors)} malformed ICU messages, nothing written:")
+            for error in errors:
+                print(f"  {error.locale}: {error.path}")
+                print(f"      {error.message}")
+                self.record(error.locale, error.path, "invalid-icu", error.message)
+            return False
+        
+        try:
+            written = write_compiled(compiled, module=module)
+        except (OSError, ValueError) as e:
+            print(f"❌ {e}")
+            return False
+        
+        for catalog in compiled:
+            print(f"  ✅ {catalog.locale:<8} {len(catalog.messages):>6} messages, "
+                  f"{len(catalog.signatures):>5} with arguments or tags")
+            if show_details:
+                for path, signature in sorted(catalog.signatures.items()):
+                    print(f"      {path}: {json.dumps(signature, ensure_ascii=False)}")
+        
+        print(f"\n✅ Compiled {len(compiled)} catalogs ({len(written)} changed)")
+        return True
+
+    def show_usage(self, show_details: bool = False) -> bool:
+        """Report keys defined but never used in code, and keys used but never defined"""
+        from i18n_usage import USAGE_CACHE_PATH, analyze_usage, build_usage_index
+        
+        print("🔍 Scanning app/, components/ and lib/ for translation usage...")
+        
+        baseline_lang = 'en-US'
+        if baseline_lang not in self.languages:
+            print(f"❌ Baseline language '{baseline_lang}' not found")
+            return False
+        
+        try:
+            catalog = self.model.catalog(baseline_lang)
+            index, rescanned = build_usage_index(
+                jobs=self.jobs, cache_path=USAGE_CACHE_PATH if self.model.cache_dir else None
+            )
+            report = analyze_usage(index, catalog.data, catalog.keys, rescanned)
+        except (CatalogError, OSError) as e:
+            print(f"❌ {e}")
+            return False
+        
+        print(f"📊 {report.files} files ({report.rescanned} rescanned), "
+              f"{report.references} key references, {report.unresolved} non-literal keys skipped")
+        
+        if report.undefined:
+            print(f"\n❌ {len(report.undefined)} keys used but not defined in {baseline_lang}:")
+            for key, locations in report.undefined.items():
+                if self.reporter is not None:
+                    for file_path, line in locations:
+                        self.reporter.add(Finding(
+                            baseline_lang, key, "undefined-key",
+                            f"'{key}' is used but not defined in {baseline_lang}", file_path, line,
+                        ))
+                    continue
+                file_path, line = locations[0]
+                more = f" (+{len(locations) - 1} more)" if len(locations) > 1 else ""
+                print(f"    ❓ {key} ({file_path}:{line}){more}")
+        else:
+            print("✅ All referenced keys are defined")
+        
+        if report.unused:
+            print(f"\n⚠️  {len(report.unused)} keys defined but never referenced")
+            if show_details:
+                for key in report.unused:
+                    print(f"    🗑️  {key}")
+            else:
+                print("    (use --details to list them)")
+        else:
+            print("✅ All defined keys are referenced")
+        
+        return not report.undefined
+
+    def show_size_report(
+        self,
+        show_details: bool = False,
+        budget_path: Optional[str] = None,
+        baseline_path: str = SIZE_BASELINE_PATH,
+        save_baseline: bool = False,
+    ) -> bool:
+        """Report raw/minified/gzip/brotli payload sizes per locale and namespace"""
+        from i18n_bundles import TOTAL, check_budget, report_to_json, size_report
+        
+        print("📏 Measuring message payload sizes (fallback merged, as shipped)...")
+        
+        try:
+            report = size_report(self.model)
+        except CatalogError as e:
+            print(f"❌ {e}")
+            return False
+        
+        baseline = {}
+        baseline_file = Path(baseline_path)
+        if baseline_file.exists() and not save_baseline:
+            try:
+                baseline = json.loads(baseline_file.read_text(encoding="utf-8"))
+                print(f"📎 Comparing against baseline: {baseline_file}")
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Ignoring unreadable baseline {baseline_file}: {e}")
+        
+        def gzip_diff(lang: str, namespace: str) -> str:
+            previous = baseline.get(lang, {}).get(namespace)
+            if previous is None:
+                return "" if not baseline else " (new)"
+            difference = report[lang][namespace].gzip - previous["gzip"]
+            return f" ({difference:+d})" if difference else ""
+        
+        def row(label: str, lang: str, namespace: str) -> str:
+            entry = report[lang][namespace]
+            brotli_size = f"{entry.brotli:>8}" if entry.brotli is not None else f"{'n/a':>8}"
+            return (f"  {label:<32} {entry.raw:>8} {entry.minified:>8} "
+                    f"{entry.gzip:>8} {brotli_size}{gzip_diff(lang, namespace)}")
+        
+        header = f"  {'':<32} {'raw':>8} {'minified':>8} {'gzip':>8} {'brotli':>8}"
+        print("\n📊 Per locale:")
+        print(header)
+        for lang in report:
+            print(row(lang, lang, TOTAL))
+        
+        # Namespaces: largest locale by default, every locale with --details
+        print("\n📊 Per namespace (largest locale):" if not show_details else "\n📊 Per namespace:")
+        print(header)
+        namespaces = sorted({ns for sizes in report.values() for ns in sizes if ns != TOTAL})
+        for namespace in namespaces:
+            langs = [lang for lang in report if namespace in report[lang]]
+            if show_details:
+                for lang in langs:
+                    print(row(f"{namespace} [{lang}]", lang, namespace))
+            else:
+                lang = max(langs, key=lambda l: report[l][namespace].gzip)
+                print(row(f"{namespace} [{lang}]", lang, namespace))
+        
+        if next(iter(report.values()))[TOTAL].brotli is None:
+            print("\nℹ️  brotli sizes unavailable (pip install brotli)")
+        
+        if save_baseline:
+            content = json.dumps(report_to_json(report), ensure_ascii=False, indent=2) + "\n"
+            write_atomic(baseline_file, content.encode("utf-8"))
+            print(f"\n💾 Saved baseline to {baseline_file}")
+        
+        if budget_path:
+            try:
+                budget = json.loads(Path(budget_path).read_text(encoding="utf-8"))
+                violations = check_budget(report, budget)
+            except (OSError, ValueError) as e:
+                print(f"❌ Could not apply budget {budget_path}: {e}")
+                return False
+            if violations:
+                print(f"\n❌ {len(violations)} size budget violations:")
+                for violation in violations:
+                    print(f"    {violation}")
+                return False
+            print(f"\n✅ All namespaces within budget ({budget_path})")
+
+        return True
+
+    def translate_missing_keys(
+        self,
+        backend_name: str,
+        target_langs: Optional[List[str]] = None,
+        concurrency: int = 4,
+        dry_run: bool = False,
+    ) -> bool:
+        """Machine-translate keys missing from other languages, starting from English"""
+        from i18n_memory import MEMORY_PATH, TranslationMemory, lookup, stale_paths
+        from i18n_translate import BACKENDS, SOURCE_LANGUAGE, plan_translations, translate_missing
+        
+        baseline_lang = SOURCE_LANGUAGE
+        print(f"🌐 Translating missing keys from {baseline_lang} (backend: {backend_name})...")
+
+        if backend_name not in BACKENDS:
+            print(f"❌ Unknown backend '{backend_name}', expected one of: {', '.join(BACKENDS)}")
+            return False
+        unknown = [lang for lang in target_langs or [] if lang not in self.languages]
+        if unknown:
+            print(f"❌ Unknown languages: {', '.join(unknown)}")
+            return False
+        backend = BACKENDS[backend_name]()
+
+        try:
+            source = self.model.catalog(baseline_lang).data
+            targets = {
+                lang: self.model.catalog(lang).data
+                for lang in target_langs or self.languages
+                if lang != baseline_lang
+            }
+            memory = TranslationMemory.load(MEMORY_PATH, baseline_lang)
+        except CatalogError as e:
+            print(f"❌ {e}")
+            return False
+
+        # Keys whose English source changed since they were translated are redone too
+        stale = stale_paths(memory, source, targets)
+        plan = plan_translations(source, targets, backend, stale)
+        for lang, count in plan.missing.items():
+            stale_count = len(stale.get(lang, ()))
+            if count:
+                print(f"🔍 {lang}: {count - stale_count} missing keys, {stale_count} stale keys")
+            else:
+                print(f"✅ {lang}: No missing or stale keys")
+
+        pending = sum(len(destinations) for destinations in plan.units.values())
+        if not pending and not plan.copies:
+            print("\n✅ Nothing to translate")
+            return True
+        print(f"📊 {pending} translatable keys, {len(plan.units)} unique texts "
+              f"({pending - len(plan.units)} deduplicated)")
+
+        if dry_run:
+            print("\n🔍 Dry run completed. No requests sent, no files written")
+            return True
+
+        stats = translate_missing(source, targets, backend, concurrency=concurrency, plan=plan)
+
+        for lang, data in targets.items():
+            if not plan.missing[lang]:
+                continue
+            write_atomic(self.model.catalog(lang).path, canonical_json(data))
+            self.model.invalidate(lang)
+
+        for lang, path in stats.filled:
+            memory.record(lang, path, lookup(source, path))
+        memory.save()
+
+        print(f"\n✅ Translated {stats.translated} keys with {stats.requests} requests, "
+              f"copied {stats.copied} untranslatable values")
+        if stats.errors:
+            print(f"⚠️  {stats.errors} texts failed and were filled with the English source")
+        return not stats.errors
+
+    def show_stale(self, show_details: bool = False, accept: bool = False) -> bool:
+        """List translations whose English source changed since they were translated"""
+        from i18n_memory import MEMORY_PATH, TranslationMemory, key_of
+        
+        baseline_lang = 'en-US'
+        print(f"🔍 Checking translations against {baseline_lang} source hashes ({MEMORY_PATH})...")
+
+        try:
+            memory = TranslationMemory.load(MEMORY_PATH, baseline_lang)
+            source = self.model.catalog(baseline_lang).data
+            targets = {
+                lang: self.model.catalog(lang).data
+                for lang in self.languages if lang != baseline_lang
+            }
+        except CatalogError as e:
+            print(f"❌ {e}")
+            return False
+
+        if accept:
+            # Mark the current translations as made from the current source
+            for lang, data in targets.items():
+                count = memory.record_all(lang, source, data)
+                print(f"✅ {lang}: recorded {count} keys")
+            memory.prune(source, list(targets))
+            memory.save()
+            print(f"\n💾 Saved translation memory to {MEMORY_PATH}")
+            return True
+
+        has_stale = False
+        for lang, data in targets.items():
+            stale, untracked = memory.status(lang, source, data)
+            for path in stale:
+                self.record(lang, key_of(path), "stale-translation",
+                            f"{lang} '{key_of(path)}' was translated from an older English text")
+            if stale:
+                has_stale = True
+                print(f"\n❌ {lang} has {len(stale)} stale keys:")
+                for path in stale if show_details else stale[:10]:
+                    print(f"    🕒 {key_of(path)}")
+                if not show_details and len(stale) > 10:
+                    print(f"    ... {len(stale) - 10} more (use --details to list all)")
+            else:
+                print(f"✅ {lang}: No stale keys")
+            if untracked:
+                print(f"    ℹ️  {len(untracked)} keys have no recorded source (stale --accept to record)")
+
+        return not has_stale
+
+    def pack_catalogs(self, output: Optional[Path] = None, verify: bool = False) -> bool:
+        """Write every locale into one dictionary-encoded pack (or only check the round trip)"""
+        from i18n_bundles import BUNDLE_DIR
+        from i18n_compact import dedup_stats, dumps as dump_compact, encode as encode_compact, loads as load_compact, same_tree
+        
+        try:
+            trees = self.model.translations()
+        except CatalogError as e:
+            print(f"❌ {e}")
+            return False
+        
+        content = dump_compact(encode_compact(trees))
+        minified = sum(len(json.dumps(tree, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+                       for tree in trees.values())
+        
+        print("📊 Strings per locale (keys and values):")
+        for lang, tree in trees.items():
+            stats = dedup_stats(tree)
+            print(f"  {lang:<8} {stats.strings:>6} strings, {stats.unique:>6} unique, "
+                  f"{stats.bytes:>7} → {stats.unique_bytes:>7} bytes (dedup ratio {stats.ratio:.2f})")
+        print(f"\n📦 Pack: {len(content)} bytes for {len(trees)} locales "
+              f"({minified} bytes as minified JSON, {len(content) / minified:.0%})")
+        
+        if verify:
+            decoded = load_compact(content)
+            failed = [lang for lang, tree in trees.items() if not same_tree(decoded.get(lang), tree)]
+            for lang in failed:
+                print(f"❌ {lang} does not round-trip")
+            if not failed:
+                print(f"✅ All {len(trees)} locales round-trip exactly")
+            return not failed
+        
+        output = output or BUNDLE_DIR / PACK_FILENAME
+        try:
+            write_atomic(output, content)
+        except OSError as e:
+            print(f"❌ {e}")
+            return False
+        print(f"💾 Wrote {output}")
+        return True
+
+    def unpack_catalogs(self, pack_path: Path, dry_run: bool = False) -> bool:
+        """Restore locale files from a pack written by `pack`"""
+        from i18n_compact import loads as load_compact
+        
+        try:
+            trees = load_compact(pack_path.read_bytes())
+        except (OSError, ValueError) as e:
+            print(f"❌ Failed to read {pack_path}: {e}")
+            return False
+        
+        print(f"📦 Restoring translation files from {pack_path}...")
+        for lang in trees:
+            if lang not in self.languages:
+                print(f"  ⚠️  {lang} is not a configured language, skipped")
+        changed = []
+        for lang in self.languages:
+            if lang not in trees:
+                print(f"  ⚠️  {lang} is not in the pack, left as is")
+                continue
+            catalog = self.model.catalog(lang)
+            content = canonical_json(trees[lang])
+            if dry_run:
+                if not catalog.path.exists() or catalog.path.read_bytes() != content:
+                    changed.append(lang)
+                continue
+            if write_atomic(catalog.path, content):
+                self.model.invalidate(lang)
+                changed.append(lang)
+        
+        action = "Would rewrite" if dry_run else "Rewrote"
+        if changed:
+            print(f"\n✅ {action} {len(changed)} files: {', '.join(changed)}")
+        else:
+            print("\n✅ All files already match the pack")
+        return True
+
+    def show_duplicates(
+        self, lang: str = 'en-US', threshold: Optional[float] = None, show_details: bool = False
+    ) -> bool:
+        """Report exact and near-duplicate message clusters with their key paths"""
+        from i18n_bundles import flatten_messages
+        from i18n_dupes import DEFAULT_THRESHOLD, exact_duplicates, near_duplicates
+        
+        if threshold is None:
+            threshold = DEFAULT_THRESHOLD
+        if lang not in self.languages:
+            print(f"❌ Language '{lang}' not found")
+            return False
+        print(f"🔁 Finding duplicate messages in {lang} (near-duplicate threshold {threshold:.2f})...")
+        
+        try:
+            messages = {
+                lang_code: {
+                    path: value for path, value in flatten_messages(self.model.catalog(lang_code).data).items()
+                    if isinstance(value, str)
+                }
+                for lang_code in self.languages
+            }
+        except CatalogError as e:
+            print(f"❌ {e}")
+            return False
+        
+        exact = exact_duplicates(messages[lang])
+        near = near_duplicates(messages[lang], threshold)
+        limit = None if show_details else 10
+        
+        print(f"\n📋 {len(exact)} texts are repeated under several keys:")
+        for cluster in exact[:limit]:
+            print(f"  {json.dumps(cluster.text, ensure_ascii=False)} x{len(cluster.paths)} "
+                  f"({cluster.wasted_bytes} bytes repeated)")
+            for path in cluster.paths:
+                print(f"      {path}")
+        if limit and len(exact) > limit:
+            print(f"  ... {len(exact) - limit} more (use --details to list all)")
+        
+        print(f"\n🔍 {len(near)} clusters of near-identical texts:")
+        for cluster in near[:limit]:
+            print(f"  similarity ≥ {cluster.similarity:.2f}:")
+            for text, paths in cluster.texts.items():
+                print(f"      {json.dumps(text, ensure_ascii=False)}: {', '.join(paths)}")
+        if limit and len(near) > limit:
+            print(f"  ... {len(near) - limit} more (use --details to list all)")
+        
+        print("\n📦 Repeated text per locale:")
+        for lang_code, locale_messages in messages.items():
+            clusters = exact_duplicates(locale_messages)
+            wasted = sum(cluster.wasted_bytes for cluster in clusters)
+            print(f"  {lang_code:<8} {len(clusters):>4} repeated texts, {wasted:>6} bytes")
+        return True
+
+    def compact_journals(self, target_langs: Optional[List[str]] = None, dry_run: bool = False) -> bool:
+        """Replay, validate and apply each locale's edit journal, then clear it"""
+        from i18n_journal import JOURNAL_DIR, compact
+        
+        langs = target_langs or self.languages
+        unknown = [lang for lang in langs if lang not in self.languages]
+        if unknown:
+            print(f"❌ Unknown languages: {', '.join(unknown)}")
+            return False
+        action = "Validating" if dry_run else "Compacting"
+        print(f"🗒️  {action} edit journals in {JOURNAL_DIR}...")
+
+        failed = False
+        compacted = 0
+        for lang in langs:
+            catalog = self.model.catalog(lang)
+            try:
+                result = compact(lang, catalog.path, dry_run=dry_run)
+            except CatalogError as e:
+                print(f"  ❌ {lang}: {e}")
+                failed = True
+                continue
+            if result is None:
+                continue
+            compacted += 1
+            sections = ", ".join(section or "(root)" for section in result.sections)
+            status = "valid" if dry_run else "applied"
+            print(f"  ✅ {lang}: {result.entries} entries {status} ({sections})")
+            if not dry_run:
+                self.model.invalidate(lang)
+
+        if not compacted and not failed:
+            print("✅ No journal entries pending")
+        elif dry_run and not failed:
+            print(f"\n✅ {compacted} journals valid (run without --dry to apply)")
+        elif not failed:
+            print(f"\n✅ Compacted {compacted} journals")
+        return not failed
+
+    def sync_structure(
+        self, baseline_lang: str = 'en-US', fill: str = "fallback", dry_run: bool = False,
+        show_details: bool = False,
+    ) -> bool:
+        """Prune, fill and reorder every language to match the baseline in a single pass"""
+        print(f"🔄 Syncing structure with {baseline_lang} (fill: {fill})...")
+
+        if baseline_lang not in self.languages:
+            print(f"❌ Baseline language '{baseline_lang}' not found")
+            return False
+        if fill not in ("fallback", "marker"):
+            print(f"❌ Unknown fill mode '{fill}', expected fallback or marker")
+            return False
+
+        try:
+            base = self.model.catalog(baseline_lang).data
+        except CatalogError as e:
+            print(f"❌ {e}")
+            return False
+
+        changed = []
+        for lang in self.languages:
+            if lang == baseline_lang:
+                continue
+            try:
+                catalog = self.model.catalog(lang)
+                result = sync_tree(base, catalog.data, SYNC_MARKER if fill == "marker" else None)
+            except CatalogError as e:
+                print(f"❌ {e}")
+                return False
+
+            content = canonical_json(result.data)
+            if content == catalog.raw:
+                print(f"✅ {lang}: Already in sync")
+                continue
+
+            changed.append(lang)
+            print(f"🔧 {lang}: {len(result.filled)} filled, {len(result.pruned)} pruned, "
+                  f"{len(result.reordered)} objects reordered")
+            if show_details:
+                for key in result.filled:
+                    print(f"    ➕ {key}")
+                for key in result.pruned:
+                    print(f"    ❌ {key}")
+                for key in result.reordered:
+                    print(f"    ↕️  {key or '(root)'}")
+            if not dry_run:
+                write_atomic(catalog.path, content)
+                self.model.invalidate(lang)
+
+        if dry_run:
+            print(f"\n🔍 Dry run completed. Would rewrite {len(changed)} files")
+        elif changed:
+            print(f"\n✅ Rewrote {len(changed)} files: {', '.join(changed)}")
+        else:
+            print("\n✅ No files needed syncing")
+        return True
+
+    def watch_files(
+        self, baseline_lang: str = 'zh-CN', socket_path: Optional[str] = None, polling: bool = False
+    ) -> bool:
+        """Keep catalogs in memory and re-validate each locale file when it changes"""
+        from i18n_watch import watch
+        
+        if baseline_lang not in self.languages:
+            print(f"❌ Baseline language '{baseline_lang}' not found")
+            return False
+        try:
+            watch(self.model, baseline_lang, Path(socket_path) if socket_path else None, polling)
+        except OSError as e:
+            print(f"❌ {e}")
+            return False
+        return True
@@ -0,0 +1,118 @@
+"""
+i18n compact catalog format
+Dictionary-encodes any number of JSON trees (locale catalogs, cache summaries)
+into one document with a shared string table: every key and string value is
+stored once and referenced by its index, so values repeated across keys and
+locales (brand names, {count} templates, untranslated fallbacks) cost an
+integer each.
+
+Encoded nodes:
+    object      -> [key index, value, key index, value, ...]
+    string      -> its string table index
+    array       -> {"a": [value, ...]}
+    other value -> {"v": value} (numbers, booleans, null)
+"""
+
+import json
+import sys
+from typing import Any, Dict, List, NamedTuple
+
+COMPACT_FORMAT = "i18n-compact"
+COMPACT_VERSION = 1
+
+
+class DedupStats(NamedTuple):
+    """String usage of one tree (keys and values)"""
+
+    strings: int
+    unique: int
+    bytes: int
+    unique_bytes: int
+
+    @property
+    def ratio(self) -> float:
+        return self.bytes / self.unique_bytes if self.unique_bytes else 1.0
+
+
+def _count_strings(node: Any, counts: Dict[str, int]) -> None:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            counts[key] = counts.get(key, 0) + 1
+            _count_strings(value, counts)
+    elif isinstance(node, list):
+        for item in node:
+            _count_strings(item, counts)
+    elif isinstance(node, str):
+        counts[node] = counts.get(node, 0) + 1
+
+
+def _encode_node(node: Any, index: Dict[str, int]) -> Any:
+    if isinstance(node, dict):
+        encoded = []
+        for key, value in node.items():
+            encoded.append(index[key])
+            encoded.append(_encode_node(value, index))
+        return encoded
+    if isinstance(node, str):
+        return index[node]
+    if isinstance(node, list):
+        return {"a": [_encode_node(item, index) for item in node]}
+    return {"v": node}
+
+
+def _decode_node(node: Any, strings: List[str]) -> Any:
+    if isinstance(node, int):
+        return strings[node]
+    if isinstance(node, list):
+        return {strings[node[i]]: _decode_node(node[i + 1], strings) for i in range(0, len(node), 2)}
+    if "a" in node:
+        return [_decode_node(item, strings) for item in node["a"]]
+    return node["v"]
+
+
+def encode(trees: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact document for named trees; the string table is ordered by use count so common strings get short indices"""
+    counts: Dict[str, int] = {}
+    for tree in trees.values():
+        _count_strings(tree, counts)
+    strings = sorted(counts, key=lambda text: (-counts[text], text))
+    index = {text: i for i, text in enumerate(strings)}
+    return {
+        "format": COMPACT_FORMAT,
+        "version": COMPACT_VERSION,
+        "strings": strings,
+        "trees": {name: _encode_node(tree, index) for name, tree in trees.items()},
+    }
+
+
+def decode(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Named trees of a compact document; strings are interned, so repeats share one object"""
+    if document.get("format") != COMPACT_FORMAT or document.get("version") != COMPACT_VERSION:
+        raise ValueError(f"Not an {COMPACT_FORMAT} v{COMPACT_VERSION} document")
+    strings = [sys.intern(text) for text in document["strings"]]
+    return {name: _decode_node(node, strings) for name, node in document["trees"].items()}
+
+
+def dumps(document: Dict[str, Any]) -> bytes:
+    return json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(content: bytes) -> Dict[str, Any]:
+    return decode(json.loads(content))
+
+
+def dedup_stats(tree: Any) -> DedupStats:
+    counts: Dict[str, int] = {}
+    _count_strings(tree, counts)
+    sizes = {text: len(text.encode("utf-8")) for text in counts}
+    return DedupStats(
+        sum(counts.values()),
+        len(counts),
+        sum(sizes[text] * count for text, count in counts.items()),
+        sum(sizes.values()),
+    )
+
+
+def same_tree(a: Any, b: Any) -> bool:
+    """Equal including object key order (== on dicts ignores order)"""
+    return json.dumps(a, ensure_ascii=False) == json.dumps(b, ensure_ascii=False)
@@ -0,0 +1,141 @@
+"""
+i18n duplicate message finder
+Groups message values that are identical, or nearly so, across key paths using
+character-shingle MinHash signatures and locality-sensitive hashing: only
+messages that share a signature band are compared, so the work grows roughly
+linearly with the catalog instead of with every pair of messages.
+"""
+
+import hashlib
+import random
+import re
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+SHINGLE_SIZE = 3
+# 32 hash functions in 8 bands of 4 rows: pairs from about 0.6 Jaccard similarity become candidates
+NUM_HASHES = 32
+BAND_ROWS = 4
+# Lowest Jaccard similarity reported as a near duplicate
+DEFAULT_THRESHOLD = 0.85
+_MERSENNE_PRIME = (1 << 61) - 1
+
+_PUNCTUATION = re.compile(r"[^\w\s{}]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class ExactCluster(NamedTuple):
+    text: str
+    paths: List[str]
+
+    @property
+    def wasted_bytes(self) -> int:
+        """Bytes a locale ships for the repeated copies"""
+        return (len(self.paths) - 1) * len(self.text.encode("utf-8"))
+
+
+class NearCluster(NamedTuple):
+    # Distinct texts -> their key paths
+    texts: Dict[str, List[str]]
+    # Lowest verified similarity between clustered texts
+    similarity: float
+
+
+def normalize(text: str) -> str:
+    """Case, punctuation and spacing insensitive form ("Loading..." and "loading" match)"""
+    return _WHITESPACE.sub(" ", _PUNCTUATION.sub(" ", text.lower())).strip()
+
+
+def shingles(text: str) -> Set[str]:
+    if len(text) <= SHINGLE_SIZE:
+        return {text}
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+class MinHasher:
+    """MinHash signatures from universal hashes (a*x + b) mod p over stable shingle hashes
+
+    Each distinct shingle is hashed once and its NUM_HASHES values are reused by
+    every message containing it.
+    """
+
+    def __init__(self, num_hashes: int = NUM_HASHES, seed: int = 1):
+        rng = random.Random(seed)
+        self.params = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_hashes)
+        ]
+        self._values: Dict[str, Tuple[int, ...]] = {}
+
+    def _shingle_values(self, shingle: str) -> Tuple[int, ...]:
+        values = self._values.get(shingle)
+        if values is None:
+            x = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+            values = tuple((a * x + b) % _MERSENNE_PRIME for a, b in self.params)
+            self._values[shingle] = values
+        return values
+
+    def signature(self, shingle_set: Set[str]) -> Tuple[int, ...]:
+        return tuple(map(min, zip(*(self._shingle_values(shingle) for shingle in shingle_set))))
+
+
+def exact_duplicates(messages: Dict[str, str]) -> List[ExactCluster]:
+    """Texts used under more than one key path, most wasted bytes first"""
+    by_text: Dict[str, List[str]] = {}
+    for path, text in messages.items():
+        by_text.setdefault(text, []).append(path)
+    clusters = [ExactCluster(text, paths) for text, paths in by_text.items() if len(paths) > 1]
+    clusters.sort(key=lambda cluster: (-cluster.wasted_bytes, cluster.text))
+    return clusters
+
+
+def near_duplicates(messages: Dict[str, str], threshold: float = DEFAULT_THRESHOLD) -> List[NearCluster]:
+    """Clusters of distinct texts whose normalized shingle sets are at least `threshold` similar"""
+    by_text: Dict[str, List[str]] = {}
+    for path, text in messages.items():
+        by_text.setdefault(text, []).append(path)
+    texts = sorted(by_text)
+    shingle_sets = [shingles(normalize(text)) for text in texts]
+
+    hasher = MinHasher()
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    for index, shingle_set in enumerate(shingle_sets):
+        signature = hasher.signature(shingle_set)
+        for band in range(0, len(signature), BAND_ROWS):
+            buckets.setdefault((band, signature[band:band + BAND_ROWS]), []).append(index)
+
+    # Union-find over verified candidate pairs
+    parent = list(range(len(texts)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    similarity: Dict[int, float] = {}
+    checked: Set[Tuple[int, int]] = set()
+    for members in buckets.values():
+        for position, i in enumerate(members):
+            for j in members[position + 1:]:
+                if (i, j) in checked:
+                    continue
+                checked.add((i, j))
+                score = jaccard(shingle_sets[i], shingle_sets[j])
+                if score >= threshold:
+                    root_i, root_j = find(i), find(j)
+                    low = min(score, similarity.get(root_i, 1.0), similarity.get(root_j, 1.0))
+                    parent[root_j] = root_i
+                    similarity[root_i] = low
+
+    groups: Dict[int, List[int]] = {}
+    for index in range(len(texts)):
+        groups.setdefault(find(index), []).append(index)
+    clusters = [
+        NearCluster({texts[i]: by_text[texts[i]] for i in members}, similarity.get(root, 1.0))
+        for root, members in groups.items() if len(members) > 1
+    ]
+    clusters.sort(key=lambda cluster: (-sum(len(paths) for paths in cluster.texts.values()), min(cluster.texts)))
+    return clusters
@@ -0,0 +1,236 @@
+"""
+i18n git access
+Reads translation files straight from git objects through one long-lived
+`git cat-file --batch` process (trees are parsed in-process, so listing a
+revision's messages/ directory costs no extra subprocess), diffs locale
+catalogs between revisions key by key and reads staged files from the index.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from i18n_catalog import MESSAGES_DIR, CatalogError
+
+
+class GitError(CatalogError):
+    pass
+
+
+class GitObject(NamedTuple):
+    oid: str
+    kind: str
+    content: bytes
+
+
+class LocaleChanges(NamedTuple):
+    locale: str
+    # Key path -> new value
+    added: Dict[str, Any]
+    # Key path -> old value
+    removed: Dict[str, Any]
+    # Key path -> (old value, new value)
+    changed: Dict[str, Tuple[Any, Any]]
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "added": self.added,
+            "removed": self.removed,
+            "changed": {path: {"from": old, "to": new} for path, (old, new) in self.changed.items()},
+        }
+
+
+class CatFile:
+    """One `git cat-file --batch` process answering any number of object lookups"""
+
+    def __init__(self, cwd: Optional[Path] = None):
+        try:
+            self.process = subprocess.Popen(
+                ["git", "cat-file", "--batch"], cwd=cwd,
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise GitError(f"Failed to start git: {e}") from e
+
+    def __enter__(self) -> "CatFile":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.process.stdin.close()
+        self.process.wait()
+        self.process.stdout.close()
+
+    def read_many(self, names: List[str]) -> List[Optional[GitObject]]:
+        """Objects for `names` (None when missing), pipelined in one round trip
+
+        The requests are short lines, so writing them all before reading cannot
+        fill the pipe while git waits for its output to be read.
+        """
+        if not names:
+            return []
+        stdin, stdout = self.process.stdin, self.process.stdout
+        stdin.write("".join(f"{name}\n" for name in names).encode("utf-8"))
+        stdin.flush()
+
+        objects = []
+        for name in names:
+            header = stdout.readline()
+            if not header:
+                raise GitError("git cat-file exited unexpectedly")
+            fields = header.split()
+            if len(fields) != 3:
+                # "<name> missing" or "<name> ambiguous"
+                objects.append(None)
+                continue
+            oid, kind, size = fields
+            content = stdout.read(int(size))
+            stdout.read(1)
+            objects.append(GitObject(oid.decode("ascii"), kind.decode("ascii"), content))
+        return objects
+
+    def read(self, name: str) -> Optional[GitObject]:
+        return self.read_many([name])[0]
+
+
+def staged_locales(messages_dir: Path = MESSAGES_DIR) -> Tuple[List[str], List[str]]:
+    """Locales whose messages/<locale>.json is staged as changed, and those staged for deletion"""
+    try:
+        result = subprocess.run(
+            ["git", "diff", "--cached", "--name-status", "-z", "--no-renames", "--", messages_dir.as_posix()],
+            capture_output=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise GitError(f"Failed to list staged files: {e}") from e
+
+    changed, deleted = [], []
+    fields = result.stdout.decode("utf-8", "surrogateescape").split("\0")
+    for status, name in zip(fields[0::2], fields[1::2]):
+        path = Path(name)
+        if path.parent != messages_dir or path.suffix != ".json":
+            continue
+        (deleted if status == "D" else changed).append(path.stem)
+    return changed, deleted
+
+
+def read_staged(cat_file: CatFile, locales: List[str], messages_dir: Path = MESSAGES_DIR) -> Dict[str, bytes]:
+    """Index (staged) content of messages/<locale>.json for every locale, in one batch"""
+    names = [f":{(messages_dir / f'{locale}.json').as_posix()}" for locale in locales]
+    contents = {}
+    for locale, blob in zip(locales, cat_file.read_many(names)):
+        if blob is None:
+            raise GitError(f"{messages_dir / f'{locale}.json'} is not in the git index")
+        contents[locale] = blob.content
+    return contents
+
+
+def parse_tree(content: bytes, oid_size: int) -> Dict[str, Tuple[str, str]]:
+    """Entries of a raw tree object: name -> (mode, object id)"""
+    entries = {}
+    pos = 0
+    while pos < len(content):
+        space = content.index(b" ", pos)
+        nul = content.index(b"\0", space)
+        mode = content[pos:space].decode("ascii")
+        name = content[space + 1:nul].decode("utf-8", "surrogateescape")
+        oid = content[nul + 1:nul + 1 + oid_size].hex()
+        entries[name] = (mode, oid)
+        pos = nul + 1 + oid_size
+    return entries
+
+
+class RevisionReader:
+    """Locale trees at git revisions, with parsed blobs shared across revisions by object id"""
+
+    def __init__(self, cat_file: CatFile, messages_dir: Path = MESSAGES_DIR):
+        self.cat_file = cat_file
+        self.messages_dir = messages_dir.as_posix()
+        self._trees: Dict[str, Dict[str, Any]] = {}
+
+    def resolve(self, rev: str) -> str:
+        """Commit id of `rev`"""
+        commit = self.cat_file.read(f"{rev}^{{commit}}")
+        if commit is None:
+            raise GitError(f"Unknown revision '{rev}'")
+        return commit.oid
+
+    def locale_blobs(self, rev: str) -> Dict[str, str]:
+        """Locale -> blob id of every messages/*.json at `rev`"""
+        tree = self.cat_file.read(f"{rev}:{self.messages_dir}")
+        if tree is None:
+            return {}
+        if tree.kind != "tree":
+            raise GitError(f"{rev}:{self.messages_dir} is not a directory")
+        entries = parse_tree(tree.content, len(tree.oid) // 2)
+        return {
+            name[:-len(".json")]: oid for name, (mode, oid) in sorted(entries.items())
+            if name.endswith(".json") and mode.startswith("100")
+        }
+
+    def load(self, blobs: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """Parsed trees for locale -> blob id, reading only blobs not seen before"""
+        pending = sorted({oid for oid in blobs.values() if oid not in self._trees})
+        for oid, blob in zip(pending, self.cat_file.read_many(pending)):
+            if blob is None:
+                raise GitError(f"Missing blob {oid}")
+            try:
+                self._trees[oid] = json.loads(blob.content)
+            except ValueError as e:
+                locale = next(name for name, blob_oid in blobs.items() if blob_oid == oid)
+                raise GitError(f"Invalid JSON in {locale}.json (blob {oid[:12]}): {e}") from e
+        return {locale: self._trees[oid] for locale, oid in blobs.items()}
+
+    def diff(self, old_rev: str, new_rev: str) -> List[LocaleChanges]:
+        """Key changes of every locale between two revisions (locales without changes are omitted)"""
+        old_blobs = self.locale_blobs(old_rev)
+        new_blobs = self.locale_blobs(new_rev)
+        changed = {
+            locale for locale in old_blobs.keys() | new_blobs.keys()
+            if old_blobs.get(locale) != new_blobs.get(locale)
+        }
+        old_trees = self.load({locale: oid for locale, oid in old_blobs.items() if locale in changed})
+        new_trees = self.load({locale: oid for locale, oid in new_blobs.items() if locale in changed})
+
+        results = []
+        for locale in sorted(changed):
+            changes = LocaleChanges(locale, {}, {}, {})
+            diff_trees(old_trees.get(locale, {}), new_trees.get(locale, {}), "", changes)
+            if changes.added or changes.removed or changes.changed:
+                results.append(changes)
+        return results
+
+
+def diff_trees(old: Dict[str, Any], new: Dict[str, Any], prefix: str, changes: LocaleChanges) -> None:
+    """Record added, removed and changed leaves, skipping equal subtrees whole"""
+    for key, new_value in new.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if key not in old:
+            _record_all(new_value, path, changes.added)
+            continue
+        old_value = old[key]
+        if old_value == new_value:
+            continue
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            diff_trees(old_value, new_value, path, changes)
+        elif isinstance(old_value, dict):
+            _record_all(old_value, path, changes.removed)
+            changes.added[path] = new_value
+        elif isinstance(new_value, dict):
+            changes.removed[path] = old_value
+            _record_all(new_value, path, changes.added)
+        else:
+            changes.changed[path] = (old_value, new_value)
+    for key, old_value in old.items():
+        if key not in new:
+            _record_all(old_value, f"{prefix}.{key}" if prefix else key, changes.removed)
+
+
+def _record_all(value: Any, path: str, target: Dict[str, Any]) -> None:
+    if isinstance(value, dict):
+        for key, child in value.items():
+            _record_all(child, f"{path}.{key}", target)
+    else:
+        target[path] = value
@@ -0,0 +1,319 @@
+"""
+ICU-lite message scanner
+Parses the subset of ICU MessageFormat that next-intl messages use: simple
+arguments, formatted arguments (number, date, time), plural/selectordinal/select
+with their arms, rich-text tags and apostrophe quoting. It extracts each
+message's argument signature, rejects malformed syntax and compares signatures
+across locales.
+"""
+
+import re
+from typing import Any, Container, Dict, List, NamedTuple, Optional
+
+# Characters that can start syntax; everything between them is literal text
+_SPECIAL = re.compile(r"[{}'<#]")
+# Argument head after '{': name, then '}' or ', type' followed by '}' or ','
+_ARG_HEAD = re.compile(r"\s*([A-Za-z_$][\w$]*|\d+)\s*(?:(\})|,\s*([A-Za-z]+)\s*([},]))")
+_SELECTOR = re.compile(r"\s*(offset:\s*\d+|=\d+|[A-Za-z_][\w-]*)\s*")
+_TAG_OPEN = re.compile(r"<([A-Za-z][\w-]*)\s*(/?)>")
+_WHITESPACE = re.compile(r"\s*")
+
+PLURAL_TYPES = ("plural", "selectordinal")
+CHOICE_TYPES = PLURAL_TYPES + ("select",)
+FORMAT_TYPES = ("number", "date", "time", "spellout", "ordinal", "duration")
+PLURAL_CATEGORIES = ("zero", "one", "two", "few", "many", "other")
+
+
+class IcuSyntaxError(ValueError):
+    """Malformed message; `offset` is the character index where parsing failed"""
+
+    def __init__(self, message: str, offset: int):
+        super().__init__(f"{message} at offset {offset}")
+        self.offset = offset
+
+
+class MessageSignature(NamedTuple):
+    # Argument name -> "string", a format type, or a choice type
+    args: Dict[str, str]
+    # Choice argument name -> sorted selectors of its arms
+    arms: Dict[str, List[str]]
+    tags: List[str]
+
+    def to_json(self) -> Dict[str, object]:
+        """Compact form: empty parts are omitted"""
+        result: Dict[str, object] = {}
+        if self.args:
+            result["args"] = self.args
+        if self.arms:
+            result["arms"] = self.arms
+        if self.tags:
+            result["tags"] = self.tags
+        return result
+
+
+EMPTY_SIGNATURE = MessageSignature({}, {}, [])
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+        self.args: Dict[str, str] = {}
+        self.arms: Dict[str, List[str]] = {}
+        self.tags: List[str] = []
+
+    def parse(self) -> MessageSignature:
+        self.message(nested=False, plural=False, tag=None)
+        return MessageSignature(self.args, self.arms, sorted(set(self.tags)))
+
+    def message(self, nested: bool, plural: bool, tag: Optional[str]) -> None:
+        """Parse literal text and arguments up to the closing '}' (nested) or '</tag>'"""
+        text = self.text
+        while True:
+            match = _SPECIAL.search(text, self.pos)
+            if match is None:
+                if nested:
+                    raise IcuSyntaxError("Unclosed '{'", len(text))
+                if tag:
+                    raise IcuSyntaxError(f"Unclosed tag <{tag}>", len(text))
+                self.pos = len(text)
+                return
+            self.pos = match.start()
+            char = match.group()
+
+            if char == "{":
+                self.argument()
+            elif char == "}":
+                if nested:
+                    return
+                raise IcuSyntaxError("Unmatched '}'", self.pos)
+            elif char == "'":
+                self.quote(plural)
+            elif char == "<":
+                if text.startswith("</", self.pos):
+                    if tag and text.startswith(f"</{tag}>", self.pos):
+                        self.pos += len(tag) + 3
+                        return
+                    raise IcuSyntaxError("Unexpected closing tag", self.pos)
+                self.tag(plural)
+            else:
+                # '#' is the plural value inside plural arms and literal elsewhere
+                self.pos += 1
+
+    def quote(self, plural: bool) -> None:
+        """Apostrophes quote only before syntax characters ('' is a literal apostrophe)"""
+        text = self.text
+        following = text[self.pos + 1:self.pos + 2]
+        if following == "'":
+            self.pos += 2
+            return
+        if following not in ("{", "}", "<") and not (plural and following == "#"):
+            self.pos += 1
+            return
+        # Quoted literal up to the next single apostrophe (or the end of the message)
+        pos = self.pos + 1
+        while True:
+            end = text.find("'", pos)
+            if end < 0:
+                self.pos = len(text)
+                return
+            if text.startswith("''", end):
+                pos = end + 2
+                continue
+            self.pos = end + 1
+            return
+
+    def tag(self, plural: bool) -> None:
+        match = _TAG_OPEN.match(self.text, self.pos)
+        if match is None:
+            if self.text[self.pos + 1:self.pos + 2].isalpha():
+                # Tags take no attributes: <span class="x"> fails at render time
+                raise IcuSyntaxError("Invalid tag (tags cannot have attributes)", self.pos)
+            # '<' not followed by a tag name is literal text ("Documents < 15MB")
+            self.pos += 1
+            return
+        name, self_closing = match.groups()
+        self.tags.append(name)
+        self.pos = match.end()
+        if not self_closing:
+            self.message(nested=False, plural=plural, tag=name)
+
+    def argument(self) -> None:
+        start = self.pos
+        match = _ARG_HEAD.match(self.text, start + 1)
+        if match is None:
+            raise IcuSyntaxError("Invalid argument", start)
+        name, closed, kind, separator = match.groups()
+        self.pos = match.end()
+
+        if closed:
+            self.args.setdefault(name, "string")
+            return
+        kind = kind.lower()
+        if kind in CHOICE_TYPES:
+            if separator != ",":
+                raise IcuSyntaxError(f"Missing arms for {kind} argument '{name}'", start)
+            self.args.setdefault(name, kind)
+            self.choice(name, kind, start)
+        elif kind in FORMAT_TYPES:
+            self.args.setdefault(name, kind)
+            if separator == ",":
+                # Style or skeleton, e.g. {n, number, ::percent}
+                end = self.text.find("}", self.pos)
+                brace = self.text.find("{", self.pos)
+                if end < 0 or 0 <= brace < end:
+                    raise IcuSyntaxError(f"Invalid style for argument '{name}'", start)
+                self.pos = end + 1
+        else:
+            raise IcuSyntaxError(f"Unknown argument type '{kind}'", start)
+
+    def choice(self, name: str, kind: str, start: int) -> None:
+        text = self.text
+        selectors: List[str] = []
+        while True:
+            self.pos = _WHITESPACE.match(text, self.pos).end()
+            if self.pos >= len(text):
+                raise IcuSyntaxError(f"Unclosed {kind} argument '{name}'", start)
+            if text[self.pos] == "}":
+                self.pos += 1
+                break
+            match = _SELECTOR.match(text, self.pos)
+            if match is None:
+                raise IcuSyntaxError(f"Invalid selector in {kind} argument '{name}'", self.pos)
+            selector = match.group(1)
+            self.pos = match.end()
+            if selector.startswith("offset:"):
+                if kind != "plural" or selectors:
+                    raise IcuSyntaxError(f"Unexpected offset in '{name}'", match.start(1))
+                continue
+            if kind in PLURAL_TYPES and not selector.startswith("=") and selector not in PLURAL_CATEGORIES:
+                raise IcuSyntaxError(f"Invalid plural category '{selector}' in '{name}'", match.start(1))
+            if selector in selectors:
+                raise IcuSyntaxError(f"Duplicate selector '{selector}' in '{name}'", match.start(1))
+            if not text.startswith("{", self.pos):
+                raise IcuSyntaxError(f"Expected '{{' after selector '{selector}'", self.pos)
+            self.pos += 1
+            self.message(nested=True, plural=kind in PLURAL_TYPES, tag=None)
+            self.pos += 1
+            selectors.append(selector)
+
+        if "other" not in selectors:
+            raise IcuSyntaxError(f"Missing 'other' arm in {kind} argument '{name}'", start)
+        self.arms.setdefault(name, sorted(selectors))
+
+
+_signature_cache: Dict[str, MessageSignature] = {}
+
+
+def parse_message(text: str) -> MessageSignature:
+    """Signature of one message; raises IcuSyntaxError for malformed syntax
+
+    Results are memoised, since the same strings repeat across keys and locales.
+    """
+    signature = _signature_cache.get(text)
+    if signature is None:
+        if _SPECIAL.search(text) is None:
+            signature = EMPTY_SIGNATURE
+        else:
+            signature = _Parser(text).parse()
+        _signature_cache[text] = signature
+    return signature
+
+
+def message_signatures(obj: Any, prefix: str = "") -> Dict[str, Dict[str, Any]]:
+    """Compact signature of every string value with arguments or tags, by key path
+
+    Malformed messages map to {"error": message} so callers can cache the result.
+    """
+    signatures = {}
+
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            signatures.update(message_signatures(value, f"{prefix}.{key}" if prefix else key))
+    elif isinstance(obj, list):
+        for i, item in enumerate(obj):
+            signatures.update(message_signatures(item, f"{prefix}[{i}]"))
+    elif isinstance(obj, str):
+        try:
+            signature = parse_message(obj).to_json()
+        except IcuSyntaxError as e:
+            signature = {"error": str(e)}
+        if signature:
+            signatures[prefix] = signature
+
+    return signatures
+
+
+class ParityIssue(NamedTuple):
+    path: str
+    # invalid, missing-arg, extra-arg, arg-type, arms or tags
+    kind: str
+    message: str
+
+
+def compare_signatures(path: str, base: Dict[str, Any], other: Dict[str, Any]) -> List[ParityIssue]:
+    """Ways a translation's signature is incompatible with the baseline's
+
+    Plural arms and plural/number/plain use of an argument legitimately differ
+    between languages, so only select arms and select-ness are compared.
+    """
+    issues = []
+    base_args = base.get("args", {})
+    args = other.get("args", {})
+
+    for name in sorted(base_args.keys() - args.keys()):
+        issues.append(ParityIssue(path, "missing-arg", f"Missing argument {{{name}}}"))
+    for name in sorted(args.keys() - base_args.keys()):
+        issues.append(ParityIssue(path, "extra-arg", f"Unknown argument {{{name}}}"))
+    for name in sorted(base_args.keys() & args.keys()):
+        if (base_args[name] == "select") != (args[name] == "select"):
+            issues.append(ParityIssue(
+                path, "arg-type", f"Argument {{{name}}} is {args[name]}, baseline has {base_args[name]}"
+            ))
+        elif base_args[name] == "select":
+            base_arms = base.get("arms", {}).get(name, [])
+            arms = other.get("arms", {}).get(name, [])
+            if base_arms != arms:
+                issues.append(ParityIssue(
+                    path, "arms", f"Select {{{name}}} has arms {', '.join(arms)}, baseline has {', '.join(base_arms)}"
+                ))
+
+    base_tags = base.get("tags", [])
+    tags = other.get("tags", [])
+    if base_tags != tags:
+        issues.append(ParityIssue(
+            path, "tags", f"Tags <{'>, <'.join(tags)}> differ from baseline <{'>, <'.join(base_tags)}>"
+            if tags else f"Missing tags <{'>, <'.join(base_tags)}>"
+        ))
+    return issues
+
+
+def check_parity(
+    signatures: Dict[str, Dict[str, Dict[str, Any]]], paths: Dict[str, Container[str]], base_lang: str
+) -> Dict[str, List[ParityIssue]]:
+    """One pass over the key x locale matrix; issues per locale, in key order
+
+    `signatures` and `paths` are per-locale message_signatures() and key paths
+    (any container: a set or a KeyTrie).
+    Keys missing from a locale are left to the key checks.
+    """
+    issues: Dict[str, List[ParityIssue]] = {lang: [] for lang in signatures}
+    base_signatures = signatures[base_lang]
+    base_paths = paths[base_lang]
+    all_paths = set().union(*(locale_signatures.keys() for locale_signatures in signatures.values()))
+
+    for path in sorted(path for path in all_paths if path in base_paths):
+        base = base_signatures.get(path, {})
+        for lang, locale_signatures in signatures.items():
+            # A signature implies the key exists, so the path lookup is only needed without one
+            signature = locale_signatures.get(path)
+            if signature is None:
+                if path not in paths[lang]:
+                    continue
+                signature = {}
+            if "error" in signature:
+                issues[lang].append(ParityIssue(path, "invalid", signature["error"]))
+            elif signature != base and "error" not in base:
+                issues[lang].extend(compare_signatures(path, base, signature))
+
+    return issues
@@ -0,0 +1,197 @@
+"""
+i18n edit journal
+Admin translation edits can be appended to messages/.journal/<locale>.jsonl
+instead of rewriting the whole locale file per edit. Each line is one edit,
+shaped like the admin translations PUT body:
+
+    {"section": "pages.home", "updates": {...}, "mode": "merge"}
+
+`section` is optional (the whole file), `mode` is merge (default) or replace.
+Compaction replays, validates and applies a journal in one streaming pass and
+writes the canonical locale file once.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from i18n_catalog import MESSAGES_DIR, CatalogError, canonical_json, write_atomic
+from i18n_icu import IcuSyntaxError, parse_message
+from i18n_translate import set_path
+
+JOURNAL_DIR = MESSAGES_DIR / ".journal"
+JOURNAL_MODES = ("merge", "replace")
+# A journal being compacted; left behind (and replayed first) if compaction is interrupted
+PENDING_SUFFIX = ".compacting"
+
+
+class JournalError(CatalogError):
+    """Invalid journal entry; `path` and `line` locate it"""
+
+    def __init__(self, path: Path, line: int, message: str):
+        super().__init__(f"{path}:{line}: {message}")
+        self.path = path
+        self.line = line
+
+
+class JournalEntry(NamedTuple):
+    section: Optional[str]
+    updates: Any
+    mode: str
+
+
+class ReplayResult(NamedTuple):
+    data: Dict[str, Any]
+    entries: int
+    # Sections touched, in first-edit order ("" is the whole file)
+    sections: List[str]
+
+
+def journal_path(locale: str, journal_dir: Path = JOURNAL_DIR) -> Path:
+    return journal_dir / f"{locale}.jsonl"
+
+
+def pending_path(locale: str, journal_dir: Path = JOURNAL_DIR) -> Path:
+    return journal_dir / f"{locale}.jsonl{PENDING_SUFFIX}"
+
+
+def journal_sources(locale: str, journal_dir: Path = JOURNAL_DIR) -> List[Path]:
+    """Journal files of `locale` in replay order: an interrupted compaction first"""
+    return [
+        path for path in (pending_path(locale, journal_dir), journal_path(locale, journal_dir))
+        if path.exists()
+    ]
+
+
+def _check_values(value: Any, path: Path, line: int, key: str) -> None:
+    """Leaves must be valid ICU strings (lists are kept as they are)"""
+    if isinstance(value, dict):
+        for child_key, child in value.items():
+            _check_values(child, path, line, f"{key}.{child_key}" if key else child_key)
+    elif isinstance(value, str):
+        try:
+            parse_message(value)
+        except IcuSyntaxError as e:
+            raise JournalError(path, line, f"'{key}': {e}") from e
+    elif not isinstance(value, list):
+        raise JournalError(path, line, f"'{key}': expected a string or object, got {json.dumps(value)}")
+
+
+def iter_entries(path: Path) -> Iterator[Tuple[int, JournalEntry]]:
+    """Validated entries of one journal file with their line numbers, read line by line"""
+    with open(path, encoding="utf-8") as stream:
+        for line_number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise JournalError(path, line_number, f"invalid JSON: {e}") from e
+            if not isinstance(record, dict):
+                raise JournalError(path, line_number, "entry must be a JSON object")
+
+            section = record.get("section") or None
+            mode = record.get("mode", "merge")
+            updates = record.get("updates")
+            if section is not None and (not isinstance(section, str) or "" in section.split(".")):
+                raise JournalError(path, line_number, f"invalid section {json.dumps(section)}")
+            if mode not in JOURNAL_MODES:
+                raise JournalError(path, line_number, f"unknown mode {json.dumps(mode)}")
+            if updates is None:
+                raise JournalError(path, line_number, "missing updates")
+            if not isinstance(updates, dict) and not (section and mode == "replace"):
+                raise JournalError(path, line_number, "updates must be an object")
+            _check_values(updates, path, line_number, section or "")
+
+            yield line_number, JournalEntry(section, updates, mode)
+
+
+def merge_into(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """Deep merge `source` into `target` in place (objects merge, everything else replaces)"""
+    for key, value in source.items():
+        current = target.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            merge_into(current, value)
+        else:
+            target[key] = value
+
+
+def apply_entry(data: Dict[str, Any], entry: JournalEntry) -> Dict[str, Any]:
+    """Apply one edit the way the admin translations API does; returns the new tree"""
+    if entry.section is None:
+        if entry.mode == "replace":
+            return entry.updates
+        merge_into(data, entry.updates)
+        return data
+
+    path = tuple(entry.section.split("."))
+    if entry.mode == "replace":
+        set_path(data, path, entry.updates)
+        return data
+
+    node: Any = data
+    for key in path:
+        node = node.get(key) if isinstance(node, dict) else None
+    if not isinstance(node, dict):
+        node = {}
+        set_path(data, path, node)
+    merge_into(node, entry.updates)
+    return data
+
+
+def replay(data: Dict[str, Any], sources: List[Path]) -> ReplayResult:
+    """Apply every entry of `sources` to `data` (modified in place) in one pass"""
+    entries = 0
+    sections: Dict[str, None] = {}
+    for source in sources:
+        for _, entry in iter_entries(source):
+            data = apply_entry(data, entry)
+            entries += 1
+            sections.setdefault(entry.section or "", None)
+    return ReplayResult(data, entries, list(sections))
+
+
+def _read_locale(locale_path: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(locale_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        raise CatalogError(f"Failed to read {locale_path}: {e}") from e
+
+
+def _apply_pending(locale_path: Path, pending: Path) -> ReplayResult:
+    """Replay one renamed-aside journal onto the locale file, then remove it"""
+    result = replay(_read_locale(locale_path), [pending])
+    write_atomic(locale_path, canonical_json(result.data))
+    pending.unlink()
+    return result
+
+
+def compact(
+    locale: str, locale_path: Path, journal_dir: Path = JOURNAL_DIR, dry_run: bool = False
+) -> Optional[ReplayResult]:
+    """Replay the journal of `locale` onto its file and clear it; None when there is nothing to do
+
+    The live journal is renamed aside first, so edits appended meanwhile go to a
+    fresh journal. A journal left aside by an interrupted compaction is applied
+    before the live one. An invalid entry raises JournalError and leaves the
+    renamed journal in place to be fixed and compacted again.
+    """
+    if dry_run:
+        sources = journal_sources(locale, journal_dir)
+        return replay(_read_locale(locale_path), sources) if sources else None
+
+    pending = pending_path(locale, journal_dir)
+    live = journal_path(locale, journal_dir)
+    results = []
+    if pending.exists():
+        # Finish the interrupted compaction before taking newer edits
+        results.append(_apply_pending(locale_path, pending))
+    if live.exists():
+        os.replace(live, pending)
+        results.append(_apply_pending(locale_path, pending))
+    if not results:
+        return None
+
+    sections = dict.fromkeys(section for result in results for section in result.sections)
+    return ReplayResult(results[-1].data, sum(result.entries for result in results), list(sections))
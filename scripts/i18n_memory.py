@@ -0,0 +1,146 @@
+"""
+i18n translation memory
+Records, for every (locale, key), a hash of the en-US text the translation was
+made from, so translations whose English source changed since can be found and
+re-translated instead of re-translating everything.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from i18n_catalog import MESSAGES_DIR, CatalogError, write_atomic
+
+MEMORY_PATH = MESSAGES_DIR / ".translation-memory.json"
+MEMORY_VERSION = 1
+
+KeyPath = Tuple[str, ...]
+
+
+class MemoryStatus(NamedTuple):
+    """State of one locale's translations against the current source"""
+
+    # Source text changed since the key was translated
+    stale: List[KeyPath]
+    # Translated, but no source hash recorded yet
+    untracked: List[KeyPath]
+
+
+def source_hash(value: Any) -> str:
+    """Short hash of a source value (strings and lists alike)"""
+    content = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+
+def iter_leaves(obj: Any, path: KeyPath = ()) -> Iterator[Tuple[KeyPath, Any]]:
+    for key, value in obj.items():
+        if isinstance(value, dict):
+            yield from iter_leaves(value, path + (key,))
+        else:
+            yield path + (key,), value
+
+
+def lookup(obj: Any, path: KeyPath) -> Any:
+    for key in path:
+        if not isinstance(obj, dict) or key not in obj:
+            return None
+        obj = obj[key]
+    return obj
+
+
+def key_of(path: KeyPath) -> str:
+    return ".".join(path)
+
+
+class TranslationMemory:
+    """Source hashes per locale and dotted key, stored as a sorted JSON lockfile"""
+
+    def __init__(self, path: Path = MEMORY_PATH, source_locale: str = "en-US"):
+        self.path = path
+        self.source_locale = source_locale
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path = MEMORY_PATH, source_locale: str = "en-US") -> "TranslationMemory":
+        memory = cls(path, source_locale)
+        if not path.exists():
+            return memory
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            raise CatalogError(f"Failed to load translation memory {path}: {e}")
+        if data.get("version") != MEMORY_VERSION:
+            raise CatalogError(f"Unsupported translation memory version in {path}: {data.get('version')}")
+        memory.source_locale = data.get("source", source_locale)
+        memory.entries = data.get("entries", {})
+        return memory
+
+    def record(self, locale: str, path: KeyPath, source_value: Any) -> None:
+        digest = source_hash(source_value)
+        entries = self.entries.setdefault(locale, {})
+        if entries.get(key_of(path)) != digest:
+            entries[key_of(path)] = digest
+            self.dirty = True
+
+    def record_all(self, locale: str, source: Dict[str, Any], target: Dict[str, Any]) -> int:
+        """Mark every translated key of a locale as up to date with the current source"""
+        count = 0
+        for path, value in iter_leaves(source):
+            if lookup(target, path):
+                self.record(locale, path, value)
+                count += 1
+        return count
+
+    def status(self, locale: str, source: Dict[str, Any], target: Dict[str, Any]) -> MemoryStatus:
+        entries = self.entries.get(locale, {})
+        stale, untracked = [], []
+        for path, value in iter_leaves(source):
+            if not lookup(target, path):
+                # Missing keys are reported by the consistency checks
+                continue
+            recorded = entries.get(key_of(path))
+            if recorded is None:
+                untracked.append(path)
+            elif recorded != source_hash(value):
+                stale.append(path)
+        return MemoryStatus(stale, untracked)
+
+    def prune(self, source: Dict[str, Any], locales: List[str]) -> int:
+        """Drop entries of locales and keys that no longer exist"""
+        valid = {key_of(path) for path, _ in iter_leaves(source)}
+        removed = 0
+        for locale in list(self.entries):
+            if locale not in locales:
+                removed += len(self.entries.pop(locale))
+                continue
+            entries = self.entries[locale]
+            for key in [key for key in entries if key not in valid]:
+                del entries[key]
+                removed += 1
+        self.dirty = self.dirty or removed > 0
+        return removed
+
+    def save(self) -> bool:
+        if not self.dirty:
+            return False
+        data = {
+            "version": MEMORY_VERSION,
+            "source": self.source_locale,
+            "entries": {
+                locale: dict(sorted(entries.items()))
+                for locale, entries in sorted(self.entries.items()) if entries
+            },
+        }
+        content = json.dumps(data, ensure_ascii=False, indent=2) + "\n"
+        self.dirty = False
+        return write_atomic(self.path, content.encode("utf-8"))
+
+
+def stale_paths(
+    memory: Optional[TranslationMemory], source: Dict[str, Any], targets: Dict[str, Dict[str, Any]]
+) -> Dict[str, List[KeyPath]]:
+    if memory is None:
+        return {}
+    return {locale: memory.status(locale, source, target).stale for locale, target in targets.items()}
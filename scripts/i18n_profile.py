@@ -0,0 +1,145 @@
+"""
+i18n tooling profiler
+Per-phase and per-locale wall time, peak traced memory and an optional cProfile
+dump for the i18n scripts, enabled with --profile (--profile=json for JSON).
+Phases nest; each one reports its own time excluding nested phases, so the
+totals add up to the run time.
+"""
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    import cProfile
+
+PROFILE_FORMATS = ("text", "json")
+
+_profiler: Optional["Profiler"] = None
+
+
+class Profiler:
+    """Accumulates exclusive phase timings; a no-op until start() is called"""
+
+    def __init__(self):
+        self.enabled = False
+        self.phases: Dict[str, float] = {}
+        self.locales: Dict[str, Dict[str, float]] = {}
+        self.calls: Dict[str, int] = {}
+        self._stack: List[List[Any]] = []
+        self._started = 0.0
+        self._cprofile: Optional["cProfile.Profile"] = None
+        self._cprofile_path: Optional[str] = None
+
+    def start(self, cprofile_path: Optional[str] = None) -> None:
+        # Imported here so that unprofiled runs do not pay for them
+        import cProfile
+        import tracemalloc
+
+        self.enabled = True
+        tracemalloc.start()
+        if cprofile_path:
+            self._cprofile_path = cprofile_path
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str, locale: Optional[str] = None) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        # [name, locale, start, time spent in nested phases]
+        frame = [name, locale, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[2]
+            own = elapsed - frame[3]
+            if self._stack:
+                self._stack[-1][3] += elapsed
+            self.phases[name] = self.phases.get(name, 0.0) + own
+            self.calls[name] = self.calls.get(name, 0) + 1
+            if locale is not None:
+                per_locale = self.locales.setdefault(locale, {})
+                per_locale[name] = per_locale.get(name, 0.0) + own
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop measuring and return the report as a JSON-ready dict"""
+        import tracemalloc
+
+        total = time.perf_counter() - self._started
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self._cprofile_path)
+        self.enabled = False
+
+        return {
+            "totalMs": _ms(total),
+            "phases": {
+                name: {"ms": _ms(seconds), "calls": self.calls[name]}
+                for name, seconds in self.phases.items()
+            },
+            # Time outside any phase: interpreter work between phases
+            "unaccountedMs": _ms(total - sum(self.phases.values())),
+            "locales": {
+                locale: {name: _ms(seconds) for name, seconds in phases.items()}
+                for locale, phases in self.locales.items()
+            },
+            "peakMemoryBytes": peak,
+            "cprofile": self._cprofile_path,
+        }
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def get_profiler() -> Profiler:
+    """Return the process-wide profiler"""
+    global _profiler
+
+    if _profiler is None:
+        _profiler = Profiler()
+    return _profiler
+
+
+def get_profile_format() -> Optional[str]:
+    """"text" for --profile, FORMAT for --profile=FORMAT, None when not profiling"""
+    for arg in sys.argv:
+        if arg == "--profile":
+            return "text"
+        if arg.startswith("--profile="):
+            fmt = arg.split("=", 1)[1]
+            if fmt not in PROFILE_FORMATS:
+                raise ValueError(f"Unknown profile format '{fmt}', expected one of: {', '.join(PROFILE_FORMATS)}")
+            return fmt
+    return None
+
+
+def print_report(report: Dict[str, Any], fmt: str = "text") -> None:
+    """Print a profile report to stderr so command output stays clean"""
+    out = sys.stderr
+    if fmt == "json":
+        print(json.dumps(report, ensure_ascii=False), file=out)
+        return
+
+    print(f"\n⏱️  Profile: {report['totalMs']:.1f} ms total, "
+          f"peak traced memory {report['peakMemoryBytes'] / 1024 / 1024:.2f} MiB", file=out)
+    for name, entry in sorted(report["phases"].items(), key=lambda item: -item[1]["ms"]):
+        print(f"  {name:<16} {entry['ms']:>10.2f} ms  ({entry['calls']} calls)", file=out)
+    print(f"  {'(other)':<16} {report['unaccountedMs']:>10.2f} ms", file=out)
+
+    if report["locales"]:
+        names = sorted({name for phases in report["locales"].values() for name in phases})
+        print(f"\n  {'locale':<8} " + " ".join(f"{name:>10}" for name in names), file=out)
+        for locale, phases in report["locales"].items():
+            print(f"  {locale:<8} " + " ".join(f"{phases.get(name, 0.0):>10.2f}" for name in names), file=out)
+    if report["cprofile"]:
+        print(f"\n  cProfile stats written to {report['cprofile']} (python -m pstats)", file=out)
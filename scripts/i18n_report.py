@@ -0,0 +1,165 @@
+"""
+i18n structured reports
+Streams findings (locale, key path, kind, exact position) to a JSON, SARIF or
+JUnit file as they are found, so CI can annotate pull requests without parsing
+console output. Selected with --report-format json|sarif|junit [--report PATH].
+"""
+
+import json
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, NamedTuple, Optional
+
+from i18n_catalog import get_option
+
+REPORT_FORMATS = ("json", "sarif", "junit")
+DEFAULT_OUTPUTS = {"json": "i18n-report.json", "sarif": "i18n-report.sarif", "junit": "i18n-report.xml"}
+WRITE_BUFFER = 1 << 20
+
+# Finding kinds and their SARIF rule descriptions
+RULES = {
+    "missing-key": "Key exists in the baseline language but not in this locale",
+    "extra-key": "Key exists in this locale but not in the baseline language",
+    "line-count": "File line count differs from the baseline language",
+    "invalid-json": "Translation file is not valid JSON",
+    "undefined-key": "Key is used in source code but not defined",
+    "stale-translation": "English source changed since the key was translated",
+    "invalid-icu": "Message is not valid ICU MessageFormat",
+    "placeholder-mismatch": "Message arguments, select arms or tags differ from the baseline language",
+}
+
+
+class Finding(NamedTuple):
+    locale: str
+    path: str
+    kind: str
+    message: str
+    file: Optional[str] = None
+    line: Optional[int] = None
+    column: Optional[int] = None
+    severity: str = "error"
+
+
+class ReportWriter:
+    """Base writer: header on open, one record per finding, footer on close"""
+
+    def __init__(self, stream: BinaryIO, command: str):
+        self.stream = stream
+        self.command = command
+        self.count = 0
+        self.by_kind: Dict[str, int] = {}
+        self.write_header()
+
+    def add(self, finding: Finding) -> None:
+        self.write_finding(finding)
+        self.count += 1
+        self.by_kind[finding.kind] = self.by_kind.get(finding.kind, 0) + 1
+
+    def close(self, passed: bool) -> None:
+        self.write_footer(passed)
+        self.stream.close()
+
+    def _write(self, text: str) -> None:
+        self.stream.write(text.encode("utf-8"))
+
+    def write_header(self) -> None:
+        raise NotImplementedError
+
+    def write_finding(self, finding: Finding) -> None:
+        raise NotImplementedError
+
+    def write_footer(self, passed: bool) -> None:
+        raise NotImplementedError
+
+
+class JsonReportWriter(ReportWriter):
+    def write_header(self) -> None:
+        self._write(f'{{"tool": "i18n", "command": {json.dumps(self.command)}, "findings": [')
+
+    def write_finding(self, finding: Finding) -> None:
+        separator = "," if self.count else ""
+        self._write(f"{separator}\n  {json.dumps(finding._asdict(), ensure_ascii=False)}")
+
+    def write_footer(self, passed: bool) -> None:
+        summary = {"passed": passed, "findings": self.count, "byKind": self.by_kind}
+        self._write(f'\n], "summary": {json.dumps(summary)}}}\n')
+
+
+class SarifReportWriter(ReportWriter):
+    """SARIF 2.1.0, as consumed by GitHub code scanning"""
+
+    def write_header(self) -> None:
+        rules = [
+            {"id": kind, "shortDescription": {"text": text}} for kind, text in RULES.items()
+        ]
+        driver = {"name": "i18n-refactor-helper", "rules": rules}
+        self._write(
+            '{"version": "2.1.0", "$schema": "https://json.schemastore.org/sarif-2.1.0.json", '
+            f'"runs": [{{"tool": {{"driver": {json.dumps(driver)}}}, "results": ['
+        )
+
+    def write_finding(self, finding: Finding) -> None:
+        result: Dict[str, Any] = {
+            "ruleId": finding.kind,
+            "level": finding.severity,
+            "message": {"text": finding.message},
+            "properties": {"locale": finding.locale, "keyPath": finding.path},
+        }
+        if finding.file:
+            location: Dict[str, Any] = {"artifactLocation": {"uri": finding.file}}
+            if finding.line:
+                location["region"] = {"startLine": finding.line, "startColumn": finding.column or 1}
+            result["locations"] = [{"physicalLocation": location}]
+        separator = "," if self.count else ""
+        self._write(f"{separator}\n  {json.dumps(result, ensure_ascii=False)}")
+
+    def write_footer(self, passed: bool) -> None:
+        self._write("\n]}]}\n")
+
+
+class JunitReportWriter(ReportWriter):
+    """JUnit XML; one failing test case per finding
+
+    The <testsuite> element carries the counts, so test cases are buffered and
+    the document is written on close. The target never needs to be seekable.
+    """
+
+    def write_header(self) -> None:
+        self._cases: List[str] = []
+
+    def write_finding(self, finding: Finding) -> None:
+        location = f"{finding.file}:{finding.line}" if finding.file and finding.line else finding.file or ""
+        self._cases.append(
+            f'  <testcase classname="i18n.{_xml(finding.locale)}" name="{_xml(finding.kind)} {_xml(finding.path)}">'
+            f'<failure message="{_xml(finding.message)}" type="{_xml(finding.kind)}">{_xml(location)}</failure>'
+            "</testcase>\n"
+        )
+
+    def write_footer(self, passed: bool) -> None:
+        cases = self._cases or [f'  <testcase classname="i18n" name="{_xml(self.command)}"/>\n']
+        self._write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n')
+        self._write(f'<testsuite name="i18n.{_xml(self.command)}" tests="{len(cases)}" failures="{self.count}">\n')
+        self._write("".join(cases))
+        self._write("</testsuite>\n</testsuites>\n")
+
+
+def _xml(text: str) -> str:
+    return (str(text).replace("&", "&amp;").replace("<", "&lt;")
+            .replace(">", "&gt;").replace('"', "&quot;"))
+
+
+WRITERS = {"json": JsonReportWriter, "sarif": SarifReportWriter, "junit": JunitReportWriter}
+
+
+def open_report(fmt: str, path: Path, command: str) -> ReportWriter:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return WRITERS[fmt](open(path, "wb", buffering=WRITE_BUFFER), command)
+
+
+def get_report_writer(command: str) -> Optional[ReportWriter]:
+    """Writer selected by --report-format/--report, or None for console-only output"""
+    fmt = get_option("--report-format", "text")
+    if fmt == "text":
+        return None
+    if fmt not in REPORT_FORMATS:
+        raise ValueError(f"Unknown format '{fmt}', expected text or one of: {', '.join(REPORT_FORMATS)}")
+    return open_report(fmt, Path(get_option("--report", DEFAULT_OUTPUTS[fmt])), command)
@@ -0,0 +1,284 @@
+"""
+i18n machine translation pipeline
+Fills missing and stale keys of every locale from the en-US baseline. Source strings are
+deduplicated across keys and locales, sent in batches with bounded concurrency,
+and retried with an adaptive backoff shared by all requests.
+"""
+
+import asyncio
+import json
+import random
+import re
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+SOURCE_LANGUAGE = "en-US"
+MAX_TEXT_LENGTH = 450
+
+# Same skip rules as isTranslatableText in auto-gen-i18n.js
+SKIP_PATTERNS = [
+    re.compile(r"^\{\{.*\}\}$"),
+    re.compile(r"^\$\{.*\}$"),
+    re.compile(r"^<[^>]+>$"),
+    re.compile(r"function\s*\("),
+    re.compile(r"^\w+\s*=.*$"),
+    re.compile(r"^[A-Z_][A-Z0-9_]*$"),
+    re.compile(r"^\d+(\.\d+)?$"),
+    re.compile(r"^[a-z]+:[a-z0-9-]+$", re.IGNORECASE),
+]
+
+KeyPath = Tuple[str, ...]
+
+
+class TranslationError(Exception):
+    """Raised by a backend when a request fails; `retryable` errors are retried with backoff"""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class TranslationBackend:
+    """Backend interface: translate a batch of texts into one target language"""
+
+    name = "base"
+    # Maximum number of texts per translate() call
+    max_batch = 1
+
+    def language_code(self, locale: str) -> str:
+        """Backend-specific code for a locale; locales sharing a code share requests"""
+        return locale
+
+    async def translate(self, texts: List[str], target: str) -> List[str]:
+        raise NotImplementedError
+
+
+class EchoBackend(TranslationBackend):
+    """Offline backend for tests and dry runs: returns `[<target>] <text>`"""
+
+    name = "echo"
+    max_batch = 50
+
+    def __init__(self):
+        self.calls: List[Tuple[str, int]] = []
+
+    async def translate(self, texts: List[str], target: str) -> List[str]:
+        self.calls.append((target, len(texts)))
+        return [f"[{target}] {text}" for text in texts]
+
+
+class MyMemoryBackend(TranslationBackend):
+    """MyMemory public API, as used by auto-gen-i18n.js (one text per request)"""
+
+    name = "mymemory"
+    max_batch = 1
+    url = "https://api.mymemory.translated.net/get"
+    contact = "license@iflabx.com"
+    language_map = {
+        "zh-CN": "zh-CN",
+        "zh-TW": "zh-TW",
+        "ja-JP": "ja",
+        "de-DE": "de",
+        "fr-FR": "fr",
+        "es-ES": "es",
+        "ru-RU": "ru",
+        "it-IT": "it",
+        "pt-PT": "pt",
+    }
+
+    def language_code(self, locale: str) -> str:
+        return self.language_map.get(locale, locale.split("-")[0])
+
+    async def translate(self, texts: List[str], target: str) -> List[str]:
+        return [await asyncio.to_thread(self._translate_one, text, target) for text in texts]
+
+    def _translate_one(self, text: str, target: str) -> str:
+        query = urllib.parse.urlencode({"q": text, "langpair": f"en|{target}", "de": self.contact})
+        request = urllib.request.Request(f"{self.url}?{query}", headers={"User-Agent": "AgentifUI/1.0"})
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                data = json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            raise TranslationError(f"HTTP {e.code}: {e.reason}", retryable=e.code == 429 or e.code >= 500)
+        except (urllib.error.URLError, TimeoutError, ValueError) as e:
+            raise TranslationError(str(e))
+
+        if data.get("responseStatus") == 200 and data.get("responseData"):
+            translated = data["responseData"].get("translatedText")
+            if translated:
+                return translated
+        raise TranslationError(f"Translation API error: {data.get('responseDetails') or 'Unknown error'}")
+
+
+BACKENDS = {backend.name: backend for backend in (EchoBackend, MyMemoryBackend)}
+
+
+class AdaptiveBackoff:
+    """Shared delay between requests: doubles on failure, halves on success"""
+
+    def __init__(self, base: float = 0.5, maximum: float = 30.0):
+        self.base = base
+        self.maximum = maximum
+        self.delay = 0.0
+
+    async def wait(self) -> None:
+        if self.delay:
+            # Jitter keeps concurrent workers from retrying in lockstep
+            await asyncio.sleep(self.delay * random.uniform(0.5, 1.0))
+
+    def failure(self) -> None:
+        self.delay = min(self.maximum, max(self.base, self.delay * 2))
+
+    def success(self) -> None:
+        self.delay = self.delay / 2 if self.delay > self.base else 0.0
+
+
+class TranslationPlan(NamedTuple):
+    # (backend language, source text) -> [(locale, key path), ...]
+    units: Dict[Tuple[str, str], List[Tuple[str, KeyPath]]]
+    # locale -> [(key path, value)] copied from the baseline without translation
+    copies: Dict[str, List[Tuple[KeyPath, Any]]]
+    missing: Dict[str, int]
+
+
+class TranslationStats(NamedTuple):
+    translated: int
+    copied: int
+    errors: int
+    requests: int
+    unique_texts: int
+    # (locale, key path) of every key filled with a translation or copied value
+    filled: List[Tuple[str, KeyPath]]
+
+
+def is_translatable(text: Any) -> bool:
+    if not isinstance(text, str) or not text.strip():
+        return False
+    return not any(pattern.search(text.strip()) for pattern in SKIP_PATTERNS)
+
+
+def iter_missing(
+    source: Any, target: Any, stale: Set[KeyPath] = frozenset(), path: KeyPath = ()
+) -> Iterator[Tuple[KeyPath, Any]]:
+    """Yield baseline leaves whose target value is absent, empty (like translateMissingKeys) or stale"""
+    for key, value in source.items():
+        current = target.get(key) if isinstance(target, dict) else None
+        if isinstance(value, dict):
+            yield from iter_missing(value, current if isinstance(current, dict) else {}, stale, path + (key,))
+        elif not current or path + (key,) in stale:
+            yield path + (key,), value
+
+
+def set_path(tree: Dict[str, Any], path: KeyPath, value: Any) -> None:
+    node = tree
+    for key in path[:-1]:
+        child = node.get(key)
+        if not isinstance(child, dict):
+            child = node[key] = {}
+        node = child
+    node[path[-1]] = value
+
+
+def plan_translations(
+    source: Dict[str, Any],
+    targets: Dict[str, Dict[str, Any]],
+    backend: TranslationBackend,
+    stale: Optional[Dict[str, List[KeyPath]]] = None,
+) -> TranslationPlan:
+    """Collect missing and stale keys of all targets, deduplicating identical source texts"""
+    stale = stale or {}
+    units: Dict[Tuple[str, str], List[Tuple[str, KeyPath]]] = {}
+    copies: Dict[str, List[Tuple[KeyPath, Any]]] = {}
+    missing: Dict[str, int] = {}
+
+    for locale, target in targets.items():
+        code = backend.language_code(locale)
+        count = 0
+        for path, value in iter_missing(source, target, set(stale.get(locale, ()))):
+            count += 1
+            if is_translatable(value) and len(value) <= MAX_TEXT_LENGTH:
+                units.setdefault((code, value), []).append((locale, path))
+            else:
+                copies.setdefault(locale, []).append((path, value))
+        missing[locale] = count
+
+    return TranslationPlan(units, copies, missing)
+
+
+async def _run_batches(
+    plan: TranslationPlan, backend: TranslationBackend, concurrency: int, retries: int
+) -> Tuple[Dict[Tuple[str, str], str], int, int]:
+    """Translate every unique text; returns translations, request count and failed text count"""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    backoff = AdaptiveBackoff()
+    results: Dict[Tuple[str, str], str] = {}
+    counters = {"requests": 0, "errors": 0}
+
+    by_language: Dict[str, List[str]] = {}
+    for code, text in plan.units:
+        by_language.setdefault(code, []).append(text)
+
+    async def run_batch(code: str, texts: List[str]) -> None:
+        async with semaphore:
+            for attempt in range(retries):
+                await backoff.wait()
+                counters["requests"] += 1
+                try:
+                    translated = await backend.translate(texts, code)
+                except TranslationError as e:
+                    backoff.failure()
+                    if not e.retryable or attempt == retries - 1:
+                        print(f"⚠️  {len(texts)} texts to {code} failed: {e}")
+                        counters["errors"] += len(texts)
+                        return
+                    continue
+                backoff.success()
+                for text, result in zip(texts, translated):
+                    results[(code, text)] = result
+                return
+
+    batches = [
+        run_batch(code, texts[i:i + backend.max_batch])
+        for code, texts in by_language.items()
+        for i in range(0, len(texts), backend.max_batch)
+    ]
+    await asyncio.gather(*batches)
+    return results, counters["requests"], counters["errors"]
+
+
+def translate_missing(
+    source: Dict[str, Any],
+    targets: Dict[str, Dict[str, Any]],
+    backend: TranslationBackend,
+    concurrency: int = 4,
+    retries: int = 3,
+    plan: Optional[TranslationPlan] = None,
+) -> TranslationStats:
+    """Fill missing keys of `targets` in place
+
+    Failed translations fall back to the source text, like auto-gen-i18n.js.
+    """
+    plan = plan or plan_translations(source, targets, backend)
+    results, requests, errors = asyncio.run(_run_batches(plan, backend, concurrency, retries))
+
+    filled: List[Tuple[str, KeyPath]] = []
+    translated = 0
+    for (code, text), destinations in plan.units.items():
+        succeeded = (code, text) in results
+        value = results.get((code, text), text)
+        for locale, path in destinations:
+            set_path(targets[locale], path, value)
+            if succeeded:
+                translated += 1
+                filled.append((locale, path))
+
+    copied = 0
+    for locale, entries in plan.copies.items():
+        for path, value in entries:
+            set_path(targets[locale], path, value)
+            filled.append((locale, path))
+            copied += 1
+
+    return TranslationStats(translated, copied, errors, requests, len(plan.units), filled)
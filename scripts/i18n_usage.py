@@ -0,0 +1,238 @@
+"""
+i18n source usage index
+Scans the TS/TSX tree for useTranslations/getTranslations bindings and their
+t('...') calls, caching per-file results by content hash, so translation keys can
+be checked against what the code actually uses.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from i18n_catalog import write_atomic, resolve_jobs
+
+SOURCE_DIRS = (Path("app"), Path("components"), Path("lib"))
+SOURCE_SUFFIXES = (".ts", ".tsx")
+# Bump the version when the per-file result layout or the scanner rules change
+USAGE_CACHE_PATH = Path(".cache/i18n/usage-v1.json")
+
+# const t = useTranslations('ns') / const t = await getTranslations({ namespace: 'ns' })
+BINDING_PATTERN = re.compile(
+    r"\b(?:const|let|var)\s+(\w+)\s*=\s*(?:await\s+)?(?:useTranslations|getTranslations)\s*\(([^)]*)\)"
+)
+# const { t: dynamicT } = useDynamicTranslations({ sections: ['pages.about'] })
+DYNAMIC_SECTIONS_PATTERN = re.compile(
+    r"useDynamicTranslations\s*\(\s*\{[^}]*?sections\s*:\s*\[([^\]]*)\]", re.DOTALL
+)
+STRING_LITERAL_PATTERN = re.compile(r"(['\"`])((?:(?!\1)[^\\]|\\.)*)\1")
+NAMESPACE_OPTION_PATTERN = re.compile(r"namespace\s*:\s*(['\"`])([^'\"`]*)\1")
+
+
+class FileUsage(NamedTuple):
+    """Translation references found in one source file"""
+
+    # (full key, line) for static keys
+    keys: List[Tuple[str, int]]
+    # Key prefixes used as a whole: template literals (`messages.roles.`), and
+    # t.raw() keys or dynamic sections as `key.`
+    prefixes: List[str]
+    # Calls whose key is not a literal and cannot be resolved
+    unresolved: int
+
+
+class UsageReport(NamedTuple):
+    files: int
+    rescanned: int
+    references: int
+    unresolved: int
+    unused: List[str]
+    # full key -> [(file, line), ...]
+    undefined: Dict[str, List[Tuple[str, int]]]
+
+
+def _namespace_of(args: str) -> str:
+    """Namespace passed to useTranslations/getTranslations, '' for the root"""
+    args = args.strip()
+    if not args:
+        return ""
+    option = NAMESPACE_OPTION_PATTERN.search(args)
+    if option:
+        return option.group(2)
+    literal = STRING_LITERAL_PATTERN.match(args)
+    return literal.group(2) if literal else ""
+
+
+def _join_key(namespace: str, key: str) -> str:
+    return f"{namespace}.{key}" if namespace else key
+
+
+def scan_source(text: str) -> FileUsage:
+    """Extract translation references from TS/TSX source text"""
+    keys: List[Tuple[str, int]] = []
+    prefixes: List[str] = []
+    unresolved = 0
+
+    for match in DYNAMIC_SECTIONS_PATTERN.finditer(text):
+        prefixes.extend(
+            f"{literal.group(2)}." for literal in STRING_LITERAL_PATTERN.finditer(match.group(1))
+        )
+
+    # Each variable name maps to its bindings in source order; a call uses the
+    # nearest preceding binding (or the first one for calls above all bindings)
+    bindings: Dict[str, List[Tuple[int, str]]] = {}
+    for match in BINDING_PATTERN.finditer(text):
+        bindings.setdefault(match.group(1), []).append((match.end(), _namespace_of(match.group(2))))
+    if not bindings:
+        return FileUsage(keys, prefixes, unresolved)
+
+    names = "|".join(re.escape(name) for name in sorted(bindings, key=len, reverse=True))
+    call_pattern = re.compile(
+        rf"(?<![\w.$])({names})(?:\.(rich|markup|raw|has))?\s*\(\s*(?:(['\"])((?:(?!\3)[^\\\n])*)\3|`([^`]*)`)?"
+    )
+
+    for match in call_pattern.finditer(text):
+        name, method, _, literal, template = match.groups()
+        namespace = _namespace_for(bindings[name], match.start())
+        line = text.count("\n", 0, match.start()) + 1
+
+        if literal is not None:
+            full_key = _join_key(namespace, literal)
+            keys.append((full_key, line))
+            if method == "raw":
+                prefixes.append(f"{full_key}.")
+        elif template is not None:
+            static_part = template.split("${", 1)[0]
+            if "${" not in template:
+                keys.append((_join_key(namespace, template), line))
+            elif namespace or static_part:
+                prefixes.append(_join_key(namespace, static_part) if namespace else static_part)
+            else:
+                # A fully dynamic key on the root namespace could be anything
+                unresolved += 1
+        else:
+            unresolved += 1
+
+    return FileUsage(keys, prefixes, unresolved)
+
+
+def _namespace_for(file_bindings: List[Tuple[int, str]], position: int) -> str:
+    namespace = file_bindings[0][1]
+    for end, candidate in file_bindings:
+        if end > position:
+            break
+        namespace = candidate
+    return namespace
+
+
+def _scan_file(path: Path) -> Tuple[str, Dict[str, Any]]:
+    """Worker: hash and scan one file"""
+    raw = path.read_bytes()
+    usage = scan_source(raw.decode("utf-8", errors="replace"))
+    return hashlib.sha256(raw).hexdigest(), usage._asdict()
+
+
+def _source_files(source_dirs: Tuple[Path, ...]) -> List[Path]:
+    files = []
+    for source_dir in source_dirs:
+        if source_dir.is_dir():
+            files.extend(
+                path for path in source_dir.rglob("*")
+                if path.suffix in SOURCE_SUFFIXES and "node_modules" not in path.parts
+            )
+    return sorted(files)
+
+
+def build_usage_index(
+    source_dirs: Tuple[Path, ...] = SOURCE_DIRS,
+    jobs: int = 1,
+    cache_path: Optional[Path] = USAGE_CACHE_PATH,
+) -> Tuple[Dict[str, FileUsage], int]:
+    """Scan every source file, reusing cached results for files whose hash is unchanged
+
+    Returns the per-file usage (sorted by path) and the number of files rescanned.
+    """
+    cached: Dict[str, Any] = {}
+    if cache_path is not None and cache_path.exists():
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = {}
+
+    files = _source_files(source_dirs)
+    entries: Dict[str, Dict[str, Any]] = {}
+    pending: List[Path] = []
+    for path in files:
+        entry = cached.get(path.as_posix())
+        if entry is not None and entry["hash"] == hashlib.sha256(path.read_bytes()).hexdigest():
+            entries[path.as_posix()] = entry
+        else:
+            pending.append(path)
+
+    jobs = resolve_jobs(jobs)
+    if jobs > 1 and len(pending) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+            scanned = list(pool.map(_scan_file, pending, chunksize=16))
+    else:
+        scanned = [_scan_file(path) for path in pending]
+    for path, (digest, usage) in zip(pending, scanned):
+        entries[path.as_posix()] = {"hash": digest, "usage": usage}
+
+    if cache_path is not None and pending:
+        try:
+            write_atomic(cache_path, json.dumps(entries, ensure_ascii=False).encode("utf-8"))
+        except OSError:
+            pass
+
+    index = {}
+    for path in files:
+        usage = entries[path.as_posix()]["usage"]
+        index[path.as_posix()] = FileUsage(
+            [tuple(key) for key in usage["keys"]], usage["prefixes"], usage["unresolved"]
+        )
+    return index, len(pending)
+
+
+def leaf_keys(obj: Any, prefix: str = "") -> List[str]:
+    """Dotted paths of all message values (lists count as single values)"""
+    leaves = []
+    for key, value in obj.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            leaves.extend(leaf_keys(value, path))
+        else:
+            leaves.append(path)
+    return leaves
+
+
+def analyze_usage(
+    index: Dict[str, FileUsage], messages: Dict[str, Any], defined_keys: Set[str], rescanned: int
+) -> UsageReport:
+    """Compare the usage index with the defined message keys"""
+    used: Set[str] = set()
+    prefixes: Set[str] = set()
+    undefined: Dict[str, List[Tuple[str, int]]] = {}
+    references = 0
+    unresolved = 0
+
+    for file_path, usage in index.items():
+        unresolved += usage.unresolved
+        prefixes.update(usage.prefixes)
+        for key, line in usage.keys:
+            references += 1
+            used.add(key)
+            if key not in defined_keys:
+                undefined.setdefault(key, []).append((file_path, line))
+
+    # Everything below a used object key or a dynamic prefix counts as used
+    used_prefixes = tuple(sorted({f"{key}." for key in used} | prefixes))
+
+    unused = [
+        leaf for leaf in leaf_keys(messages)
+        if leaf not in used and not leaf.startswith(used_prefixes)
+    ]
+
+    return UsageReport(len(index), rescanned, references, unresolved, sorted(unused), dict(sorted(undefined.items())))
@@ -0,0 +1,283 @@
+"""
+i18n watch mode
+Keeps the translation model in memory, watches messages/*.json (inotify on
+Linux, mtime polling elsewhere) and re-validates only the locale that changed.
+Results go to stdout and, optionally, to clients of a local Unix socket as
+JSON lines.
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import socket
+import struct
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from i18n_catalog import CatalogError, TranslationModel, diff_catalogs
+
+# Changes arriving within this window are validated together (editors often
+# write a file in several steps)
+DEBOUNCE_SECONDS = 0.02
+POLL_INTERVAL = 0.25
+# Placeholders are compared against English, as quick-check does
+PARITY_LANG = "en-US"
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class PollingWatcher:
+    """Detect changed files by comparing (mtime, size) between polls"""
+
+    fd: Optional[int] = None
+
+    def __init__(self, files: Dict[str, Path], interval: float = POLL_INTERVAL):
+        self.files = files
+        self.interval = interval
+        self.state = {name: self._stat(path) for name, path in files.items()}
+
+    @staticmethod
+    def _stat(path: Path):
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def changed(self) -> Set[str]:
+        changed = set()
+        for name, path in self.files.items():
+            current = self._stat(path)
+            if current != self.state[name]:
+                self.state[name] = current
+                changed.add(name)
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify on the messages directory, through libc"""
+
+    def __init__(self, files: Dict[str, Path], directory: Path):
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            raise OSError("libc not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+
+        self.by_filename = {path.name: name for name, path in files.items()}
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+        if libc.inotify_add_watch(self.fd, str(directory).encode(), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+
+    def changed(self) -> Set[str]:
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                filename = data[offset:offset + length].rstrip(b"\0").decode("utf-8", "replace")
+                offset += length
+                if filename in self.by_filename:
+                    changed.add(self.by_filename[filename])
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def make_watcher(files: Dict[str, Path], directory: Path, polling: bool = False):
+    if not polling:
+        try:
+            return InotifyWatcher(files, directory)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(files)
+
+
+class SocketPublisher:
+    """Unix socket server broadcasting result lines; new clients get the latest state
+
+    Clients are non-blocking so a stalled reader cannot hold up the watch loop:
+    one whose socket buffer cannot take a whole line is disconnected (any partial
+    last line is cut off) and can reconnect to get the latest state again.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        if path.exists():
+            path.unlink()
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(str(path))
+        self.server.listen()
+        self.server.setblocking(False)
+        self.clients: List[socket.socket] = []
+        self.latest: Dict[str, bytes] = {}
+
+    def accept(self) -> None:
+        while True:
+            try:
+                client, _ = self.server.accept()
+            except BlockingIOError:
+                return
+            client.setblocking(False)
+            self.clients.append(client)
+            for line in self.latest.values():
+                if not self._send(client, line):
+                    break
+
+    def publish(self, result: Dict[str, Any]) -> None:
+        line = (json.dumps(result, ensure_ascii=False) + "\n").encode("utf-8")
+        self.latest[result["locale"]] = line
+        for client in list(self.clients):
+            self._send(client, line)
+
+    def _send(self, client: socket.socket, line: bytes) -> bool:
+        """Send without blocking; returns False (and drops the client) if it fails"""
+        try:
+            sent = client.send(line)
+        except OSError:
+            # Includes BlockingIOError from a full socket buffer
+            sent = 0
+        if sent == len(line):
+            return True
+        self.clients.remove(client)
+        client.close()
+        return False
+
+    def close(self) -> None:
+        for client in self.clients:
+            client.close()
+        self.server.close()
+        if self.path.exists():
+            self.path.unlink()
+
+
+def validate_locale(
+    model: TranslationModel, lang: str, base_lang: str, parity_lang: str = PARITY_LANG
+) -> Dict[str, Any]:
+    """Check one locale against the in-memory baselines, like quick-check
+
+    Keys and line count are compared with `base_lang`, ICU placeholders with `parity_lang`.
+    """
+    started = time.perf_counter()
+    try:
+        base = model.catalog(base_lang)
+        catalog = model.catalog(lang)
+        missing, extra = diff_catalogs(base, catalog).object_keys()
+        placeholders = [issue._asdict() for issue in model.placeholder_parity(parity_lang, [lang])[lang]]
+        result = {
+            "locale": lang,
+            "ok": not missing and not extra and catalog.line_count == base.line_count and not placeholders,
+            "missing": missing,
+            "extra": extra,
+            "lineCount": catalog.line_count,
+            "baselineLineCount": base.line_count,
+            "placeholders": placeholders,
+        }
+    except CatalogError as e:
+        result = {"locale": lang, "ok": False, "error": str(e)}
+    result["elapsedMs"] = round((time.perf_counter() - started) * 1000, 2)
+    return result
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    lang = result["locale"]
+    elapsed = f"({result['elapsedMs']} ms)"
+    if "error" in result:
+        return f"❌ {lang}: {result['error']} {elapsed}"
+    if result["ok"]:
+        return f"✅ {lang} is consistent {elapsed}"
+    lines = [f"❌ {lang} is inconsistent {elapsed}"]
+    if result["missing"]:
+        lines.append(f"    Missing {len(result['missing'])} keys: {', '.join(result['missing'][:5])}"
+                     + (" ..." if len(result["missing"]) > 5 else ""))
+    if result["extra"]:
+        lines.append(f"    Extra {len(result['extra'])} keys: {', '.join(result['extra'][:5])}"
+                     + (" ..." if len(result["extra"]) > 5 else ""))
+    if result["lineCount"] != result["baselineLineCount"]:
+        lines.append(f"    {result['lineCount']} lines, baseline has {result['baselineLineCount']}")
+    for issue in result["placeholders"][:5]:
+        lines.append(f"    {issue['path']}: {issue['message']}")
+    if len(result["placeholders"]) > 5:
+        lines.append(f"    ... {len(result['placeholders']) - 5} more placeholder issues")
+    return "\n".join(lines)
+
+
+def watch(
+    model: TranslationModel,
+    base_lang: str,
+    socket_path: Optional[Path] = None,
+    polling: bool = False,
+    quiet: bool = False,
+    parity_lang: str = PARITY_LANG,
+) -> None:
+    """Validate everything once, then re-validate changed locales until interrupted"""
+    files = {lang: model.catalog(lang).path for lang in model.languages}
+    watcher = make_watcher(files, model.messages_dir, polling)
+    publisher = SocketPublisher(socket_path) if socket_path else None
+
+    def emit(langs: Set[str]) -> None:
+        for lang in langs:
+            model.invalidate(lang)
+        # A baseline change affects every locale; the key baseline itself is
+        # still checked for placeholders
+        if base_lang in langs or parity_lang in langs:
+            targets = model.languages
+        else:
+            targets = [lang for lang in model.languages if lang in langs]
+        for lang in targets:
+            result = validate_locale(model, lang, base_lang, parity_lang)
+            if not quiet or not result["ok"]:
+                print(format_result(result), flush=True)
+            if publisher:
+                publisher.publish(result)
+
+    kind = "inotify" if isinstance(watcher, InotifyWatcher) else "polling"
+    print(f"👀 Watching {model.messages_dir}/ ({kind}, baseline: {base_lang})", flush=True)
+    if publisher:
+        print(f"📡 Publishing results on {socket_path}", flush=True)
+    emit(set(model.languages))
+
+    try:
+        while True:
+            readers = [fd for fd in (watcher.fd, publisher.server.fileno() if publisher else None) if fd is not None]
+            if readers:
+                timeout = None if watcher.fd is not None else watcher.interval
+                ready, _, _ = select.select(readers, [], [], timeout)
+            else:
+                # Polling without a socket: select() with no descriptors fails on Windows
+                time.sleep(watcher.interval)
+                ready = []
+            if publisher and publisher.server.fileno() in ready:
+                publisher.accept()
+            if watcher.fd is not None and watcher.fd not in ready:
+                continue
+            changed = watcher.changed()
+            if changed:
+                time.sleep(DEBOUNCE_SECONDS)
+                changed |= watcher.changed()
+                emit(changed)
+    finally:
+        watcher.close()
+        if publisher:
+            publisher.close()
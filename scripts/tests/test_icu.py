@@ -0,0 +1,89 @@
+import pytest
+
+from i18n_icu import IcuSyntaxError, check_parity, message_signatures, parse_message
+
+
+def test_nested_plural_select_and_tags():
+    signature = parse_message(
+        "{n, plural, one {# file in {folder}} "
+        "other {{count, number} files <b>{who, select, male {his} female {her} other {their}}</b>}}"
+    )
+
+    assert signature.args == {"n": "plural", "folder": "string", "count": "number", "who": "select"}
+    assert signature.arms == {"n": ["one", "other"], "who": ["female", "male", "other"]}
+    assert signature.tags == ["b"]
+
+
+@pytest.mark.parametrize("text, args", [
+    ("It's {n}", {"n": "string"}),
+    ("'{literal}' {x}", {"x": "string"}),
+    ("Don''t {x}", {"x": "string"}),
+    ("# outside plurals {x}", {"x": "string"}),
+    ("{n, plural, =0 {none} other {'#' is # items}}", {"n": "plural"}),
+    ("{d, date, short} {p, number, ::percent}", {"d": "date", "p": "number"}),
+    ("Documents < 15MB", {}),
+])
+def test_quoting_literals_and_formats(text, args):
+    assert parse_message(text).args == args
+
+
+def test_tags_nest_and_selfclose():
+    signature = parse_message("<link>Open <b>now</b></link><br></br><hr/>")
+
+    assert signature.tags == ["b", "br", "hr", "link"]
+    assert signature.args == {}
+
+
+@pytest.mark.parametrize("text, message, offset", [
+    ("{n, plural, one {x}}", "Missing 'other' arm", 0),
+    ("{n", "Invalid argument", 0),
+    ("x}", "Unmatched '}'", 1),
+    ('<span class="red">x</span>', "tags cannot have attributes", 0),
+    ("{n, plural, few {a} few {b} other {c}}", "Duplicate selector 'few'", 20),
+    ("<b>x", "Unclosed tag <b>", 4),
+    ("<b>x</i>", "Unexpected closing tag", 4),
+    ("{n, foo}", "Unknown argument type 'foo'", 0),
+    ("{n, plural, wrong {x} other {y}}", "Invalid plural category 'wrong'", 12),
+    ("{n, select, a {x} other {y}", "Unclosed select argument", 0),
+    ("{n, plural, other {{m, select, a {x}}}}", "Missing 'other' arm in select argument 'm'", 19),
+])
+def test_malformed_messages(text, message, offset):
+    with pytest.raises(IcuSyntaxError, match=message) as error:
+        parse_message(text)
+    assert error.value.offset == offset
+
+
+def test_message_signatures_keep_only_messages_with_syntax():
+    signatures = message_signatures({"a": {"plain": "Hello", "named": "Hi {name}"}, "bad": "{x", "l": ["<b>x</b>"]})
+
+    assert signatures == {
+        "a.named": {"args": {"name": "string"}},
+        "bad": {"error": "Invalid argument at offset 0"},
+        "l[0]": {"tags": ["b"]},
+    }
+
+
+def test_parity_against_the_baseline():
+    select, plural = "{g, select, x {X} other {O}}", "{n, plural, one {#} other {#}}"
+    trees = {
+        "en-US": {"a": "Hi {name}", "b": select, "c": "<b>x</b>", "d": plural},
+        "de-DE": {"a": "Hallo {nom}", "b": "{g, select, y {Y} other {O}}", "c": "x", "d": "{n, plural, other {#}}"},
+        "fr-FR": {"a": "Salut {name}", "b": select, "c": "<b>x</b>", "d": "{n"},
+    }
+    signatures = {lang: message_signatures(tree) for lang, tree in trees.items()}
+    paths = {lang: set(tree) for lang, tree in trees.items()}
+    issues = check_parity(signatures, paths, "en-US")
+
+    assert issues["en-US"] == []
+    # Plural arms legitimately differ between languages
+    assert [(issue.path, issue.kind) for issue in issues["de-DE"]] == [
+        ("a", "missing-arg"), ("a", "extra-arg"), ("b", "arms"), ("c", "tags"),
+    ]
+    assert [(issue.path, issue.kind) for issue in issues["fr-FR"]] == [("d", "invalid")]
+
+
+def test_parity_skips_keys_missing_from_a_locale():
+    signatures = {"en-US": message_signatures({"a": "Hi {name}"}), "de-DE": {}}
+    issues = check_parity(signatures, {"en-US": {"a"}, "de-DE": set()}, "en-US")
+
+    assert issues == {"en-US": [], "de-DE": []}
@@ -0,0 +1,109 @@
+import json
+
+import pytest
+
+from i18n_journal import JournalError, compact, journal_path, pending_path, replay
+
+
+def write_locale(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def write_journal(path, *entries):
+    path.write_text("".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries), encoding="utf-8")
+
+
+@pytest.fixture
+def locale_file(tmp_path):
+    path = tmp_path / "de-DE.json"
+    write_locale(path, {"home": {"title": "Start", "subtitle": "Willkommen"}, "footer": {"copy": "©"}})
+    return path
+
+
+@pytest.fixture
+def journal_dir(tmp_path):
+    path = tmp_path / ".journal"
+    path.mkdir()
+    return path
+
+
+def test_replay_merges_and_replaces_sections(tmp_path):
+    journal = tmp_path / "edits.jsonl"
+    write_journal(
+        journal,
+        {"section": "home", "updates": {"title": "Startseite"}},
+        {"section": "footer", "updates": {"year": "2026"}, "mode": "replace"},
+        {"updates": {"home": {"new": "Neu"}}},
+        {"section": "home", "updates": {"subtitle": "Hallo"}},
+    )
+    data = {"home": {"title": "Start", "subtitle": "Willkommen"}, "footer": {"copy": "©"}}
+    result = replay(data, [journal])
+
+    assert result.data == {
+        "home": {"title": "Startseite", "subtitle": "Hallo", "new": "Neu"},
+        "footer": {"year": "2026"},
+    }
+    assert result.entries == 4
+    assert result.sections == ["home", "footer", ""]
+
+
+def test_compact_applies_the_journal_and_clears_it(locale_file, journal_dir):
+    write_journal(journal_path("de-DE", journal_dir), {"section": "home", "updates": {"title": "Startseite"}})
+    result = compact("de-DE", locale_file, journal_dir)
+
+    assert result.entries == 1
+    assert json.loads(locale_file.read_text(encoding="utf-8"))["home"]["title"] == "Startseite"
+    assert list(journal_dir.iterdir()) == []
+    assert compact("de-DE", locale_file, journal_dir) is None
+
+
+def test_leftover_compacting_file_is_applied_before_the_live_journal(locale_file, journal_dir):
+    write_journal(
+        pending_path("de-DE", journal_dir),
+        {"section": "home", "updates": {"title": "Alt"}},
+        {"section": "home", "updates": {"subtitle": "Hallo"}},
+    )
+    write_journal(journal_path("de-DE", journal_dir), {"section": "home", "updates": {"title": "Neu"}})
+    result = compact("de-DE", locale_file, journal_dir)
+
+    assert result.entries == 3
+    assert result.sections == ["home"]
+    assert json.loads(locale_file.read_text(encoding="utf-8"))["home"] == {"title": "Neu", "subtitle": "Hallo"}
+    assert list(journal_dir.iterdir()) == []
+
+
+def test_leftover_compacting_file_alone_is_applied(locale_file, journal_dir):
+    write_journal(pending_path("de-DE", journal_dir), {"section": "home", "updates": {"title": "Alt"}})
+    result = compact("de-DE", locale_file, journal_dir)
+
+    assert result.entries == 1
+    assert json.loads(locale_file.read_text(encoding="utf-8"))["home"]["title"] == "Alt"
+    assert list(journal_dir.iterdir()) == []
+
+
+def test_invalid_entry_leaves_the_renamed_journal_and_the_file(locale_file, journal_dir):
+    before = locale_file.read_text(encoding="utf-8")
+    write_journal(
+        journal_path("de-DE", journal_dir),
+        {"section": "home", "updates": {"title": "Startseite"}},
+        {"section": "home", "updates": {"title": "{count, plural, one {x}}"}},
+    )
+    with pytest.raises(JournalError) as error:
+        compact("de-DE", locale_file, journal_dir)
+
+    assert error.value.line == 2
+    assert locale_file.read_text(encoding="utf-8") == before
+    assert pending_path("de-DE", journal_dir).exists()
+    assert not journal_path("de-DE", journal_dir).exists()
+
+
+def test_dry_run_replays_both_files_without_writing(locale_file, journal_dir):
+    before = locale_file.read_text(encoding="utf-8")
+    write_journal(pending_path("de-DE", journal_dir), {"section": "home", "updates": {"title": "Alt"}})
+    write_journal(journal_path("de-DE", journal_dir), {"section": "footer", "updates": {"copy": "©"}})
+    result = compact("de-DE", locale_file, journal_dir, dry_run=True)
+
+    assert result.entries == 2
+    assert result.sections == ["home", "footer"]
+    assert locale_file.read_text(encoding="utf-8") == before
+    assert sorted(path.name for path in journal_dir.iterdir()) == ["de-DE.jsonl", "de-DE.jsonl.compacting"]
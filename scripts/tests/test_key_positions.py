@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from i18n_catalog import CatalogError, iter_key_positions
+
+
+def positions(text):
+    return {position.path: position for position in iter_key_positions(text)}
+
+
+def test_paths_values_and_positions():
+    text = (
+        '{\n'
+        '  "a": {\n'
+        '    "b": "x",\n'
+        '    "l": [1, {"m": true}, null]\n'
+        '  },\n'
+        '  "z": -1.5e3\n'
+        '}\n'
+    )
+    result = [tuple(position) for position in iter_key_positions(text)]
+
+    assert result == [
+        ("a", None, 2, 3),
+        ("a.b", "x", 3, 5),
+        ("a.l", None, 4, 5),
+        ("a.l[0]", 1, 4, 11),
+        ("a.l[1]", None, 4, 14),
+        ("a.l[1].m", True, 4, 15),
+        ("a.l[2]", None, 4, 27),
+        ("z", -1500.0, 6, 3),
+    ]
+
+
+def test_escapes_in_keys_and_values():
+    text = '{"say \\"hi\\"": "line\\nbreak \\u00e9 \\ud83d\\ude00", "back\\\\slash": "\\/"}'
+    result = positions(text)
+
+    assert result['say "hi"'].value == "line\nbreak é 😀"
+    assert result["back\\slash"].value == "/"
+    # Escapes are counted as written: the second key starts after the first value's raw text
+    assert result["back\\slash"].column == text.index('"back') + 1
+
+
+def test_columns_count_characters_not_bytes():
+    text = '{\n  "标题": "设置", "ключ": "значение"\n}'
+    result = positions(text)
+
+    assert (result["标题"].line, result["标题"].column) == (2, 3)
+    line = text.splitlines()[1]
+    assert result["ключ"].column == line.index('"ключ"') + 1 == 15
+
+
+def test_line_numbers_across_a_pretty_printed_tree():
+    data = {f"section{i}": {f"key{j}": f"value {i}.{j}" for j in range(3)} for i in range(4)}
+    text = json.dumps(data, indent=2)
+    lines = text.splitlines()
+    result = positions(text)
+
+    for path, position in result.items():
+        key = path.rsplit(".", 1)[-1]
+        assert lines[position.line - 1].index(f'"{key}"') + 1 == position.column
+    assert {path for path, position in result.items() if position.value is not None} == {
+        f"section{i}.key{j}" for i in range(4) for j in range(3)
+    }
+
+
+def test_invalid_token_reports_its_position():
+    with pytest.raises(CatalogError, match="line 2, column 8"):
+        list(iter_key_positions('{\n  "a": @\n}'))
@@ -0,0 +1,64 @@
+import json
+
+from i18n_catalog import SYNC_MARKER, canonical_json, sync_tree
+
+BASE = {
+    "home": {"title": "Home", "subtitle": "Welcome", "count": "{n} items"},
+    "menu": {"open": "Open", "close": "Close"},
+    "items": ["One", "Two"],
+}
+
+
+def test_prunes_fills_and_reorders_in_baseline_order():
+    target = {
+        "menu": {"close": "Schließen", "old": "Alt"},
+        "home": {"subtitle": "Willkommen", "title": "Start"},
+        "legacy": {"x": "y"},
+    }
+    result = sync_tree(BASE, target)
+
+    assert list(result.data) == ["home", "menu", "items"]
+    assert list(result.data["home"]) == ["title", "subtitle", "count"]
+    assert list(result.data["menu"]) == ["open", "close"]
+    assert result.data["home"]["title"] == "Start"
+    assert result.data["menu"] == {"open": "Open", "close": "Schließen"}
+    assert result.filled == ["home.count", "menu.open", "items"]
+    assert result.pruned == ["legacy", "menu.old"]
+    assert result.reordered == ["home", ""]
+
+
+def test_marker_prefixes_filled_strings_only():
+    result = sync_tree({"a": "Text", "b": ["x"], "c": {"d": "Deep"}}, {}, marker=SYNC_MARKER)
+
+    assert result.data == {"a": f"{SYNC_MARKER}Text", "b": ["x"], "c": {"d": f"{SYNC_MARKER}Deep"}}
+    # A missing object is reported along with each of its leaves
+    assert result.filled == ["a", "b", "c", "c.d"]
+
+
+def test_kind_mismatches_are_replaced_from_the_baseline():
+    target = {"home": "flattened", "menu": {"open": {"nested": "Auf"}, "close": "Zu"}, "items": ["Eins"]}
+    result = sync_tree(BASE, target)
+
+    assert result.data["home"] == BASE["home"]
+    assert result.data["menu"] == {"open": "Open", "close": "Zu"}
+    # Lists are leaf values: a translated list is kept as it is
+    assert result.data["items"] == ["Eins"]
+    assert result.filled == ["home", "home.title", "home.subtitle", "home.count", "menu.open"]
+
+
+def test_target_is_not_modified():
+    target = {"menu": {"close": "Zu", "old": "Alt"}}
+    snapshot = json.dumps(target)
+    sync_tree(BASE, target)
+
+    assert json.dumps(target) == snapshot
+
+
+def test_second_run_is_a_no_op():
+    target = {"menu": {"close": "Zu", "old": "Alt"}, "home": {"title": "Start"}}
+    first = sync_tree(BASE, target, marker=SYNC_MARKER)
+    second = sync_tree(BASE, first.data, marker=SYNC_MARKER)
+
+    assert second.data == first.data
+    assert canonical_json(second.data) == canonical_json(first.data)
+    assert (second.filled, second.pruned, second.reordered) == ([], [], [])
@@ -0,0 +1,121 @@
+import random
+
+import pytest
+
+from i18n_translate import (
+    EchoBackend,
+    TranslationError,
+    plan_translations,
+    translate_missing,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff_sleep(monkeypatch):
+    # Backoff delays are scaled by random.uniform(); zero keeps retries instant
+    monkeypatch.setattr(random, "uniform", lambda a, b: 0.0)
+
+
+class SharedCodeBackend(EchoBackend):
+    """Maps every locale to one backend language, like zh-CN and zh-SG sharing "zh" """
+
+    def language_code(self, locale):
+        return locale.split("-")[0]
+
+
+class FlakyBackend(EchoBackend):
+    """Fails the first `failures` calls with `retryable` errors"""
+
+    def __init__(self, failures, retryable=True):
+        super().__init__()
+        self.failures = failures
+        self.retryable = retryable
+
+    async def translate(self, texts, target):
+        if self.failures:
+            self.failures -= 1
+            self.calls.append((target, 0))
+            raise TranslationError("rate limited", retryable=self.retryable)
+        return await super().translate(texts, target)
+
+
+SOURCE = {
+    "common": {"save": "Save", "cancel": "Cancel"},
+    "dialog": {"confirm": "Save", "title": "Settings"},
+}
+
+
+def test_identical_texts_are_translated_once_per_language():
+    targets = {"de-DE": {}, "fr-FR": {"common": {"cancel": "Annuler"}}}
+    backend = EchoBackend()
+    plan = plan_translations(SOURCE, targets, backend)
+
+    assert plan.missing == {"de-DE": 4, "fr-FR": 3}
+    assert plan.units[("de-DE", "Save")] == [("de-DE", ("common", "save")), ("de-DE", ("dialog", "confirm"))]
+    assert ("fr-FR", "Cancel") not in plan.units
+
+    stats = translate_missing(SOURCE, targets, backend, plan=plan)
+    assert stats.unique_texts == 5
+    assert stats.translated == 7
+    assert backend.calls == [("de-DE", 3), ("fr-FR", 2)]
+    assert targets["de-DE"]["dialog"]["confirm"] == "[de-DE] Save"
+    assert targets["fr-FR"]["common"] == {"cancel": "Annuler", "save": "[fr-FR] Save"}
+
+
+def test_locales_sharing_a_backend_language_share_requests():
+    targets = {"zh-CN": {}, "zh-TW": {}}
+    backend = SharedCodeBackend()
+    stats = translate_missing(SOURCE, targets, backend)
+
+    assert stats.unique_texts == 3
+    assert backend.calls == [("zh", 3)]
+    assert targets["zh-TW"]["common"]["save"] == "[zh] Save"
+
+
+def test_untranslatable_and_stale_values():
+    source = {"brand": "AGENTIF_UI", "count": "42", "title": "Settings"}
+    targets = {"de-DE": {"brand": "", "title": "Einstellungen"}}
+    plan = plan_translations(source, targets, EchoBackend(), stale={"de-DE": [("title",)]})
+
+    assert plan.copies == {"de-DE": [(("brand",), "AGENTIF_UI"), (("count",), "42")]}
+    assert list(plan.units) == [("de-DE", "Settings")]
+
+
+def test_texts_are_sent_in_batches_of_max_batch():
+    source = {f"key{i}": f"Text {i}" for i in range(7)}
+    backend = EchoBackend()
+    backend.max_batch = 3
+    stats = translate_missing(source, {"de-DE": {}, "fr-FR": {}}, backend, concurrency=2)
+
+    assert sorted(backend.calls) == [("de-DE", 1), ("de-DE", 3), ("de-DE", 3), ("fr-FR", 1), ("fr-FR", 3), ("fr-FR", 3)]
+    assert stats.requests == 6
+    assert stats.translated == 14
+
+
+def test_retryable_errors_are_retried():
+    backend = FlakyBackend(failures=2)
+    targets = {"de-DE": {}}
+    stats = translate_missing({"title": "Settings"}, targets, backend, retries=3)
+
+    assert stats.requests == 3
+    assert stats.errors == 0
+    assert targets["de-DE"]["title"] == "[de-DE] Settings"
+
+
+def test_exhausted_retries_fall_back_to_the_source_text():
+    backend = FlakyBackend(failures=5)
+    targets = {"de-DE": {}}
+    stats = translate_missing({"title": "Settings"}, targets, backend, retries=3)
+
+    assert stats.requests == 3
+    assert stats.errors == 1
+    assert stats.filled == []
+    assert targets["de-DE"]["title"] == "Settings"
+
+
+def test_permanent_errors_are_not_retried():
+    backend = FlakyBackend(failures=5, retryable=False)
+    stats = translate_missing({"title": "Settings"}, {"de-DE": {}}, backend, retries=3)
+
+    assert stats.requests == 1
+    assert stats.errors == 1
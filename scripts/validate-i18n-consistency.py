@@ -4,131 +4,89 @@ i18n translation file consistency validation script
 Ensures that all language translation files have the same structure and keys.
 """
 
-import json
 import os
 import sys
-import re
-from typing import Dict, Set, List, Any
-from pathlib import Path
+from typing import Dict, Optional
 
-def load_languages_from_ts(verbose: bool = True) -> List[str]:
-    """Load supported language list from lib/config/language-config.ts"""
-    # Script is in scripts/ directory, TS file path is relative to project root
-    project_root = Path(__file__).resolve().parent.parent
-    ts_file_path = project_root / "lib/config/language-config.ts"
+from i18n_catalog import (
+    CatalogError,
+    LocaleCatalog,
+    get_jobs_option,
+    get_model,
+    get_option,
+)
+from i18n_profile import get_profile_format, get_profiler, print_report
+from i18n_report import Finding, ReportWriter, get_report_writer
 
-    if not ts_file_path.exists():
-        print(f"❌ Language config file not found at: {ts_file_path}", file=sys.stderr)
-        return []
+# Base language for structure comparison
+BASE_LANG = 'zh-CN'
 
+def load_translation_files(jobs: int = 1, use_cache: bool = True) -> Dict[str, LocaleCatalog]:
+    """Load all translation files, flattening and diffing them in `jobs` processes"""
+    model = get_model(use_cache=use_cache)
+    
     try:
-        content = ts_file_path.read_text(encoding="utf-8")
-
-        # Find SUPPORTED_LANGUAGES object body (non-greedy match)
-        match = re.search(
-            r"export\s+const\s+SUPPORTED_LANGUAGES\s*=\s*{(.+?)}\s*as\s+const;",
-            content,
-            re.DOTALL,
-        )
-        if not match:
-            print("❌ Could not find SUPPORTED_LANGUAGES in the config file.", file=sys.stderr)
-            return []
-
-        obj_content = match.group(1)
-
-        # Match more general language codes (supporting en, zh-Hans, es-419, sr-Latn-RS, etc.)
-        lang_codes = re.findall(
-            r"\s*['\"]([a-z]{2,3}(?:-[A-Za-z0-9]{2,8})*)['\"]\s*:",
-            obj_content,
-        )
-
-        if lang_codes:
-            if verbose:
-                print(f"✅ Loaded {len(lang_codes)} languages: {', '.join(lang_codes)}")
-        else:
-            print("❌ No languages found in language-config.ts", file=sys.stderr)
-
-        return lang_codes
-
-    except Exception as e:
-        print(f"❌ Error reading or parsing {ts_file_path}: {e}", file=sys.stderr)
-        return []
-         
-def get_all_keys(obj: Any, prefix: str = "") -> Set[str]:
-    """Recursively get all key paths in a JSON object"""
-    keys = set()
-    
-    if isinstance(obj, dict):
-        for key, value in obj.items():
-            current_path = f"{prefix}.{key}" if prefix else key
-            keys.add(current_path)
-            keys.update(get_all_keys(value, current_path))
-    elif isinstance(obj, list):
-        for i, item in enumerate(obj):
-            keys.update(get_all_keys(item, f"{prefix}[{i}]"))
-    
-    return keys
-
-def load_translation_files() -> Dict[str, Dict]:
-    """Load all translation files"""
-    languages = load_languages_from_ts()
-    translations = {}
+        model.diff_against(BASE_LANG, jobs)
+    except CatalogError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
     
-    for lang in languages:
-        file_path = f"messages/{lang}.json"
-        if not os.path.exists(file_path):
-            print(f"❌ File not found: {file_path}")
-            sys.exit(1)
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                translations[lang] = json.load(f)
-            print(f"✅ Successfully loaded: {file_path}")
-        except json.JSONDecodeError as e:
-            print(f"❌ JSON format error in {file_path}: {e}")
-            sys.exit(1)
-        except Exception as e:
-            print(f"❌ Failed to load {file_path}: {e}")
-            sys.exit(1)
+    translations = {}
+    for catalog in model.catalogs():
+        translations[catalog.locale] = catalog
+        print(f"✅ Successfully loaded: {catalog.path}")
     
     return translations
 
-def validate_structure_consistency(translations: Dict[str, Dict]) -> bool:
+def record_key(
+    reporter: Optional[ReportWriter], lang: str, key: str, kind: str, message: str, catalog: LocaleCatalog
+) -> None:
+    """Add a key finding located in `catalog`'s file to the structured report"""
+    position = catalog.positions.get(key)
+    reporter.add(Finding(
+        lang, key, kind, message, catalog.path.as_posix(),
+        position.line if position else None, position.column if position else None,
+    ))
+
+def validate_structure_consistency(
+    translations: Dict[str, LocaleCatalog], jobs: int = 1, reporter: Optional[ReportWriter] = None
+) -> bool:
     """Validate structure consistency of all translation files"""
     print("\n🔍 Validating structure consistency...")
     
     # Get key sets for all languages
-    all_keys = {}
-    for lang, data in translations.items():
-        all_keys[lang] = get_all_keys(data)
-        print(f"  {lang}: {len(all_keys[lang])} keys")
+    for lang, catalog in translations.items():
+        print(f"  {lang}: {catalog.key_count()} keys")
     
     # Use zh-CN as the base language for comparison
-    base_lang = 'zh-CN'
-    base_keys = all_keys[base_lang]
+    base_catalog = translations[BASE_LANG]
+    diffs = get_model().diff_against(BASE_LANG, jobs)
     
     inconsistent = False
     
-    for lang in all_keys:
-        if lang == base_lang:
-            continue
-        
-        current_keys = all_keys[lang]
+    for lang, (missing_keys, extra_keys) in diffs.items():
+        current_catalog = translations[lang]
         
         # Check for missing keys
-        missing_keys = base_keys - current_keys
         if missing_keys:
             print(f"❌ {lang} missing keys ({len(missing_keys)} keys):")
-            for key in sorted(missing_keys):
-                print(f"    - {key}")
+            for key in missing_keys:
+                if reporter is not None:
+                    record_key(reporter, lang, key, "missing-key",
+                               f"{lang} is missing '{key}' (defined in {BASE_LANG})", base_catalog)
+                    continue
+                print(f"    - {key} ({base_catalog.path}:{base_catalog.line_of(key)})")
             inconsistent = True
         
         # Check for extra keys
-        extra_keys = current_keys - base_keys
         if extra_keys:
             print(f"❌ {lang} extra keys ({len(extra_keys)} keys):")
-            for key in sorted(extra_keys):
-                print(f"    + {key}")
+            for key in extra_keys:
+                if reporter is not None:
+                    record_key(reporter, lang, key, "extra-key",
+                               f"'{key}' in {lang} does not exist in {BASE_LANG}", current_catalog)
+                    continue
+                print(f"    + {key} ({current_catalog.path}:{current_catalog.line_of(key)})")
             inconsistent = True
         
         if not missing_keys and not extra_keys:
@@ -136,21 +94,29 @@ def validate_structure_consistency(translations: Dict[str, Dict]) -> bool:
     
     return not inconsistent
 
-def validate_file_consistency() -> bool:
+def validate_file_consistency(reporter: Optional[ReportWriter] = None) -> bool:
     """Validate file line count consistency"""
     print("\n📊 Validating file line consistency...")
     
-    languages = load_languages_from_ts()
+    model = get_model()
     line_counts = {}
     
-    for lang in languages:
-        file_path = f"messages/{lang}.json"
-        with open(file_path, 'r', encoding='utf-8') as f:
-            line_counts[lang] = len(f.readlines())
+    for catalog in model.catalogs():
+        lang = catalog.locale
+        line_counts[lang] = catalog.line_count
         print(f"  {lang}: {line_counts[lang]} lines")
     
     # Check if all files have the same line count
     unique_counts = set(line_counts.values())
+    if reporter is not None and len(unique_counts) > 1:
+        base_count = line_counts[BASE_LANG]
+        for catalog in model.catalogs():
+            if catalog.line_count != base_count:
+                reporter.add(Finding(
+                    catalog.locale, "", "line-count",
+                    f"{catalog.locale} has {catalog.line_count} lines, {BASE_LANG} has {base_count}",
+                    catalog.path.as_posix(), catalog.line_count, 1,
+                ))
     if len(unique_counts) == 1:
         print("✅ All files have consistent line counts")
         return True
@@ -158,23 +124,26 @@ def validate_file_consistency() -> bool:
         print("❌ File line counts are inconsistent")
         return False
 
-def validate_json_format(translations: Dict[str, Dict]) -> bool:
+def validate_json_format(translations: Dict[str, LocaleCatalog], reporter: Optional[ReportWriter] = None) -> bool:
     """Validate JSON format correctness"""
     print("\n🔧 Validating JSON format...")
     
-    for lang, data in translations.items():
+    for lang, catalog in translations.items():
         try:
-            # Try to re-serialize to validate format
-            json.dumps(data, ensure_ascii=False, indent=2)
+            # A summary only exists for content that parsed successfully (now or under the same hash)
+            catalog.summary
             print(f"✅ {lang} JSON format is valid")
-        except Exception as e:
+        except CatalogError as e:
             print(f"❌ {lang} JSON format error: {e}")
+            if reporter is not None:
+                reporter.add(Finding(lang, "", "invalid-json", str(e), catalog.path.as_posix()))
             return False
     
     return True
 
-def main():
-    """Main function"""
+def run_validation() -> int:
+    """Run every validation and print the overall result"""
+    profiler = get_profiler()
     print("🚀 Starting i18n translation file consistency validation...")
     
     # Check if in the correct directory
@@ -182,15 +151,30 @@ def main():
         print("❌ Messages directory not found, please run this script from project root")
         sys.exit(1)
     
+    jobs = get_jobs_option()
+    use_cache = "--no-cache" not in sys.argv
+    try:
+        reporter = get_report_writer("validate")
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    
     # Load translation files
-    translations = load_translation_files()
+    with profiler.phase("load"):
+        translations = load_translation_files(jobs, use_cache)
     
     # Run all validations
-    validations = [
-        validate_file_consistency(),
-        validate_json_format(translations),
-        validate_structure_consistency(translations)
-    ]
+    validations = []
+    with profiler.phase("lines"):
+        validations.append(validate_file_consistency(reporter))
+    with profiler.phase("format"):
+        validations.append(validate_json_format(translations, reporter))
+    with profiler.phase("structure"):
+        validations.append(validate_structure_consistency(translations, jobs, reporter))
+    
+    if reporter is not None:
+        reporter.close(passed=all(validations))
+        print(f"📝 {reporter.count} findings written to {reporter.stream.name}")
     
     # Output result
     print("\n" + "="*50)
@@ -201,5 +185,23 @@ def main():
         print("❌ Validation failed! Please fix the issues above")
         return 1
 
+def main():
+    """Main function"""
+    try:
+        profile_format = get_profile_format()
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    if profile_format is None:
+        return run_validation()
+    
+    # --profile[=json] [--cprofile FILE]: timings go to stderr
+    profiler = get_profiler()
+    profiler.start(cprofile_path=get_option("--cprofile"))
+    try:
+        return run_validation()
+    finally:
+        print_report(profiler.stop(), profile_format)
+
 if __name__ == "__main__":
     sys.exit(main()) 
\ No newline at end of file